@@ -0,0 +1,9 @@
+# coding: utf-8
+"""
+Ad hoc performance benchmarks for ofxtools.
+
+These aren't unit tests and aren't collected by the test runner.  Run each
+module directly from the root of the source tree, e.g.
+
+    python -m benchmarks.bench_parser
+"""
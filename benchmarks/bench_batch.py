@@ -0,0 +1,39 @@
+# coding: utf-8
+"""
+Benchmark ``ofxtools.batch.parse_many()`` - parsing & converting a directory
+of OFX files in parallel vs. one at a time.
+
+    python -m benchmarks.bench_batch
+"""
+
+# stdlib imports
+import os
+import tempfile
+
+# local imports
+from ofxtools.batch import parse_many
+from benchmarks.common import scaled_invstmtrs, bench
+
+
+def main(files: int = 64, copies: int = 50) -> None:
+    markup = scaled_invstmtrs(copies)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = []
+        for n in range(files):
+            path = os.path.join(tmpdir, f"{n}.ofx")
+            with open(path, "wb") as f:
+                f.write(markup)
+            paths.append(path)
+
+        label = f"parse_many() {files} x invstmtrs.ofx x {copies}"
+        bench(f"{label}, workers=1", lambda: parse_many(paths, workers=1), number=1)
+        workers = max(2, os.cpu_count() or 1)
+        bench(
+            f"{label}, workers={workers}",
+            lambda: parse_many(paths, workers=workers),
+            number=1,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# coding: utf-8
+"""
+Benchmark ``OFXTree.parse(cache=...)`` on a cache hit against parsing &
+converting the OFX from scratch.
+
+    python -m benchmarks.bench_cache
+"""
+
+# stdlib imports
+import tempfile
+from io import BytesIO
+
+# local imports
+from ofxtools.Parser import OFXTree
+from ofxtools.cache import DiskCache
+from benchmarks.common import scaled_invstmtrs, bench
+
+
+def main(copies: int = 500) -> None:
+    markup = scaled_invstmtrs(copies)
+
+    def parse(cache=None):
+        tree = OFXTree()
+        tree.parse(BytesIO(markup), cache=cache)
+        return tree.convert()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = DiskCache(tmpdir)
+        parse(cache)  # Prime the cache
+
+        bench(f"parse() + convert() invstmtrs.ofx x {copies}", parse, number=3)
+        bench("parse(cache=...) + convert(), cache hit", lambda: parse(cache))
+        print(cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# coding: utf-8
+"""
+Benchmark columnar export of transactions - ``TranList.to_columns()`` vs.
+``TranList.columns_from_etree()``, which skips instantiating the transactions.
+
+    python -m benchmarks.bench_columns
+"""
+
+# stdlib imports
+from io import BytesIO
+
+# local imports
+from ofxtools.Parser import OFXTree
+from ofxtools.models import INVTRANLIST
+from benchmarks.common import scaled_invstmtrs, bench
+
+FIELDS = ["dttrade", "fitid", "total", "units", "unitprice"]
+
+
+def main(copies: int = 500) -> None:
+    tree = OFXTree()
+    tree.parse(BytesIO(scaled_invstmtrs(copies)))
+    invtranlist = tree.find(".//INVTRANLIST")
+    label = f"{len(invtranlist)} transactions"
+
+    bench(
+        f"_convert() + to_columns() {label}",
+        lambda: INVTRANLIST._convert(invtranlist).to_columns(FIELDS, scale=2),
+        number=3,
+    )
+
+    converted = INVTRANLIST._convert(invtranlist)
+    bench(
+        f"to_columns() {label}, already converted",
+        lambda: converted.to_columns(FIELDS, scale=2),
+        number=3,
+    )
+
+    bench(
+        f"columns_from_etree() {label}",
+        lambda: INVTRANLIST.columns_from_etree(invtranlist, FIELDS, scale=2),
+        number=3,
+    )
+
+
+if __name__ == "__main__":
+    main()
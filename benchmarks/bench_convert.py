@@ -0,0 +1,46 @@
+# coding: utf-8
+"""
+Benchmark ``OFXTree.convert()`` - ``ElementTree.Element`` tree to
+``ofxtools.models`` instances.
+
+    python -m benchmarks.bench_convert
+"""
+
+# stdlib imports
+from io import BytesIO
+
+# local imports
+from ofxtools.Parser import OFXTree
+from ofxtools.models import INVTRANLIST
+from benchmarks.common import scaled_invstmtrs, bench
+
+
+def main(copies: int = 500) -> None:
+    tree = OFXTree()
+    tree.parse(BytesIO(scaled_invstmtrs(copies)))
+    bench(f"OFXTree.convert() invstmtrs.ofx x {copies}", tree.convert, number=3)
+    bench(
+        f"OFXTree.convert(validate=False) x {copies}",
+        lambda: tree.convert(validate=False),
+        number=3,
+    )
+
+    #  Lazy conversion, touching only the signon, account & balances
+    def convert_lazy():
+        ofx = tree.convert(lazy=True)
+        stmt = ofx.statements[0]
+        return ofx.signon.dtserver, stmt.account.acctid, stmt.balances.availcash
+
+    bench(f"OFXTree.convert(lazy=True) x {copies}, header only", convert_lazy)
+
+    #  Micro-benchmark: Aggregate._convert() of the transaction list alone
+    invtranlist = tree.find(".//INVTRANLIST")
+    bench(
+        f"INVTRANLIST._convert() {len(invtranlist)} children",
+        lambda: INVTRANLIST._convert(invtranlist),
+        number=3,
+    )
+
+
+if __name__ == "__main__":
+    main()
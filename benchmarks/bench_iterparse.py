@@ -0,0 +1,38 @@
+# coding: utf-8
+"""
+Compare peak memory of ``OFXTree.parse()`` + ``convert()`` against
+``OFXTree.iterparse()``.
+
+    python -m benchmarks.bench_iterparse
+"""
+
+# stdlib imports
+from io import BytesIO
+
+# local imports
+from ofxtools.Parser import OFXTree
+from benchmarks.common import scaled_invstmtrs, to_sgml, peak
+
+TAGS = ("BUYSTOCK", "INVBANKTRAN")
+
+
+def main(copies: int = 1000) -> None:
+    markup = to_sgml(scaled_invstmtrs(copies))
+    print(f"invstmtrs.ofx x {copies} (OFXv1, {len(markup) / 1e6:.1f} MB)")
+
+    def convert():
+        tree = OFXTree()
+        tree.parse(BytesIO(markup))
+        ofx = tree.convert()
+        assert len(ofx.statements[0].transactions) == 2 * copies
+
+    def iterparse():
+        count = sum(1 for tx in OFXTree().iterparse(BytesIO(markup), tags=TAGS))
+        assert count == 2 * copies
+
+    peak("OFXTree.parse() + convert()", convert)
+    peak(f"OFXTree.iterparse(tags={TAGS})", iterparse)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# coding: utf-8
+"""
+Benchmark memory held by converted ``ofxtools.models`` instances.
+
+    python -m benchmarks.bench_memory
+"""
+
+# stdlib imports
+import gc
+import tracemalloc
+from io import BytesIO
+from typing import Callable
+
+# local imports
+from ofxtools.Parser import OFXTree
+from ofxtools.models import STMTTRN
+from benchmarks.common import scaled_invstmtrs
+
+
+def retained(label: str, func: Callable, count: int) -> int:
+    """Print & return memory (in bytes) per item still held by the result of ``func()``"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()  # noqa: F841
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    print(f"{label:<50} {size / count:>10.0f} B/item")
+    return size
+
+
+def main(count: int = 20000, copies: int = 1000) -> None:
+    retained(
+        f"STMTTRN() x {count}",
+        lambda: [
+            STMTTRN(
+                trntype="DEBIT",
+                dtposted="20231229120000.000[-5:EST]",
+                trnamt="-12.34",
+                fitid=f"{n:08d}",
+                name="Coffee",
+            )
+            for n in range(count)
+        ],
+        count,
+    )
+
+    tree = OFXTree()
+    tree.parse(BytesIO(scaled_invstmtrs(copies)))
+    txcount = len(tree.find(".//INVTRANLIST")) - 2  # DTSTART, DTEND
+    retained(f"OFXTree.convert() invstmtrs.ofx x {copies}", tree.convert, txcount)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# coding: utf-8
+"""
+Benchmark ``OFXTree.parse(memory_map=True)`` of files on disk against reading
+them into memory, for OFXv2 (parsed by expat) and OFXv1 (by ``TreeBuilder``),
+and reading the OFX header alone from a memory-mapped file.
+
+Memory-mapped pages aren't Python allocations, so peak memory as measured here
+is that of the Element tree plus whatever copies of the markup are made.
+
+    python -m benchmarks.bench_mmap
+"""
+
+# stdlib imports
+import mmap
+import os
+import tempfile
+
+# local imports
+from ofxtools.Parser import OFXTree
+from ofxtools.header import read_header
+from benchmarks.common import scaled_invstmtrs, to_sgml, bench, peak
+
+
+def read_header_mmap(path: str) -> None:
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            read_header(mapping)
+
+
+def main(copies: int = 1000) -> None:
+    markup = scaled_invstmtrs(copies)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for label, data in (("OFXv2", markup), ("OFXv1", to_sgml(markup))):
+            path = os.path.join(tmpdir, f"{label}.ofx")
+            with open(path, "wb") as f:
+                f.write(data)
+            print(f"{label} invstmtrs.ofx x {copies}: {len(data) / 1e6:.1f} MB")
+
+            def parse(memory_map=False):
+                return OFXTree().parse(path, memory_map=memory_map)
+
+            bench("parse()", parse, number=3)
+            bench("parse(memory_map=True)", lambda: parse(True), number=3)
+            peak("parse()", parse)
+            peak("parse(memory_map=True)", lambda: parse(True))
+            bench("read_header() of mmap", lambda: read_header_mmap(path), number=1000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# coding: utf-8
+"""
+Compare ``OFXTree.parse()`` + ``convert()`` against ``OFXTree.parse_models()``,
+which skips the intermediate tree of ``ElementTree.Element``.
+
+    python -m benchmarks.bench_models
+"""
+
+# stdlib imports
+from io import BytesIO
+
+# local imports
+from ofxtools.Parser import OFXTree
+from benchmarks.common import scaled_invstmtrs, to_sgml, bench, peak
+
+
+def main(copies: int = 500) -> None:
+    markup = scaled_invstmtrs(copies)
+    for version, data in (("OFXv2", markup), ("OFXv1", to_sgml(markup))):
+        print(f"invstmtrs.ofx x {copies} ({version}, {len(data) / 1e6:.1f} MB)")
+
+        def convert():
+            tree = OFXTree()
+            tree.parse(BytesIO(data))
+            return tree.convert()
+
+        def parse_models():
+            return OFXTree().parse_models(BytesIO(data))
+
+        def parse_models_unvalidated():
+            return OFXTree().parse_models(BytesIO(data), validate=False)
+
+        assert repr(convert()) == repr(parse_models())
+        bench("OFXTree.parse() + convert()", convert, repeat=5)
+        bench("OFXTree.parse_models()", parse_models, repeat=5)
+        bench(
+            "OFXTree.parse_models(validate=False)", parse_models_unvalidated, repeat=5
+        )
+        peak("OFXTree.parse() + convert()", convert)
+        peak("OFXTree.parse_models()", parse_models)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# coding: utf-8
+"""
+Benchmark ``ofxtools.Parser`` - OFX markup to ``ElementTree.Element`` tree.
+
+    python -m benchmarks.bench_parser
+"""
+
+# stdlib imports
+from io import BytesIO
+
+# local imports
+from ofxtools.Parser import OFXTree, TreeBuilder
+from benchmarks.common import scaled_invstmtrs, bench
+
+
+def main(copies: int = 2000) -> None:
+    markup = scaled_invstmtrs(copies)
+    print(f"invstmtrs.ofx x {copies} ({len(markup) / 1e6:.1f} MB)")
+
+    header, message = OFXTree._read(BytesIO(markup))
+
+    def regex():
+        builder = TreeBuilder()
+        builder.feed(message)
+        builder.close()
+
+    def expat():
+        assert OFXTree._parse_xml(message) is not None
+
+    t_regex = bench("TreeBuilder (regex)", regex)
+    t_expat = bench("OFXTree._parse_xml (expat)", expat)
+    print(f"speedup: {t_regex / t_expat:.1f}x")
+
+    # Entity references, e.g. in NAME/MEMO, are escaped again after expat
+    message = message.replace("Your check", "Smith &amp; Sons check")
+    t_regex = bench("TreeBuilder (regex), with entities", regex)
+    t_expat = bench("OFXTree._parse_xml (expat), with entities", expat)
+    print(f"speedup: {t_regex / t_expat:.1f}x")
+
+    bench("OFXTree.parse() (header + body)", lambda: OFXTree().parse(BytesIO(markup)))
+
+
+if __name__ == "__main__":
+    main()
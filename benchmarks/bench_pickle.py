@@ -0,0 +1,38 @@
+# coding: utf-8
+"""
+Benchmark pickling converted ``ofxtools.models`` - e.g. to send them between
+processes, or to cache them - against parsing & converting the OFX again.
+
+    python -m benchmarks.bench_pickle
+"""
+
+# stdlib imports
+import pickle
+from io import BytesIO
+
+# local imports
+from ofxtools.Parser import OFXTree
+from benchmarks.common import scaled_invstmtrs, bench
+
+
+def main(copies: int = 500) -> None:
+    markup = scaled_invstmtrs(copies)
+
+    def reparse():
+        tree = OFXTree()
+        tree.parse(BytesIO(markup))
+        return tree.convert()
+
+    ofx = reparse()
+    protocol = pickle.HIGHEST_PROTOCOL
+    pickled = pickle.dumps(ofx, protocol=protocol)
+    print(f"{'OFX markup size':<50} {len(markup) / 1e3:>10.1f} kB")
+    print(f"{'Pickle size':<50} {len(pickled) / 1e3:>10.1f} kB")
+
+    bench(f"parse() + convert() invstmtrs.ofx x {copies}", reparse, number=3)
+    bench("pickle.dumps()", lambda: pickle.dumps(ofx, protocol=protocol))
+    bench("pickle.loads()", lambda: pickle.loads(pickled))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# coding: utf-8
+"""
+Benchmark ``OFXTree.parse(include=...)`` against parsing the whole document,
+for OFXv2 (which is otherwise parsed by expat) and OFXv1 (by ``TreeBuilder``).
+
+    python -m benchmarks.bench_select
+"""
+
+# stdlib imports
+from io import BytesIO
+
+# local imports
+from ofxtools.Parser import OFXTree
+from benchmarks.common import scaled_invstmtrs, to_sgml, bench, peak
+
+SELECTIONS = {
+    "signon + seclist": ["OFX/SIGNONMSGSRSV1", "OFX/SECLISTMSGSRSV1"],
+    "invbal": ["OFX/*/*/INVSTMTRS/INVBAL"],
+}
+
+
+def main(copies: int = 1000) -> None:
+    markup = scaled_invstmtrs(copies)
+    for label, data in (("OFXv2", markup), ("OFXv1", to_sgml(markup))):
+        print(f"{label} invstmtrs.ofx x {copies}")
+
+        def parse(**kwargs):
+            return OFXTree().parse(BytesIO(data), **kwargs)
+
+        bench("parse()", parse, number=3)
+        peak("parse()", parse)
+        for name, include in SELECTIONS.items():
+            bench(f"parse(include=...) {name}", lambda: parse(include=include))
+            peak(f"parse(include=...) {name}", lambda: parse(include=include))
+
+
+if __name__ == "__main__":
+    main()
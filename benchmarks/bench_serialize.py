@@ -0,0 +1,50 @@
+# coding: utf-8
+"""
+Benchmark serializing ``ofxtools.models`` - ``to_etree()`` + ``ET.tostring()``
+against ``Aggregate.write()``, which skips the intermediate Element tree.
+
+    python -m benchmarks.bench_serialize
+"""
+
+# stdlib imports
+import os
+import xml.etree.ElementTree as ET
+from io import BytesIO
+
+# local imports
+from ofxtools.Parser import OFXTree
+from ofxtools.utils import indent
+from benchmarks.common import scaled_invstmtrs, bench, peak
+
+
+def main(copies: int = 500) -> None:
+    tree = OFXTree()
+    tree.parse(BytesIO(scaled_invstmtrs(copies)))
+    ofx = tree.convert()
+    print(f"invstmtrs.ofx x {copies}")
+
+    for prettyprint in (False, True):
+
+        def tostring():
+            root = ofx.to_etree()
+            if prettyprint:
+                indent(root)
+            return ET.tostring(root, encoding="utf_8", method="html")
+
+        def write():
+            ofx.write(devnull, prettyprint=prettyprint)
+
+        with open(os.devnull, "wb") as devnull:
+            output = BytesIO()
+            ofx.write(output, prettyprint=prettyprint)
+            assert output.getvalue() == tostring()
+
+            label = " (prettyprint)" if prettyprint else ""
+            bench(f"to_etree() + ET.tostring(){label}", tostring, number=3)
+            bench(f"write(){label}", write, number=3)
+            peak(f"to_etree() + ET.tostring(){label}", tostring)
+            peak(f"write(){label}", write)
+
+
+if __name__ == "__main__":
+    main()
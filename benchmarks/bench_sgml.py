@@ -0,0 +1,79 @@
+# coding: utf-8
+"""
+Benchmark serializing Element trees of 10k & 100k Elements with
+``utils.write_elements()`` / ``tostring_unclosed_elements()``, against
+``ET.tostring(method="html")`` and the former recursive implementation of
+``tostring_unclosed_elements()``, whose ``bytes`` concatenation made it
+quadratic in the number of children of an Element.
+
+    python -m benchmarks.bench_sgml
+"""
+
+# stdlib imports
+import os
+import xml.etree.ElementTree as ET
+
+# local imports
+from ofxtools.utils import indent, tostring_unclosed_elements, write_elements
+from benchmarks.common import bench
+
+
+def tostring_recursive(elem: ET.Element) -> bytes:
+    """``utils.tostring_unclosed_elements()`` as it was, for comparison"""
+    if len(elem) == 0:
+        text = "<{}>{}{}".format(elem.tag, elem.text or "", elem.tail or "")
+        output = bytes(text, "utf_8")
+    else:
+        output = bytes("<{}>{}".format(elem.tag, elem.tail or ""), "utf_8")
+        for child in elem:
+            output += tostring_recursive(child)
+        output += bytes("</{}>{}".format(elem.tag, elem.tail or ""), "utf_8")
+    return output
+
+
+def make_tree(size: int) -> ET.Element:
+    """STMTRS-like tree of ``size`` Elements - transactions of 5 elements apiece"""
+    root = ET.Element("OFX")
+    tranlist = ET.SubElement(ET.SubElement(root, "STMTRS"), "BANKTRANLIST")
+    for n in range(size // 6):
+        stmttrn = ET.SubElement(tranlist, "STMTTRN")
+        ET.SubElement(stmttrn, "TRNTYPE").text = "DEBIT"
+        ET.SubElement(stmttrn, "DTPOSTED").text = "20200101120000.000[+0:UTC]"
+        ET.SubElement(stmttrn, "TRNAMT").text = "-123.45"
+        ET.SubElement(stmttrn, "FITID").text = str(n)
+        ET.SubElement(stmttrn, "NAME").text = "Payee & Co"
+    indent(root)
+    return root
+
+
+def main() -> None:
+    with open(os.devnull, "wb") as devnull:
+        for size in (10000, 100000):
+            root = make_tree(size)
+            print(f"{len(list(root.iter()))} Elements")
+            bench(
+                "ET.tostring(method='html')",
+                lambda: ET.tostring(root, encoding="utf_8", method="html"),
+                number=3,
+            )
+            bench("write_elements()", lambda: write_elements(root, devnull), number=3)
+            bench(
+                "write_elements(close_elements=False)",
+                lambda: write_elements(root, devnull, close_elements=False),
+                number=3,
+            )
+            bench(
+                "tostring_unclosed_elements()",
+                lambda: tostring_unclosed_elements(root),
+                number=3,
+            )
+            bench(
+                "tostring_unclosed_elements(), recursive (former)",
+                lambda: tostring_recursive(root),
+                number=1,
+                repeat=1,
+            )
+
+
+if __name__ == "__main__":
+    main()
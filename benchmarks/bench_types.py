@@ -0,0 +1,96 @@
+# coding: utf-8
+"""
+Benchmark type conversion of OFX text by ``ofxtools.Types`` Elements.
+
+    python -m benchmarks.bench_types
+"""
+
+# local imports
+from ofxtools.Types import DateTime, Time, OneOf
+from ofxtools.models.i18n import CURRENCY_CODES
+from benchmarks.common import bench
+
+#  A statement's worth of timestamps - thousands of values, few distinct
+DATETIMES = [f"202312{day:02d}120000.000[-5:EST]" for day in range(1, 29)] * 200
+
+#  Formats given by the OFX spec, plus quirks handled only by the regex
+DATETIME_FORMATS = [
+    "20231229",
+    "20231229120000",
+    "20231229120000.000",
+    "20231229120000.000[-5:EST]",
+    "20231229120000[-5:EST]",
+    "20231229120000.000[-:EST]",
+]
+TIME_FORMATS = ["120000", "120000.000", "120000.000[-5:EST]"]
+
+
+class RegexDateTime(DateTime):
+    """``DateTime`` without the fixed-width fast path"""
+
+    def _parse_fixed(self, value):
+        return None
+
+
+class RegexTime(Time):
+    """``Time`` without the fixed-width fast path"""
+
+    def _parse_fixed(self, value):
+        return None
+
+
+def main() -> None:
+    #  ``_parse_str()`` bypasses the cache
+    for fast, slow, formats in (
+        (DateTime(), RegexDateTime(), DATETIME_FORMATS),
+        (Time(), RegexTime(), TIME_FORMATS),
+    ):
+        for text in formats:
+            for converter in (fast, slow):
+
+                def parse_all():
+                    parse = converter._parse_str
+                    for _ in range(1000):
+                        parse(text)
+
+                bench(f"{type(converter).__name__} {text} x 1000", parse_all)
+
+    #  Validation against a long code list; the tuple scan is the old behavior
+    currency = OneOf(*CURRENCY_CODES)
+    last = CURRENCY_CODES[-1]
+
+    def oneof_all():
+        is_valid = currency.is_valid
+        for _ in range(1000):
+            is_valid(last)
+
+    def scan_all():
+        valid = currency.valid
+        for _ in range(1000):
+            last in valid
+
+    bench(f"OneOf(*CURRENCY_CODES) {last!r} x 1000 hashed", oneof_all)
+    bench(f"OneOf(*CURRENCY_CODES) {last!r} x 1000 scanned", scan_all)
+
+    converter = DateTime()
+    cache = DateTime.cache
+    maxsize = cache.maxsize
+
+    def convert_all():
+        for text in DATETIMES:
+            converter.convert(text)
+
+    try:
+        cache.maxsize = 0
+        bench(f"DateTime.convert() x {len(DATETIMES)} uncached", convert_all)
+        cache.maxsize = maxsize
+        cache.clear()
+        bench(f"DateTime.convert() x {len(DATETIMES)} cached", convert_all)
+        print(cache.info())
+    finally:
+        cache.maxsize = maxsize
+        cache.clear()
+
+
+if __name__ == "__main__":
+    main()
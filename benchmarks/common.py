@@ -0,0 +1,77 @@
+# coding: utf-8
+"""Synthetic test data & timing utilities shared by the benchmarks"""
+
+# stdlib imports
+import re
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+DATADIR = Path(__file__).resolve().parent.parent / "tests" / "data"
+
+#  Closing tags of data-bearing elements, i.e. those following text data
+CLOSETAG_REGEX = re.compile(r"(?<=[^>\s])</[A-Z0-9.]+>")
+
+V1_HEADER = (
+    "OFXHEADER:100\r\n"
+    "DATA:OFXSGML\r\n"
+    "VERSION:102\r\n"
+    "SECURITY:NONE\r\n"
+    "ENCODING:USASCII\r\n"
+    "CHARSET:NONE\r\n"
+    "COMPRESSION:NONE\r\n"
+    "OLDFILEUID:NONE\r\n"
+    "NEWFILEUID:NONE\r\n"
+    "\r\n"
+)
+
+
+def scaled_ofx(filename: str, tranlist: str, copies: int) -> bytes:
+    """
+    Read an OFXv2 test file from ``tests/data``, and repeat the transactions
+    contained in the given *TRANLIST ``copies`` times.
+    """
+    markup = (DATADIR / filename).read_text()
+    start = markup.index("</DTEND>", markup.index(f"<{tranlist}>")) + len("</DTEND>")
+    end = markup.index(f"</{tranlist}>", start)
+    return (markup[:start] + markup[start:end] * copies + markup[end:]).encode()
+
+
+def scaled_invstmtrs(copies: int) -> bytes:
+    """``tests/data/invstmtrs.ofx`` with INVTRANLIST contents repeated"""
+    return scaled_ofx("invstmtrs.ofx", "INVTRANLIST", copies)
+
+
+def scaled_stmtrs(copies: int) -> bytes:
+    """``tests/data/stmtrs.ofx`` with BANKTRANLIST contents repeated"""
+    return scaled_ofx("stmtrs.ofx", "BANKTRANLIST", copies)
+
+
+def to_sgml(markup: bytes) -> bytes:
+    """
+    Rewrite OFXv2 (XML) markup as OFXv1 (SGML) - swap out the header, and
+    drop the optional closing tags of data-bearing elements.
+    """
+    body = markup.decode()
+    body = body[body.index("<OFX>") :]
+    return (V1_HEADER + CLOSETAG_REGEX.sub("", body)).encode()
+
+
+def bench(label: str, func: Callable, number: int = 5, repeat: int = 3) -> float:
+    """Print & return the best time per call (in seconds) of ``func()``"""
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print(f"{label:<50} {best * 1000:>10.2f} ms")
+    return best
+
+
+def peak(label: str, func: Callable) -> int:
+    """Print & return peak memory (in bytes) allocated while calling ``func()``"""
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    print(f"{label:<50} {peak / 1e6:>10.1f} MB")
+    return peak
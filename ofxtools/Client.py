@@ -51,7 +51,6 @@ import logging
 import datetime
 import http.cookiejar
 import uuid
-import xml.etree.ElementTree as ET
 import urllib.request as urllib_request
 import socket
 from io import BytesIO
@@ -122,7 +121,7 @@ from ofxtools.models.email import EMAILMSGSET
 from ofxtools.models.tax1099 import TAX1099MSGSET
 from ofxtools.models.tax1099 import TAX1099RQ, TAX1099TRNRQ, TAX1099MSGSRQV1
 from ofxtools.utils import classproperty, UTC
-from ofxtools import utils, config
+from ofxtools import config
 from ofxtools.Parser import OFXTree
 
 
@@ -946,23 +945,15 @@ class OFXClient:
             "utf_8",
         )
 
-        tree = ofx.to_etree()
-        if prettyprint:
-            utils.indent(tree)
-
         # Some servers choke on OFXv1 requests including ending tags for
         # elements (which are optional per the spec).
-        if close_elements is False:
-            if version >= 200:
-                raise ValueError(
-                    f"OFX version {version} requires ending tags for elements"
-                )
-            body = utils.tostring_unclosed_elements(tree)
-        else:
-            # ``method="html"`` skips the initial XML declaration
-            body = ET.tostring(tree, encoding="utf_8", method="html")
+        if close_elements is False and version >= 200:
+            raise ValueError(f"OFX version {version} requires ending tags for elements")
 
-        return header + body
+        output = BytesIO(header)
+        output.seek(0, 2)
+        ofx.write(output, prettyprint=prettyprint, close_elements=close_elements)
+        return output.getvalue()
 
 
 @singledispatch
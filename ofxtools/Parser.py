@@ -15,7 +15,9 @@ Notwithstanding the fact that `ofxtools.TreeBuilder` subclasses the excellent
 methods, the logic is completely different - less efficient and far slower.
 
 If we didn't need to parse OFXv1 (SGML), we'd do better to skip it and
-just feed plain XML to `ElementTree`.
+just feed plain XML to `ElementTree`.  So that's what we do for OFXv2 -
+`OFXTree.parse()` first tries the C-accelerated expat parser, only falling
+back to `TreeBuilder` if the message body turns out not to be well-formed XML.
 
 The implementation employs re.finditer() and Perl extended regular expressions:
 https://docs.python.org/3/howto/regex.html#non-capturing-and-named-groups
@@ -25,24 +27,50 @@ https://stackoverflow.com/questions/1732348/regex-match-open-tags-except-xhtml-s
 """
 
 
-__all__ = ["OFXTree", "TreeBuilder", "ParseError"]
+__all__ = ["OFXTree", "TreeBuilder", "IterBuilder", "ModelBuilder", "ParseError"]
 
 
 # stdlib imports
 import re
+import codecs
+import contextlib
+import functools
+import itertools
+import mmap
+from io import BytesIO
 import xml.etree.ElementTree as ET
-from typing import Tuple, Optional
+from xml.sax import saxutils
+from typing import (
+    Tuple,
+    Optional,
+    Union,
+    Iterator,
+    Iterable,
+    BinaryIO,
+    List,
+    Type,
+    Callable,
+    Dict,
+    Any,
+    Literal,
+    overload,
+)
 import logging
 
 
 # local imports
-from ofxtools.header import parse_header, OFXHeaderType
-from ofxtools.models.base import Aggregate
+from ofxtools.header import parse_header, read_header, OFXHeaderType, OFXHeaderV2
+from ofxtools.cache import CacheEntry, DiskCache
+from ofxtools.models.base import Aggregate, OFXSpecError
 
 
 logger = logging.getLogger(__name__)
 
 
+#  ``OFXTree._parse_xml()`` feeds bytes-like markup to expat in chunks of this size
+XML_CHUNKSIZE = 1 << 16
+
+
 class ParseError(SyntaxError):
     """Exception raised by parsing errors in this module"""
 
@@ -68,40 +96,356 @@ class OFXTree(ET.ElementTree):
     the root node of the hierarchy.
     """
 
-    def parse(self, source, parser=None) -> ET.Element:
+    #  OFX header of the source last parsed
+    header: OFXHeaderType
+    #  Converted models loaded by ``parse()`` from a cache (cf. ``_parse_cached()``)
+    _converted: Optional[Aggregate] = None
+    #  Backs the ``_root`` property
+    __root: Optional[ET.Element]
+
+    @property
+    def _root(self) -> Optional[ET.Element]:
+        """
+        Root of the Element tree, as per ElementTree.ElementTree - except that
+        after loading converted models from a cache, it's regenerated from them
+        upon first access.
+        """
+        root = self.__root
+        if root is None and self._converted is not None:
+            root = self.__root = self._converted.to_etree()
+        return root
+
+    @_root.setter
+    def _root(self, root: Optional[ET.Element]) -> None:
+        self.__root = root
+        self._converted = None
+
+    def parse(
+        self,
+        source,
+        parser=None,
+        chunksize: Optional[int] = None,
+        cache: Optional[DiskCache] = None,
+        memory_map: bool = False,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> ET.Element:
         """
         Deserialize OFX document into tree of `ElementTree.Element` instances.
 
         *source* is a file name or file object, *parser* is an optional parser
         instance that defaults to `ofxtools.Parser.TreeBuilder`.
 
+        If no parser is given and the OFX header declares OFXv2, the message
+        body is first handed to the expat XML parser (see ``_parse_xml()``);
+        `TreeBuilder` is used only if that fails.
+
+        If *chunksize* is given, the message body is instead read from source
+        and fed to the parser in chunks of that many bytes, rather than all at
+        once; memory use is then bounded by the size of the Element tree rather
+        than that of the document.  Source needn't be seekable in this case.
+
+        If a *cache* (e.g. ``ofxtools.cache.DiskCache``) is given, look up the
+        converted models of the source in it (or else parse & convert, and
+        cache the results), to be returned by ``convert()``.  On a cache hit,
+        nothing is parsed, and the Element tree returned is regenerated from
+        the cached models; cf. ``_parse_cached()``.  The cache is keyed on the
+        raw OFX, so it can't be combined with *parser* (whose output it doesn't
+        know about), nor with *memory_map* (since source is read in full anyway).
+
+        If *memory_map* is true, source (a file name, or a file object on disk)
+        is memory-mapped and parsed in place, rather than read into memory;
+        cf. ``_parse_mmap()``.  It can't be combined with *chunksize*.
+
+        If *include* and/or *exclude* are given, only the selected parts of the
+        document are built into the tree, e.g. ``include=["OFX/SECLISTMSGSRSV1"]``;
+        cf. `TreeBuilder`.  Converting the result generally requires
+        ``convert(validate=False)``, since it'll be missing required Elements.
+        These can't be combined with *parser* (pass them to the parser instead)
+        or with *cache*.
+
         Overrides ElementTree.ElementTree.parse().
         """
         logger.info(f"Parsing OFX from {source}")
+        if memory_map and chunksize is not None:
+            raise ValueError("Can't combine memory_map with chunksize")
+
+        # Keyword args for the default `TreeBuilder`
+        selection = {}
+        if include is not None:
+            selection["include"] = include
+        if exclude is not None:
+            selection["exclude"] = exclude
+        if selection and parser is not None:
+            raise ValueError("Pass include/exclude to the parser, not parse()")
+        if cache is not None:
+            if selection:
+                raise ValueError("Can't cache partially parsed OFX")
+            if parser is not None:
+                raise ValueError("Can't cache OFX parsed by a custom parser")
+            if memory_map:
+                raise ValueError("Can't combine memory_map with cache")
+            self._parse_cached(source, chunksize, cache)
+        else:
+            if chunksize is not None:
+                root = self._parse_chunks(source, parser, chunksize, **selection)
+            elif memory_map:
+                root = self._parse_mmap(source, parser, **selection)
+            else:
+                root = self._parse_message(source, parser, **selection)
+
+            # Follow ElementTree API and stash as self._root (so all normal
+            # ElementTree methods e.g. find() work normally on our subclass).
+            self._root = root
+            logger.debug(f"Parsed Element tree root: {self._root}")
+
+        # On a cache hit, this regenerates the Element tree
+        tree = self._root
+        assert tree is not None
+        return tree
+
+    def _parse_cached(self, source, chunksize: Optional[int], cache: DiskCache) -> None:
+        """
+        Read all of source, and look up its header & converted models in cache.
+
+        On a hit, skip parsing altogether; the Element tree is regenerated from
+        the cached models if & when it's accessed (e.g. by ``getroot()``).  On a
+        miss, parse & convert as usual, and cache the results - unless they fail
+        to convert, in which case ``convert()`` will raise the error in due course.
+
+        Either way, ``convert()`` then returns the cached models (unless called
+        with non-default arguments), regardless of any changes made to the
+        Element tree in the meantime.
+        """
+        with self._open(source) as file:
+            data = file.read()
+        key = cache.key(data)
+
+        entry = cache.get(key)
+        if entry is not None:
+            logger.info(f"Loaded converted OFX from cache: {key}")
+            self._root = None
+            self.header, self._converted = entry
+            return
+
+        self.parse(BytesIO(data), chunksize=chunksize)
+        try:
+            converted = self.convert()
+        except Exception as err:
+            logger.info(f"Not caching OFX that fails to convert: {err}")
+        else:
+            cache.put(key, CacheEntry(self.header, converted))
+            self._converted = converted
+
+    def _parse_message(self, source, parser, **selection) -> ET.Element:
+        """
+        Read & parse the entire OFX message body in one go.
+
+        ``selection`` holds *include* / *exclude* for the default `TreeBuilder`;
+        expat can't skip markup, so it isn't used for partial parsing.
+        """
         # Stash the converted OFX header
         self.header, message = self._read(source)
         logger.debug(f"Parsed OFX header: {self.header}")
 
+        if parser is None and not selection and isinstance(self.header, OFXHeaderV2):
+            root = self._parse_xml(message)
+            if root is not None:
+                return root
+
         # If no parser specified, create default `ofxtools.Parser.TreeBuilder`
         if parser is None:
-            parser = TreeBuilder()
+            parser = TreeBuilder(**selection)
         parser.feed(message)
-
         # ElementTree.TreeBuilder.close() returns the root.
-        # Follow ElementTree API and stash as self._root (so all normal
-        # ElementTree methods e.g. find() work normally on our subclass).
-        self._root = parser.close()
-        logger.debug(f"Parsed Element tree root: {self._root}")
+        return parser.close()
 
-        return self._root
+    def _parse_mmap(self, source, parser, **selection) -> ET.Element:
+        """
+        Memory-map source, and parse the OFX message body where it lies in the
+        mapping; peak memory use is then roughly that of the Element tree.
 
-    @staticmethod
-    def _read(source) -> Tuple[OFXHeaderType, str]:
+        Only the pages of the file that are actually read are loaded, so
+        the OFX header alone costs next to nothing.  `TreeBuilder` tokenizes
+        the raw bytes, decoding only tags & text (cf. ``feed_buffer()``), and
+        OFXv2 is fed to expat in chunks copied from the mapping.
+
+        Sources that can't be memory-mapped (e.g. pipes, ``BytesIO``, empty
+        files) are just read as usual.
         """
-        Validate/convert OFX header and return it as an instance of
-        `ofxtools.header.OFXHeader{V1, V2}`, along with message body as `str`.
+        with self._open(source) as file:
+            try:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as err:
+                logger.info(f"Can't memory-map {source} ({err}); reading it instead")
+                return self._parse_message(file, parser, **selection)
 
-        Factored out from `parse()` to facilitate unit testing.
+            with mapping:
+                # Pick up from the current position of a file object
+                mapping.seek(file.tell())
+                self.header, prefix = read_header(mapping)
+                logger.debug(f"Parsed OFX header: {self.header}")
+                start = mapping.tell() - len(prefix)
+
+                v2 = isinstance(self.header, OFXHeaderV2)
+                if parser is None and not selection and v2:
+                    root = self._parse_xml(mapping, start)
+                    if root is not None:
+                        return root
+
+                if parser is None:
+                    parser = TreeBuilder(encoding=self.header.codec, **selection)
+                if isinstance(parser, TreeBuilder):
+                    parser.feed_buffer(mapping, start)
+                else:
+                    parser.feed(mapping[start:].decode(self.header.codec).strip())
+                return parser.close()
+
+    def _parse_chunks(self, source, parser, chunksize: int, **selection) -> ET.Element:
+        """Read & parse OFX message body incrementally"""
+        chunks = self._read_chunks(source, chunksize)
+        prefix = next(chunks)
+
+        if parser is None:
+            parser = TreeBuilder(encoding=self.header.codec, **selection)
+        parser.feed(prefix)
+        for chunk in chunks:
+            parser.feed(chunk)
+
+        return parser.close()
+
+    def _read_chunks(self, source, chunksize: int) -> Iterator[bytes]:
+        """
+        Read & stash OFX header, then generate the raw OFX message body
+        in chunks of (at most) ``chunksize`` bytes.
+        """
+        with self._open(source) as source:
+            self.header, prefix = read_header(source)
+            logger.debug(f"Parsed OFX header: {self.header}")
+            yield prefix
+            yield from iter(functools.partial(source.read, chunksize), b"")
+
+    @overload
+    def iterparse(
+        self,
+        source,
+        tags: Iterable[str],
+        chunksize: int = ...,
+        convert: Literal[True] = ...,
+    ) -> Iterator[Aggregate]:
+        ...
+
+    @overload
+    def iterparse(
+        self,
+        source,
+        tags: Iterable[str],
+        chunksize: int = ...,
+        *,
+        convert: Literal[False],
+    ) -> Iterator[ET.Element]:
+        ...
+
+    @overload
+    def iterparse(
+        self,
+        source,
+        tags: Iterable[str],
+        chunksize: int,
+        convert: Literal[False],
+    ) -> Iterator[ET.Element]:
+        ...
+
+    def iterparse(
+        self,
+        source,
+        tags: Iterable[str],
+        chunksize: int = 1 << 16,
+        convert: bool = True,
+    ) -> Iterator[Union[Aggregate, ET.Element]]:
+        """
+        Incrementally deserialize OFX document, generating an instance of
+        ``ofxtools.models`` for each Element tagged with one of *tags*
+        (e.g. "STMTTRN", "INVBUY") as soon as its end is parsed.
+
+        Cf. ``xml.etree.ElementTree.iterparse()``.
+
+        Once converted, each such Element is removed from the tree (unless it's
+        contained in another Element tagged with one of *tags*, in which case it's
+        removed along with that one).  Peak memory use is therefore roughly that of
+        a single converted Aggregate, plus whatever isn't selected by *tags*.
+
+        With ``convert=False``, generate the Elements themselves instead; *tags*
+        may then also select data-bearing elements (e.g. "CURDEF").
+
+        After the generator is exhausted, the rest of the tree is available
+        as ``self._root`` as usual.
+        """
+        logger.info(f"Iteratively parsing {tags} from {source}")
+        chunks = self._read_chunks(source, chunksize)
+        prefix = next(chunks)
+
+        builder = IterBuilder(tags, encoding=self.header.codec)
+        for chunk in itertools.chain([prefix], chunks):
+            builder.feed(chunk)
+            yield from self._convert_events(builder, convert)
+
+        self._root = builder.close()
+        yield from self._convert_events(builder, convert)
+
+    def parse_models(
+        self, source, chunksize: Optional[int] = None, validate: bool = True
+    ) -> Aggregate:
+        """
+        Deserialize OFX document straight into ``ofxtools.models`` instances,
+        without building the intermediate tree of `ElementTree.Element`.
+
+        The result is the same as that of ``parse()`` followed by ``convert()``,
+        in less time & memory (cf. ``ModelBuilder``); *chunksize* is as for
+        ``parse()``.  There's no Element tree to stash as ``self._root``.
+
+        If *validate* is false, skip validation as for ``convert()``.
+
+        Except that well-formed OFXv2 read in one go is still handed to expat
+        (cf. ``_parse_xml()``) and converted from the resulting Element tree -
+        expat building the tree in C beats expat calling back into Python.
+        """
+        logger.info(f"Parsing OFX models from {source}")
+        if chunksize is None:
+            self.header, message = self._read(source)
+            if isinstance(self.header, OFXHeaderV2):
+                root = self._parse_xml(message)
+                if root is not None:
+                    return Aggregate.from_etree(root, validate=validate)
+            builder = ModelBuilder(validate=validate)
+            builder.feed(message)
+        else:
+            chunks = self._read_chunks(source, chunksize)
+            prefix = next(chunks)
+            builder = ModelBuilder(encoding=self.header.codec, validate=validate)
+            for chunk in itertools.chain([prefix], chunks):
+                builder.feed(chunk)
+
+        return builder.close()
+
+    @staticmethod
+    def _convert_events(
+        builder: "IterBuilder", convert: bool = True
+    ) -> Iterator[Union[Aggregate, ET.Element]]:
+        """Convert Elements completed since the last call."""
+        events, builder.events = builder.events, []
+        if not convert:
+            yield from events
+            return
+        for elem in events:
+            yield Aggregate.from_etree(elem)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _open(source) -> Iterator[BinaryIO]:
+        """
+        Open source if it's a file name (closing it afterward), or else
+        pass through file object after checking that it's binary mode.
         """
         close_source = False
         if not hasattr(source, "read"):
@@ -112,30 +456,134 @@ class OFXTree(ET.ElementTree):
             raise ValueError("Source must be opened in binary mode")
 
         try:
-            header, message = parse_header(source)
+            yield source
         finally:
             if close_source and hasattr(source, "close"):
                 source.close()
 
-        return header, message
+    @classmethod
+    def _read(cls, source) -> Tuple[OFXHeaderType, str]:
+        """
+        Validate/convert OFX header and return it as an instance of
+        `ofxtools.header.OFXHeader{V1, V2}`, along with message body as `str`.
 
-    def convert(self) -> Aggregate:
+        Factored out from `parse()` to facilitate unit testing.
+        """
+        with cls._open(source) as source:
+            return parse_header(source)
+
+    @staticmethod
+    def _parse_xml(message, start: int = 0) -> Optional[ET.Element]:
+        """
+        Parse OFXv2 message body with the C-accelerated expat parser, and
+        groom the result to match the output of `TreeBuilder`, i.e. text
+        stripped of whitespace (``None`` if empty) and no tails.  If the markup
+        contains entity references, text is escaped again as it was written.
+
+        Returns ``None`` if the markup can't be handled this way - plenty of FIs
+        send OFXv2 headers on top of SGML bodies - in which case the caller
+        should fall back to `TreeBuilder`.
+
+        ``message`` is either ``str``, or a bytes-like object (e.g. an ``mmap``)
+        holding UTF-8 encoded markup from position ``start`` onward, which is fed
+        to expat a chunk at a time.
+
+        Factored out from `parse()` to facilitate unit testing.
+        """
+        # `TreeBuilder` preserves CDATA sections verbatim (including whitespace),
+        # whereas expat merges them into the surrounding text.  Likewise, expat
+        # decodes character references (e.g. "&#38;"), which `TreeBuilder` leaves
+        # as they are.  Leave any such markup to the regex parser.
+        markers: Iterable[Union[str, bytes]] = ("<![CDATA[", "&#")
+        ampersand: Union[str, bytes] = "&"
+        if not isinstance(message, str):
+            markers = (b"<![CDATA[", b"&#")
+            ampersand = b"&"
+        if any(message.find(marker, start) >= 0 for marker in markers):
+            return None
+        # Expat also decodes entity references (e.g. "&amp;"), which `TreeBuilder`
+        # leaves for ``Types.String`` to unescape; so escape the text again, lest
+        # it be unescaped twice (e.g. "&amp;amp;" -> "&").
+        entities = message.find(ampersand, start) >= 0
+
+        xmlparser = ET.XMLParser()
+        try:
+            if isinstance(message, str):
+                xmlparser.feed(message[start:])
+            else:
+                for pos in range(start, len(message), XML_CHUNKSIZE):
+                    xmlparser.feed(message[pos : pos + XML_CHUNKSIZE])
+            root = xmlparser.close()
+        except ET.ParseError as err:
+            logger.info(f"Not well-formed XML ({err}); falling back to TreeBuilder")
+            return None
+
+        groom = TreeBuilder._groomstring
+        escape = saxutils.escape
+        for elem in root.iter():
+            text = groom(elem.text)
+            # Attributes, tail text and mixed content are all illegal in OFX;
+            # let `TreeBuilder` deal with them (and raise the errors).
+            if elem.attrib or groom(elem.tail) or (text and len(elem)):
+                logger.info("Unexpected XML content; falling back to TreeBuilder")
+                return None
+            if entities and text:
+                text = escape(text)
+            elem.text = text
+            elem.tail = None
+
+        return root
+
+    def convert(self, lazy: bool = False, validate: bool = True) -> Aggregate:
         """
         Transform tree of `ElementTree.Element` instances into hierarchy of
         `ofxtools.models.base.Aggregate` & `ofxtools.Types.Element` instances.
+
+        If ``lazy`` is true, conversion of each Aggregate's contents (and
+        validation errors) is deferred until first accessed; the returned
+        instances hold onto this parser's Elements, which therefore shouldn't
+        be modified afterward.
+
+        If ``validate`` is false, Elements are type-converted, but Aggregates
+        aren't checked against the OFX spec (e.g. for missing required Elements
+        or mutually exclusive ones); cf. ``Aggregate._from_parsed()``.  Use this
+        for data known to be valid, e.g. from a source you've validated before.
+        It can't be combined with ``lazy``.
+
+        After ``parse(cache=...)``, the cached models are returned - except if
+        ``lazy`` is true or ``validate`` false, in which case the Element tree
+        (regenerated from the cached models, on a cache hit) is converted anew
+        as requested.
         """
+        if self._converted is not None and not lazy and validate:
+            return self._converted
         if not isinstance(self._root, ET.Element):
             raise ValueError("Must first call parse() to have data to convert")
-        instance = Aggregate.from_etree(self._root)
+        if lazy:
+            return Aggregate.from_etree(self._root, lazy=True, validate=validate)
+        instance = Aggregate.from_etree(self._root, validate=validate)
         return instance
 
 
-class TreeBuilder(ET.TreeBuilder):
+class _Tokenizer:
     """
-    OFX parser.
+    Regex-based tokenizer of OFX markup that handles both OFXv1(SGML) and
+    OFXv2(XML), driving the ElementTree parser target interface - start(),
+    data() and end() - implemented by subclasses.
 
-    Overrides ElementTree.TreeBuilder.feed() with a regex-based parser that
-    handles both OFXv1(SGML) and OFXv2(XML).
+    Like the rest of the ElementTree parser API, feed() may be called repeatedly
+    with successive chunks of the document (either ``str``, or ``bytes`` to be
+    decoded with *encoding*), followed by a call to close().  Chunks may be split
+    anywhere; markup that might continue into the next chunk is held back until
+    either more data arrives or close() is called.
+
+    If *include* is given, only those parts of the document are built (plus
+    the Elements containing them); each is a path of tags from the root, e.g.
+    ``"OFX/SECLISTMSGSRSV1"``, selecting the whole subtree at the end of it.
+    A tag of ``"*"`` matches any tag, e.g. ``"OFX/*/*/STMTRS/LEDGERBAL"``.
+    Likewise, subtrees selected by *exclude* aren't built.  Markup of an
+    aggregate that isn't built is skipped over by scanning for its end tag,
+    rather than tokenized.
     """
 
     # The body of an OFX document consists of a series of tags.
@@ -149,38 +597,254 @@ class TreeBuilder(ET.TreeBuilder):
         """,
         re.VERBOSE,
     )
+    # Same, for tokenizing raw markup in an ASCII-compatible encoding
+    # (as are all those allowed by the OFX header); cf. feed_buffer()
+    bytes_regex = re.compile(regex.pattern.encode("ascii"), re.VERBOSE)
+
+    # Parser target interface
+    start: Callable[[str, Dict[str, str]], Any]
+    data: Callable[[str], Any]
+    end: Callable[[str], Any]
 
-    def feed(self, data: str) -> None:
+    def __init__(
+        self,
+        *args,
+        encoding: str = "utf_8",
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.encoding = encoding
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        # Markup held back from previous calls to feed()
+        self._buffer = ""
+        # Position of self._buffer within the document, for error reporting
+        self._offset = 0
+
+        self.include = None if include is None else self._splitpaths(include)
+        self.exclude = () if exclude is None else self._splitpaths(exclude)
+        self._selecting = include is not None or bool(self.exclude)
+        # Tags of currently open aggregates; whether each is entirely included;
+        # and whether each has been built yet (cf. _select())
+        self._path: List[str] = []
+        self._inside: List[bool] = []
+        self._built: List[bool] = []
+        # Tag of the aggregate being skipped, whose end tag is yet to be found
+        self._skipping: Optional[str] = None
+
+    def feed(self, data: Union[str, bytes]) -> None:
         """
-        Iterate through all tags matched by regex.
+        Iterate through all tags matched by regex that are known to be complete.
         """
         logger.info("Building Element tree from markup body")
-        for match in self.regex.finditer(data):
-            try:
-                groupdict = match.groupdict()
-
-                tail = self._groomstring(groupdict["tail"])
-                if tail:
-                    raise ParseError(f"Tail text '{tail}' in {match.string}")
-
-                tag = groupdict["tag"]
-
-                # Cf. discussion of element values including CDATA in issue #141
-                cdata = groupdict["cdata"]
-                text = self._groomstring(groupdict["text"])
-                assert not (cdata and text)  # FIXME - can we in fact have both?
-                text = cdata or text
-
-                closetag = groupdict["closetag"]
-                logger.debug(
-                    f"Regex match tag='{tag}', text='{text}', closetag='{closetag}'"
-                )
-                self._feedmatch(tag, text, closetag)
-            except ParseError as err:
-                # Report the position of the error
-                msg = err.args[0]
-                msg += " - position=[{}:{}]".format(match.start(), match.end())
-                raise ParseError(msg)
+        if not isinstance(data, str):
+            data = self._decoder.decode(data)
+        buffer = self._buffer + data
+        end = self._complete(buffer)
+        self._tokenize(buffer, end)
+        self._buffer = buffer[end:]
+        self._offset += end
+
+    def feed_buffer(self, buffer, start: int = 0, end: Optional[int] = None) -> None:
+        """
+        Tokenize all the markup in ``buffer[start:end]`` - a bytes-like object,
+        e.g. an ``mmap``, encoded with *encoding* - where it lies, decoding only
+        the tags & text of each match rather than a copy of the whole thing.
+
+        Unlike feed(), the markup must be complete; call close() afterward.
+        """
+        logger.info("Building Element tree from markup buffer")
+        if end is None:
+            end = len(buffer)
+        self._feedmatches(self.bytes_regex, buffer, start, end, 0)
+
+    def _flush(self) -> None:
+        """
+        Tokenize any markup held back by feed(); call from close().
+        """
+        buffer = self._buffer + self._decoder.decode(b"", final=True)
+        self._tokenize(buffer, len(buffer))
+        self._buffer = ""
+        if self._skipping is not None:
+            raise ParseError(f"Missing end tag </{self._skipping}>")
+
+    @staticmethod
+    def _complete(buffer: str) -> int:
+        """
+        Return the index up to which ``buffer`` can be tokenized regardless of
+        whatever data comes after it.
+
+        That's the start of the last start tag (which might be followed by more
+        text, or by its closing tag) that isn't inside a CDATA section.
+        """
+        end = len(buffer)
+        while True:
+            end = buffer.rfind("<", 0, end)
+            if end <= 0:
+                return 0
+            # A CDATA section that's still open at the candidate (or starts there)
+            # belongs to the text of an earlier start tag; keep looking before it.
+            cdata = buffer.rfind("<![CDATA[", 0, end + 1)
+            if cdata >= 0 and buffer.find("]]>", cdata) not in range(0, end):
+                end = cdata
+                continue
+            nextchar = buffer[end + 1 : end + 2]
+            if nextchar and nextchar not in "/!":
+                return end
+
+    def _tokenize(self, data: str, end: int) -> None:
+        """
+        Iterate through all tags matched by regex in ``data[:end]``.
+        """
+        self._feedmatches(self.regex, data, 0, end, self._offset)
+
+    def _feedmatches(self, regex, string, pos: int, end: int, offset: int) -> None:
+        """
+        Feed matches of regex in ``string[pos:end]`` (``str``, or bytes-like
+        to be decoded) to _feedmatch(), skipping any that aren't selected
+        by *include* / *exclude*.
+
+        ``offset`` is the position in the document of ``string``, for error
+        reporting.
+        """
+        codec = self.encoding
+        while pos < end:
+            if self._skipping is not None:
+                pos = self._skip(string, pos, end)
+                continue
+
+            for match in regex.finditer(string, pos, end):
+                try:
+                    groups = match.group("tag", "cdata", "text", "closetag", "tail")
+                    if not isinstance(string, str):
+                        groups = tuple(
+                            None if group is None else group.decode(codec)
+                            for group in groups
+                        )
+                    tag, cdata, text, closetag, tail = groups
+
+                    tail = self._groomstring(tail)
+                    if tail:
+                        raise ParseError(f"Tail text '{tail}' in {match.string}")
+
+                    # Cf. discussion of element values including CDATA in issue #141
+                    text = self._groomstring(text)
+                    assert not (cdata and text)  # FIXME - can we in fact have both?
+                    text = cdata or text
+
+                    if self._selecting:
+                        build = self._select(tag, text, closetag)
+                        if build is False and not (text or closetag):
+                            self._skipping = tag
+                            pos = match.end()
+                            break
+                        if not build:
+                            continue
+
+                    logger.debug(
+                        f"Regex match tag='{tag}', text='{text}', closetag='{closetag}'"
+                    )
+                    self._feedmatch(tag, text, closetag)
+                except ParseError as err:
+                    # Report the position of the error
+                    msg = err.args[0]
+                    start = offset + match.start()
+                    msg += " - position=[{}:{}]".format(start, offset + match.end())
+                    raise ParseError(msg)
+            else:
+                return
+
+    def _skip(self, string, pos: int, end: int) -> int:
+        """
+        Scan ``string[pos:end]`` for the end tag of the aggregate being skipped.
+
+        Return the position after it if found (and stop skipping), or else
+        ``end`` - the rest of the aggregate is in markup yet to be fed.
+        Since an OFX aggregate never contains another of the same type, there's
+        no need to keep track of nesting.
+        """
+        endtag = f"</{self._skipping}>"
+        if isinstance(string, str):
+            found = string.find(endtag, pos, end)
+        else:
+            found = string.find(endtag.encode("ascii"), pos, end)
+        if found < 0:
+            return end
+        logger.debug(f"Skipped aggregate '{self._skipping}'")
+        self._skipping = None
+        return found + len(endtag)
+
+    def _select(
+        self, tag: str, text: Optional[str], closetag: Optional[str]
+    ) -> Optional[bool]:
+        """
+        Decide whether to build the Element for a regex match, according to
+        *include* / *exclude*, keeping track of the path to it.
+
+        Return True to build it; False to skip it (for an aggregate start tag,
+        along with its contents); None if there's nothing to build.
+
+        Aggregates that aren't included in their entirety, but may contain
+        Elements that are, aren't built until one of those is found - so
+        they're left out altogether if they turn out not to.  The root is always
+        built (unless excluded).
+        """
+        path = self._path
+        if tag.startswith("/"):
+            if not path:
+                # Unmatched end tag; let _feedmatch() deal with it
+                return True
+            path.pop()
+            self._inside.pop()
+            return self._built.pop() or None
+
+        tags = (*path, tag)
+        depth = len(tags)
+        include = self.include
+
+        def matches(patterns):
+            return [
+                pattern
+                for pattern in patterns
+                if all(p == "*" or p == t for p, t in zip(pattern, tags))
+            ]
+
+        if any(len(pattern) == depth for pattern in matches(self.exclude)):
+            return False
+
+        if include is None or (self._inside and self._inside[-1]):
+            inside = True
+        else:
+            included = matches(include)
+            if not included and depth > 1:
+                return False
+            # Either selected in its entirety, or else an ancestor of Elements
+            # that may be (the rest of its contents being skipped).
+            inside = any(len(pattern) <= depth for pattern in included)
+
+        aggregate = not (text or closetag)
+        if inside or depth == 1:
+            # Build any ancestors still pending
+            built = self._built
+            for n in range(len(built)):
+                if not built[n]:
+                    self._feedmatch(path[n], None, None)
+                    built[n] = True
+
+        if aggregate:
+            path.append(tag)
+            self._inside.append(inside)
+            self._built.append(inside or depth == 1)
+            return self._built[-1] or None
+        return inside or None
+
+    @staticmethod
+    def _splitpaths(paths: Iterable[str]) -> Tuple[Tuple[str, ...], ...]:
+        """Split paths like "OFX/SECLISTMSGSRSV1" into tuples of tags"""
+        if isinstance(paths, str):
+            raise ValueError(f"Expected a sequence of paths, not {paths!r}")
+        return tuple(tuple(path.strip("/").upper().split("/")) for path in paths)
 
     def _feedmatch(
         self, tag: str, text: Optional[str], closetag: Optional[str]
@@ -224,7 +888,7 @@ class TreeBuilder(ET.TreeBuilder):
             self.end(tag)
 
     @staticmethod
-    def _groomstring(string: str) -> Optional[str]:
+    def _groomstring(string: Optional[str]) -> Optional[str]:
         """Strips whitespace and returns None for empty string"""
         # Can't strip() None
         string = (string or "").strip()
@@ -233,6 +897,238 @@ class TreeBuilder(ET.TreeBuilder):
         return None
 
 
+class TreeBuilder(_Tokenizer, ET.TreeBuilder):
+    """
+    OFX parser.
+
+    Overrides ElementTree.TreeBuilder.feed() with a regex-based parser that
+    handles both OFXv1(SGML) and OFXv2(XML); cf. ``_Tokenizer``.
+    """
+
+    def close(self) -> ET.Element:
+        """
+        Flush any markup held back by feed(), and return the root Element.
+        """
+        self._flush()
+        return super().close()
+
+
+class IterBuilder(TreeBuilder):
+    """
+    OFX parser that keeps track of Elements with the given tags as they're
+    completed, and prunes them from the tree.
+
+    Used by ``OFXTree.iterparse()``, which collects completed Elements from
+    the ``events`` list after each call to ``feed()``.
+    """
+
+    def __init__(self, tags: Iterable[str], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tags = frozenset(tag.upper() for tag in tags)
+        # Completed Elements matching self.tags, in document order
+        self.events: List[ET.Element] = []
+        # Currently open Elements
+        self._stack: List[ET.Element] = []
+
+    def start(self, tag, attrs):
+        elem = super().start(tag, attrs)
+        self._stack.append(elem)
+        return elem
+
+    def end(self, tag):
+        elem = super().end(tag)
+        self._stack.pop()
+        if elem.tag in self.tags:
+            self.events.append(elem)
+            # The Element just ended is always the last child of its parent.
+            # Leave it there if the parent branch is going to be converted too.
+            tags = self.tags
+            if self._stack and not any(e.tag in tags for e in self._stack):
+                del self._stack[-1][-1]
+        return elem
+
+
+class ModelBuilder(_Tokenizer):
+    """
+    OFX parser that instantiates ``ofxtools.models`` as it goes, instead of
+    building a tree of ``ET.Element`` for ``OFXTree.convert()``.
+
+    Keeps a stack of pending Aggregates, each collecting the args/kwargs parsed
+    from its children, and instantiates each one upon its end tag - following
+    the same rules as ``Aggregate.from_etree()``, including sequence validation
+    and skipping of unknown & extended tags.  close() returns the root Aggregate.
+
+    Used by ``OFXTree.parse_models()``.
+    """
+
+    def __init__(self, *args, validate: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.validate = validate
+        # Currently open Aggregates/Elements
+        self._frames: List[_Frame] = []
+        self._result: Optional[Aggregate] = None
+
+    def _start(self, tag: str, text: Optional[str], closetag: Optional[str]) -> None:
+        """
+        Short-circuit data-bearing leaf elements (which are the bulk of OFX) by
+        handing their text straight to the parent, without pushing them to the stack.
+        """
+        frames = self._frames
+        if not text or not frames:
+            super()._start(tag, text, closetag)
+            return
+
+        #  Inlined ``_locate()`` & ``_append()`` on this hot path
+        parent = frames[-1]
+        if parent.skip:
+            return
+        cls = parent.cls
+        if cls is None:
+            cls = parent.cls = Aggregate._lookup_class(parent.tag)
+        location = cls._lookup_tag(tag, parent.prev_index, parent.prev_is_listmember)
+        if location is None:
+            return
+        attrname, parent.prev_index, is_listmember, is_unsupported = location
+        parent.prev_is_listmember = is_listmember
+
+        value = None if is_unsupported else text
+        if is_listmember:
+            parent.args.append(value)
+        else:
+            if attrname in parent.kwargs:
+                raise OFXSpecError
+            parent.kwargs[attrname] = value
+
+    def start(self, tag, attrs):
+        frames = self._frames
+        if not frames:
+            frames.append(_Frame(tag, None))
+            return
+
+        parent = frames[-1]
+        if parent.skip:
+            # Contents of unknown or Unsupported tags aren't converted
+            frames.append(_Frame(tag, None, skip=True))
+            return
+
+        location = self._locate(parent, tag)
+        if location is None:
+            frames.append(_Frame(tag, None, skip=True))
+        else:
+            frames.append(_Frame(tag, location, skip=location[3]))
+
+    def data(self, data):
+        frame = self._frames[-1]
+        frame.text = (frame.text or "") + data
+
+    def end(self, tag):
+        frame = self._frames.pop()
+        location = frame.location
+
+        if frame.skip:
+            if location is None:
+                return
+            # Unsupported
+            value = None
+        elif frame.text and location is not None:
+            # Element - value will be type-converted upon instance initialization
+            value = frame.text
+        elif frame.cls is None:
+            # Empty Aggregate
+            cls = Aggregate._lookup_class(frame.tag)
+            value = cls() if self.validate else cls._from_trusted()
+        elif self.validate:
+            value = frame.cls(*frame.args, **frame.kwargs)
+        else:
+            value = frame.cls._from_parsed(frame.args, frame.kwargs)
+
+        if self._frames:
+            self._append(self._frames[-1], location, value)
+        else:
+            self._result = value
+
+    def close(self) -> Aggregate:
+        """
+        Flush any markup held back by feed(), and return the root Aggregate.
+        """
+        self._flush()
+        # Like ``ET.TreeBuilder``, implicitly end any Elements left open
+        while self._frames:
+            self.end(self._frames[-1].tag)
+        if self._result is None:
+            raise ParseError("Missing root element")
+        return self._result
+
+    @staticmethod
+    def _locate(parent: "_Frame", tag: str) -> Optional[Tuple[str, int, bool, bool]]:
+        """
+        Locate a child tag within the spec of its parent Aggregate;
+        cf. ``Aggregate._lookup_tag()``.
+        """
+        if parent.cls is None:
+            # It has children, so the parent is an Aggregate
+            parent.cls = Aggregate._lookup_class(parent.tag)
+
+        location = parent.cls._lookup_tag(
+            tag, parent.prev_index, parent.prev_is_listmember
+        )
+        if location is not None:
+            attrname, parent.prev_index, parent.prev_is_listmember, _ = location
+        return location
+
+    @staticmethod
+    def _append(
+        parent: "_Frame",
+        location: Tuple[str, int, bool, bool],
+        value: Optional[Union[str, Aggregate]],
+    ) -> None:
+        """
+        Append value to parent args (list members) or kwargs (everything else)
+        """
+        attrname, index, is_listmember, is_unsupported = location
+        if is_listmember:
+            parent.args.append(value)
+        else:
+            if attrname in parent.kwargs:
+                raise OFXSpecError
+            parent.kwargs[attrname] = value
+
+
+class _Frame:
+    """Aggregate/Element on the ``ModelBuilder`` stack"""
+
+    __slots__ = [
+        "tag",
+        "location",
+        "skip",
+        "cls",
+        "text",
+        "args",
+        "kwargs",
+        "prev_index",
+        "prev_is_listmember",
+    ]
+
+    def __init__(
+        self,
+        tag: str,
+        location: Optional[Tuple[str, int, bool, bool]],
+        skip: bool = False,
+    ):
+        self.tag = tag
+        # Result of parent's ``Aggregate._lookup_tag()``; None for the root
+        self.location = location
+        # Don't convert this or its contents?
+        self.skip = skip
+        # ``Aggregate`` subclass; looked up when the first child is encountered
+        self.cls: Optional[Type[Aggregate]] = None
+        self.text: Optional[str] = None
+        self.args: list = []
+        self.kwargs: dict = {}
+        self.prev_index = -1
+        self.prev_is_listmember = False
+
+
 def main(*files):
     """
     Simple functional test for impatient developers.
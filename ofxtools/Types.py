@@ -24,6 +24,7 @@ __all__ = [
     "Decimal",
     "DateTime",
     "Time",
+    "ConversionCache",
     "ListElement",
     "SubAggregate",
     "ListAggregate",
@@ -33,12 +34,24 @@ __all__ = [
 
 # stdlib imports
 from functools import singledispatchmethod
+from collections import OrderedDict
 import decimal
 import datetime
 import re
 import warnings
 from xml.sax import saxutils
-from typing import Any, Optional, Union, Type
+from typing import (
+    Any,
+    Optional,
+    Union,
+    Type,
+    Tuple,
+    Dict,
+    FrozenSet,
+    Callable,
+    Hashable,
+    NamedTuple,
+)
 import inspect
 
 
@@ -58,6 +71,11 @@ class OFXSpecError(OFXTypeError):
     """Violation of the OFX specification"""
 
 
+#  Placeholder for values not yet converted by a lazy ``Aggregate``;
+#  cf. ``Aggregate._convert_lazy()``
+UNSET = object()
+
+
 def call_signature(*args, **kwargs):
     """Decorator creating ``__signature__`` class attribute (``inspect.Signature`` instance)
     for use by ``__init__()`` method of ``Element`` subclasses.
@@ -122,6 +140,10 @@ class Element:
     ``Aggregate`` class remains alive, but the ``Aggregate`` instances can be garbage
     collected when no longer needed.
 
+    ``Aggregate`` instances keep their values compactly in a list, ``_values``,
+    at positions given by the class spec (cf. ``Aggregate._schema.positions``);
+    other classes (e.g. ``OFXHeaderV1``) keep values in the instance ``__dict__``.
+
     A good introductory discussion to this use of descriptors is here:
     https://realpython.com/python-descriptors/#how-to-use-python-descriptors-properly
 
@@ -154,6 +176,7 @@ class Element:
     def __set_name__(self, owner, name):
         #  Cf. PEP 487
         self.name = name
+        self._str_converter = self._compile_str()
 
     def __get__(self, obj, objtype=None):
         """
@@ -165,7 +188,15 @@ class Element:
         #  the code base for tests to run.
         if obj is None:
             return
-        return obj.__dict__[self.name]
+        try:
+            values = obj._values
+        except AttributeError:
+            return obj.__dict__[self.name]
+
+        value = values[obj._schema.positions[self.name]]
+        if value is UNSET:
+            return obj._materialize(self.name)
+        return value
 
     def __set__(self, obj, value) -> None:
         """Perform validation and type conversion before setting value.
@@ -173,12 +204,40 @@ class Element:
         ``self`` is the instance of the descriptor
         ``obj`` is the instance of the object your descriptor is attached to.
         """
-        obj.__dict__[self.name] = self.convert(value)
+        #  Parsed OFX data is all ``str``; skip dispatch for it.
+        if value.__class__ is str:
+            value = self._str_converter(value)
+        else:
+            value = self.convert(value)
+
+        try:
+            values = obj._values
+        except AttributeError:
+            obj.__dict__[self.name] = value
+        else:
+            values[obj._schema.positions[self.name]] = value
 
     def convert(self, value):
         """Define in subclass"""
         raise NotImplementedError
 
+    def unconvert(self, value):
+        """Define in subclass"""
+        raise NotImplementedError
+
+    def _compile_str(self) -> Callable[[str], Any]:
+        """
+        Return a function equivalent to ``convert()`` for ``str`` values,
+        specialized for this instance's validation parameters, which
+        ``__set__()`` calls directly instead of dispatching ``convert()``.
+
+        N.B. called when the instance is bound to its model class, so
+        validation parameters mustn't be changed after that.
+
+        Override in subclass.
+        """
+        return self.convert
+
     def enforce_required(self, value):
         """Utility used by many subclass converters"""
         if value is None and self.required:
@@ -214,6 +273,18 @@ class Bool(Element):
             msg = f"{value} is not one of the allowed values {self.mapping.keys()}"
             raise OFXSpecError(msg)
 
+    def _compile_str(self) -> Callable[[str], bool]:
+        mapping = self.mapping
+
+        def convert_str(value: str) -> bool:
+            try:
+                return mapping[value]
+            except KeyError:
+                msg = f"{value} is not one of the allowed values {mapping.keys()}"
+                raise OFXSpecError(msg)
+
+        return convert_str
+
     @singledispatchmethod
     def unconvert(self, value):
         msg = f"{value} is not one of the allowed values {self.mapping.keys()}"
@@ -233,6 +304,8 @@ class Bool(Element):
 class String(Element):
     __type__ = str
     strict = True
+    # Unescaped by ``convert()`` in addition to '&amp;' '&lt;' '&gt;'
+    entities = {"&nbsp;": " ", "&apos;": "'", "&quot;": '"'}
 
     @singledispatchmethod
     def convert(self, value):
@@ -257,9 +330,28 @@ class String(Element):
         # Unescape '&amp;' '&lt;' '&gt;' '&nbsp;' per OFX section 2.3
         # Also go ahead and unescape other XML control characters,
         # because FIs tend to mix &amp; match...
-        value = saxutils.unescape(value, {"&nbsp;": " ", "&apos;": "'", "&quot;": '"'})
+        value = saxutils.unescape(value, self.entities)
         return self.enforce_length(value)
 
+    def _compile_str(self) -> Callable[[str], Optional[str]]:
+        enforce_required = self.enforce_required
+        unescape = saxutils.unescape
+        entities = self.entities
+        # Mypy doesn't understand that ``length`` gets set by ``__init__()``
+        length = self.length  # type: ignore
+        enforce_length = self.enforce_length
+
+        def convert_str(value: str) -> Optional[str]:
+            if value == "":
+                return enforce_required(None)
+            if "&" in value:
+                value = unescape(value, entities)
+            if length is not None and len(value) > length:
+                return enforce_length(value)
+            return value
+
+        return convert_str
+
     @convert.register
     def _convert_none(self, value: None):
         # Pass through None, unless value is required
@@ -299,6 +391,10 @@ class OneOf(Element):
     N.B. the variable number of positional args used for instantiation violates the
     assumptions of ``call_signature``, so we skip the ``@call_signature`` decorator
     and directly create the ``__signature__`` attribute in the class definition.
+
+    ``valid`` is kept as given (a tuple) for error messages & ``__repr__()``, but
+    validation tests membership in ``validset``, a hashed copy shared by all
+    instances built from the same code list (e.g. ``CURRENCY_CODES``).
     """
 
     __type__ = str
@@ -311,13 +407,33 @@ class OneOf(Element):
         )
     )
 
+    # ``validset`` for each distinct ``valid``
+    _validsets: Dict[tuple, FrozenSet] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Mypy doesn't understand that ``valid`` gets set by ``__init__()``
+        valid = self.valid  # type: ignore
+        validset = OneOf._validsets.get(valid)
+        if validset is None:
+            validset = OneOf._validsets[valid] = frozenset(valid)
+        self.validset = validset
+
+    def is_valid(self, value) -> bool:
+        """Test membership in ``valid``"""
+        try:
+            return value in self.validset
+        except TypeError:
+            # Unhashable
+            return value in self.valid  # type: ignore
+
     @singledispatchmethod
     def convert(self, value):
         return self._convert_default(value)
 
     def _convert_default(self, value):
         value = self.enforce_required(value)
-        if value is not None and value not in self.valid:
+        if value is not None and not self.is_valid(value):
             raise OFXSpecError(f"'{value}' is not OneOf {self.valid}")
         return value
 
@@ -325,6 +441,21 @@ class OneOf(Element):
     def _convert_str(self, value: str):
         return self._convert_default(value or None)
 
+    def _compile_str(self) -> Callable[[str], Optional[str]]:
+        enforce_required = self.enforce_required
+        # Mypy doesn't understand that ``valid`` gets set by ``__init__()``
+        valid = self.valid  # type: ignore
+        validset = self.validset
+
+        def convert_str(value: str) -> Optional[str]:
+            if not value:
+                return enforce_required(None)
+            if value not in validset:
+                raise OFXSpecError(f"'{value}' is not OneOf {valid}")
+            return value
+
+        return convert_str
+
     @convert.register
     def _convert_none(self, value: None):
         # Pass through None, unless value is required
@@ -333,7 +464,7 @@ class OneOf(Element):
     @singledispatchmethod
     def unconvert(self, value):
         value = self.enforce_required(value)
-        if value is not None and value not in self.valid:
+        if value is not None and not self.is_valid(value):
             raise OFXSpecError(f"'{value}' is not OneOf {self.valid}")
         return value
 
@@ -371,6 +502,23 @@ class Integer(Element):
             return self.enforce_required(None)
         return self.enforce_length(int(value))
 
+    def _compile_str(self) -> Callable[[str], Optional[int]]:
+        enforce_required = self.enforce_required
+        enforce_length = self.enforce_length
+        # Mypy doesn't understand that ``length`` gets set by ``__init__()``
+        length = self.length  # type: ignore
+        limit = None if length is None else 10 ** length
+
+        def convert_str(value: str) -> Optional[int]:
+            if len(value) == 0:
+                return enforce_required(None)
+            value_ = int(value)
+            if limit is not None and value_ >= limit:
+                return enforce_length(value_)
+            return value_
+
+        return convert_str
+
     @convert.register
     def _convert_none(self, value: None):
         # Pass through None, unless value is required
@@ -432,6 +580,25 @@ class Decimal(Element):
 
         return dec
 
+    def _compile_str(self) -> Callable[[str], decimal.Decimal]:
+        Decimal = decimal.Decimal
+        InvalidOperation = decimal.InvalidOperation
+        scale = self.scale
+
+        def convert_str(value: str) -> decimal.Decimal:
+            # Handle Euro-style decimal separators (comma)
+            try:
+                dec = Decimal(value)
+            except InvalidOperation:
+                dec = Decimal(value.replace(",", "."))
+
+            if scale is not None:
+                dec = dec.quantize(scale)
+
+            return dec
+
+        return convert_str
+
     @convert.register
     def _convert_none(self, value: None):
         # Pass through None, unless value is required
@@ -553,6 +720,85 @@ def format_datetime(format: str, value: datetime.datetime) -> str:
     return f"{value_bumped.strftime(format)}.{ms:03d}[{tz}]"
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ConversionCache:
+    """
+    Bounded LRU cache of values converted from OFX text, for ``Elements`` whose
+    conversion is expensive and whose inputs tend to repeat (e.g. the handful of
+    distinct timestamps in a statement with thousands of transactions).
+
+    Cached values are shared, so must be immutable.
+
+    Set ``maxsize`` to bound the number of entries; ``maxsize=0`` disables caching.
+    Like ``functools.lru_cache``, counts hits & misses, reported by ``info()``.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self._data: OrderedDict = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be nonnegative, not {maxsize}")
+        self._maxsize = maxsize
+        while len(self._data) > maxsize:
+            self._data.popitem(last=False)
+
+    def lookup(self, key: Hashable, func: Callable, *args) -> Any:
+        """
+        Return the value cached under ``key``; if missing, cache & return the
+        value of ``func(*args)``.  Exceptions raised by ``func`` aren't cached.
+        """
+        data = self._data
+        try:
+            value = data[key]
+        except KeyError:
+            self.misses += 1
+            value = func(*args)
+            if self._maxsize:
+                data[key] = value
+                if len(data) > self._maxsize:
+                    try:
+                        data.popitem(last=False)
+                    except KeyError:
+                        #  Emptied by another thread
+                        pass
+            return value
+
+        self.hits += 1
+        try:
+            data.move_to_end(key)
+        except KeyError:
+            #  Evicted by another thread
+            pass
+        return value
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """Empty the cache & reset statistics"""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.info()}>"
+
+
 class DateTime(Element):
     """OFX Section 3.2.8.2"""
 
@@ -560,6 +806,10 @@ class DateTime(Element):
     __type__: Union[Type[datetime.datetime], Type[datetime.time]] = datetime.datetime
     regex = DT_REGEX
 
+    # Conversions of OFX text, shared by all instances (including subclasses).
+    # Resize via e.g. ``DateTime.cache.maxsize = 100``; 0 disables caching.
+    cache = ConversionCache()
+
     @singledispatchmethod
     def convert(self, value):
         cls = value.__class__.__name__
@@ -573,6 +823,23 @@ class DateTime(Element):
 
     @convert.register
     def _convert_str(self, value: str):
+        return self.cache.lookup((self.__class__, value), self._parse_str, value)
+
+    def _compile_str(self) -> Callable[[str], Any]:
+        cls = self.__class__
+        parse = self._parse_str
+        cache = self.cache
+
+        def convert_str(value: str):
+            return cache.lookup((cls, value), parse, value)
+
+        return convert_str
+
+    def _parse_str(self, value: str):
+        converted = self._parse_fixed(value)
+        if converted is not None:
+            return converted
+
         match = self.regex.match(value)
         if match is None:
             msg = f"'{value}' does not conform to OFX formats for {self.__type__}"
@@ -594,6 +861,86 @@ class DateTime(Element):
         # Mypy doesn't understand passing ``**intmatches`` to instantiate
         return self.normalize_to_gmt(self.__type__(**intmatches), gmt_offset)  # type: ignore
 
+    def _parse_fixed(self, value: str) -> Optional[datetime.datetime]:
+        """
+        Fast path for ``_parse_str()``: decode the fixed-width formats given by
+        the OFX spec - YYYYMMDD, YYYYMMDDHHMMSS, YYYYMMDDHHMMSS.XXX, and
+        YYYYMMDDHHMMSS.XXX[gmt offset[:tz name]] - by slicing.
+
+        Return None for anything else (including invalid data, and quirks like
+        YYYYMMDDHHMMSS[gmt offset]), leaving it to the regex.
+        """
+        digits = value[:14]
+        if not (digits.isdigit() and digits.isascii()):
+            return None
+
+        month = int(value[4:6])
+        day = int(value[6:8])
+        if not (1 <= month <= 12 and 1 <= day <= 31):
+            return None
+
+        length = len(value)
+        if length == 8:
+            hour = minute = second = microsecond = 0
+            gmt_offset = self.parse_gmt_offset(None, None, None)
+        elif length >= 14:
+            hour = int(value[8:10])
+            minute = int(value[10:12])
+            second = int(value[12:14])
+            if hour > 23 or minute > 59 or second > 60:
+                return None
+            suffix = self._parse_fixed_suffix(value[14:])
+            if suffix is None:
+                return None
+            microsecond, gmt_offset = suffix
+        else:
+            return None
+
+        dt = datetime.datetime(
+            int(value[:4]), month, day, hour, minute, second, microsecond
+        )
+        return self.normalize_to_gmt(dt, gmt_offset)
+
+    def _parse_fixed_suffix(
+        self, suffix: str
+    ) -> Optional[Tuple[int, datetime.timedelta]]:
+        """
+        Decode the optional .XXX[gmt offset[:tz name]] following the time of day,
+        returning (microseconds, GMT offset), or None if nonconforming.
+        """
+        if not suffix:
+            return 0, self.parse_gmt_offset(None, None, None)
+
+        millis = suffix[1:4]
+        if suffix[0] != "." or len(millis) != 3:
+            return None
+        if not (millis.isdigit() and millis.isascii()):
+            return None
+        microsecond = 1000 * int(millis)
+
+        tz = suffix[4:]
+        if not tz:
+            return microsecond, self.parse_gmt_offset(None, None, None)
+        if tz[0] != "[" or tz[-1] != "]":
+            return None
+
+        offset, _, tz_name = tz[1:-1].partition(":")
+        hours, sep, minutes = offset.partition(".")
+        if not hours or hours.strip("0123456789+-"):
+            return None
+        if sep and not (len(minutes) == 2 and minutes.isdigit() and minutes.isascii()):
+            return None
+        if not sep and tz_name[:2].isdigit():
+            #  DT_REGEX reads e.g. [-5:30] as gmt_offset_minutes=30
+            return None
+        try:
+            int(hours)
+        except ValueError:
+            #  e.g. Interactive Brokers' [-:TZ]; cf. ``parse_gmt_offset()``
+            return None
+
+        return microsecond, self.parse_gmt_offset(hours, minutes or None, tz_name)
+
     def parse_gmt_offset(
         self, hours: Optional[str], minutes: Optional[str], tz_name: Optional[str]
     ) -> datetime.timedelta:
@@ -613,7 +960,6 @@ class DateTime(Element):
 
     def normalize_to_gmt(self, value, gmt_offset):
         # Adjust timezone to GMT/UTC
-        self.unconvert.register(datetime.datetime, self._unconvert_datetime)
         return (value - gmt_offset).replace(tzinfo=utils.UTC)
 
     @convert.register
@@ -711,6 +1057,32 @@ class Time(DateTime):
     def _convert_str(self, value: str):
         return super()._convert_str(value)  # type: ignore
 
+    def _parse_fixed(self, value: str) -> Optional[datetime.time]:  # type: ignore
+        """
+        Fast path for ``_parse_str()``: decode the fixed-width formats given by
+        the OFX spec - HHMMSS, HHMMSS.XXX, and HHMMSS.XXX[gmt offset[:tz name]] -
+        by slicing.
+
+        Return None for anything else, leaving it to the regex.
+        """
+        digits = value[:6]
+        if len(digits) != 6 or not (digits.isdigit() and digits.isascii()):
+            return None
+
+        hour = int(value[:2])
+        minute = int(value[2:4])
+        second = int(value[4:6])
+        if hour > 23 or minute > 59 or second > 60:
+            return None
+
+        suffix = self._parse_fixed_suffix(value[6:])
+        if suffix is None:
+            return None
+        microsecond, gmt_offset = suffix
+
+        tm = datetime.time(hour, minute, second, microsecond)
+        return self.normalize_to_gmt(tm, gmt_offset)
+
     @convert.register
     def _convert_none(self, value: None):
         # Pass through None, unless value is required
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Parse many OFX files in parallel.
+
+Parsing & conversion are pure Python, hence bound to a single core by the GIL;
+the functions here fan them out to a pool of worker processes instead.
+Files are handed to the workers in chunks (to save on interprocess
+communication), a bounded number of chunks at a time (so that results are
+sent back no faster than they're consumed).
+
+    >>> from ofxtools.batch import parse_many
+    >>> for result in parse_many(['a.ofx', 'b.ofx'], workers=4):
+    ...     if result.error is None:
+    ...         print(result.path, result.ofx.statements)
+
+Converted ``ofxtools.models`` are sent back to the parent process by pickling,
+which skips revalidating them.
+
+The module also runs as a script, reporting on each file:
+
+    python -m ofxtools.batch [-w WORKERS] [--no-convert] PATH [PATH ...]
+"""
+
+__all__ = [
+    "Result",
+    "parse_file",
+    "parse_many",
+    "iparse_many",
+    "iparse_many_unordered",
+    "find_files",
+]
+
+
+# stdlib imports
+import argparse
+import collections
+import concurrent.futures
+import itertools
+import os
+import pickle
+import sys
+import xml.etree.ElementTree as ET
+from typing import (
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+# local imports
+from ofxtools.Parser import OFXTree
+from ofxtools.header import OFXHeaderType
+from ofxtools.models.base import Aggregate
+
+FILE_SUFFIXES = (".ofx", ".qfx")
+
+
+class Result(NamedTuple):
+    """
+    Outcome of parsing one file.
+
+    ``ofx`` is the converted ``OFX`` instance, or the root ``ET.Element`` if
+    not converting; on failure it's None, and ``error`` holds the exception.
+    """
+
+    path: str
+    header: Optional[OFXHeaderType]
+    ofx: Optional[Union[Aggregate, ET.Element]]
+    error: Optional[Exception]
+
+
+def parse_file(path: str, convert: bool = True) -> Result:
+    """Parse (and convert) an OFX file, catching any error"""
+    tree = OFXTree()
+    try:
+        tree.parse(path)
+        ofx = tree.convert() if convert else tree.getroot()
+    except Exception as err:
+        return Result(path, getattr(tree, "header", None), None, _picklable(err))
+    return Result(path, tree.header, ofx, None)
+
+
+def _picklable(err: Exception) -> Exception:
+    """
+    Exceptions get pickled to return them from worker processes, which fails
+    for those whose ``__init__()`` signature doesn't match their ``args``.
+    Replace such with a ``RuntimeError`` bearing the same message.
+    """
+    try:
+        pickle.loads(pickle.dumps(err))
+    except Exception:
+        return RuntimeError(f"{err.__class__.__name__}: {err}")
+    return err
+
+
+def _parse_chunk(paths: Sequence[str], convert: bool) -> List[Result]:
+    """Run in the worker processes"""
+    return [parse_file(path, convert) for path in paths]
+
+
+def parse_many(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    convert: bool = True,
+    chunksize: int = 4,
+) -> List[Result]:
+    """
+    Parse OFX files in ``workers`` processes (by default, one per CPU);
+    return a list of results, in the order of ``paths``.
+
+    If ``convert`` is false, return the parsed Element trees.
+
+    Errors don't stop the batch; they're reported by the ``Result`` of each
+    file that failed.
+    """
+    return list(iparse_many(paths, workers, convert, chunksize))
+
+
+def iparse_many(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    convert: bool = True,
+    chunksize: int = 4,
+) -> Iterator[Result]:
+    """
+    Like ``parse_many()``, but generate results (in the order of ``paths``) as
+    they become available.
+    """
+    return _iparse(paths, workers, convert, chunksize, ordered=True)
+
+
+def iparse_many_unordered(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    convert: bool = True,
+    chunksize: int = 4,
+) -> Iterator[Result]:
+    """
+    Like ``iparse_many()``, but generate results in the order in which they're
+    completed - which keeps the workers busy, rather than waiting for a slow
+    file to be done with in order to generate the results behind it.
+    """
+    return _iparse(paths, workers, convert, chunksize, ordered=False)
+
+
+def _iparse(
+    paths: Iterable[str],
+    workers: Optional[int],
+    convert: bool,
+    chunksize: int,
+    ordered: bool,
+) -> Iterator[Result]:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for path in paths:
+            yield parse_file(path, convert)
+        return
+
+    paths = iter(paths)
+    chunks = iter(lambda: list(itertools.islice(paths, chunksize)), [])
+    #  Enough to keep all workers busy while results are being consumed
+    maxpending = workers * 2
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def submit(chunk: List[str]) -> concurrent.futures.Future:
+            return executor.submit(_parse_chunk, chunk, convert)
+
+        if ordered:
+            queue: Deque[concurrent.futures.Future] = collections.deque(
+                submit(chunk) for chunk in itertools.islice(chunks, maxpending)
+            )
+            while queue:
+                results = queue.popleft().result()
+                for chunk in itertools.islice(chunks, 1):
+                    queue.append(submit(chunk))
+                yield from results
+        else:
+            pending: Set[concurrent.futures.Future] = {
+                submit(chunk) for chunk in itertools.islice(chunks, maxpending)
+            }
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for chunk in itertools.islice(chunks, len(done)):
+                    pending.add(submit(chunk))
+                for future in done:
+                    yield from future.result()
+
+
+def find_files(paths: Iterable[str]) -> Iterator[str]:
+    """Generate the given file paths, and OFX files found under directories"""
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if filename.lower().endswith(FILE_SUFFIXES):
+                        yield os.path.join(dirpath, filename)
+        else:
+            yield path
+
+
+def make_argparser() -> argparse.ArgumentParser:
+    argparser = argparse.ArgumentParser(
+        description="Parse OFX files in parallel, reporting the outcome for each",
+    )
+    argparser.add_argument(
+        "paths", nargs="+", metavar="PATH", help="OFX file, or directory thereof"
+    )
+    argparser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Number of worker processes (default: # CPUs)",
+    )
+    argparser.add_argument(
+        "--no-convert",
+        dest="convert",
+        action="store_false",
+        help="Only parse; don't convert to ofxtools.models",
+    )
+    argparser.add_argument(
+        "-u",
+        "--unordered",
+        action="store_true",
+        help="Report files as they're done, not in input order",
+    )
+    return argparser
+
+
+def main() -> None:
+    args = make_argparser().parse_args()
+    parse = iparse_many_unordered if args.unordered else iparse_many
+    failed = 0
+    for result in parse(find_files(args.paths), args.workers, args.convert):
+        if result.error is None:
+            print(f"{result.path}: {result.ofx!r}")
+        else:
+            failed += 1
+            error = result.error
+            print(f"{result.path}: {error.__class__.__name__}: {error}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
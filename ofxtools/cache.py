@@ -0,0 +1,178 @@
+# coding: utf-8
+"""
+On-disk cache of parsed & converted OFX files.
+
+    >>> from ofxtools.Parser import OFXTree
+    >>> from ofxtools.cache import DiskCache
+    >>> cache = DiskCache()
+    >>> tree = OFXTree()
+    >>> tree.parse('2015-09_amtd.ofx', cache=cache)
+    >>> ofx = tree.convert()  # Loaded from the cache, if seen before
+
+Entries are keyed by a hash of the raw OFX file contents together with the
+``ofxtools`` version (since pickled ``ofxtools.models`` are only good for the
+version that pickled them - cf. ``Aggregate.__getstate__()``).
+"""
+
+__all__ = ["CacheEntry", "DiskCache"]
+
+
+# stdlib imports
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+# local imports
+from ofxtools import config
+from ofxtools.__version__ import __version__
+from ofxtools.header import OFXHeaderType
+from ofxtools.models.base import Aggregate
+from ofxtools.Types import CacheInfo
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry(NamedTuple):
+    header: OFXHeaderType
+    ofx: Aggregate
+
+
+class DiskCache:
+    """
+    Directory of pickled ``CacheEntry`` files (by default, under
+    ``config.DATADIR``), one per key.
+
+    The total size of the files is bounded by ``maxsize`` (in bytes); the least
+    recently used entries are evicted to make room.
+
+    Writes are atomic (written to a temporary file, then renamed), so the cache
+    may be shared by concurrent processes; each counts its own hits & misses,
+    reported by ``info()``.  Unreadable entries count as misses.
+    """
+
+    suffix = ".pickle"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, maxsize: int = 1 << 28):
+        if path is None:
+            path = config.DATADIR / "cache"
+        self.path = Path(path)
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be nonnegative, not {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        #  Estimated total size of entries; None until scanned
+        self._currsize: Optional[int] = None
+
+    def key(self, data: bytes) -> str:
+        """Cache key for raw OFX data"""
+        digest = hashlib.sha256(__version__.encode())
+        digest.update(b"\0")
+        digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry cached under ``key``, or None"""
+        path = self._entrypath(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as err:
+            logger.warning(f"Discarding unreadable cache entry {path}: {err}")
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        try:
+            #  Mark as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            #  Evicted by another process
+            pass
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Cache ``entry`` under ``key``"""
+        data = pickle.dumps(CacheEntry(*entry), protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.maxsize:
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        fd, tmpname = tempfile.mkstemp(dir=self.path, prefix=".tmp-")
+        try:
+            with open(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmpname, self._entrypath(key))
+        except BaseException:
+            self._remove(Path(tmpname))
+            raise
+
+        if self._currsize is None:
+            self._currsize = sum(size for path, size, mtime in self._scan())
+        else:
+            self._currsize += len(data)
+        if self._currsize > self.maxsize:
+            self._evict()
+
+    def info(self) -> CacheInfo:
+        currsize = sum(size for path, size, mtime in self._scan())
+        self._currsize = currsize
+        return CacheInfo(self.hits, self.misses, self.maxsize, currsize)
+
+    def clear(self) -> None:
+        """Delete all entries & reset statistics"""
+        for path, size, mtime in self._scan():
+            self._remove(path)
+        self._currsize = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _entrypath(self, key: str) -> Path:
+        return self.path / f"{key}{self.suffix}"
+
+    def _scan(self) -> List[Tuple[Path, int, float]]:
+        """Return (path, size, mtime) of each entry"""
+        entries: List[Tuple[Path, int, float]] = []
+        try:
+            direntries = list(os.scandir(self.path))
+        except FileNotFoundError:
+            return entries
+        for direntry in direntries:
+            if not direntry.name.endswith(self.suffix):
+                continue
+            try:
+                stat = direntry.stat()
+            except FileNotFoundError:
+                #  Evicted by another process
+                continue
+            entries.append((Path(direntry.path), stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until within ``maxsize``"""
+        entries = sorted(self._scan(), key=lambda entry: entry[2])
+        currsize = sum(size for path, size, mtime in entries)
+        for path, size, mtime in entries:
+            if currsize <= self.maxsize:
+                break
+            self._remove(path)
+            currsize -= size
+        self._currsize = currsize
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.path} {self.info()}>"
@@ -11,7 +11,9 @@ constructs class instances from strings, which is used in deserialization.
 
 This module provides the `parse_header()` function, which demarcates message
 header from message body in serialized OFX data, and processes the header
-portion.  See `ofxtools.Parser` for the rest of it.
+portion.  See `ofxtools.Parser` for the rest of it.  `read_header()` does the
+same while consuming only a bounded prefix of the source, leaving the message
+body to be read (and parsed) incrementally.
 
 Also provided is the `make_header()` utility function, which routes to the
 appropriate header class based on OFX version #.  It's used by
@@ -24,6 +26,7 @@ __all__ = [
     "OFXHeaderV1",
     "OFXHeaderV2",
     "parse_header",
+    "read_header",
     "make_header",
 ]
 
@@ -31,7 +34,8 @@ __all__ = [
 # stdlib imports
 import re
 import logging
-from typing import Tuple, Union, Optional, BinaryIO, Pattern, Any
+import mmap
+from typing import Tuple, Union, Optional, BinaryIO, Pattern, Any, Callable
 
 
 # local imports
@@ -255,57 +259,96 @@ def parse_header(source: BinaryIO) -> Tuple[OFXHeaderType, str]:
 
     Using header, locate/read/decode (but do not parse) OFX data body.
 
+    The header is parsed from a bounded prefix of source (cf. ``read_header()``),
+    after which the rest of source is read in one pass - there's no rewinding,
+    so source needn't be seekable (e.g. an HTTP response or a pipe).
+
     Returns a 2-tuple of:
         * instance of OFXHeaderV1/OFXHeaderV2 containing parsed data, and
         * decoded text of OFX data body
     """
     logger.info("Parsing OFX header")
+    header, prefix = read_header(source)
+
+    #  Decode the OFX data body according to the encoding declared
+    #  in the OFX header
+    message = (prefix + source.read()).decode(header.codec)
+
+    return header, message.strip()
+
+
+#  ``read_header()`` reads the source in blocks of this size, and gives up looking
+#  for the end of the OFX header after reading HEADER_MAXSIZE bytes.
+HEADER_BLOCKSIZE = 1024
+HEADER_MAXSIZE = 64 * 1024
+
+
+def _find_end_v1(data: bytes) -> int:
+    """OFXv1 header ends at the first tag of the SGML data body"""
+    start = data.find(b"NEWFILEUID")
+    return -1 if start < 0 else data.find(b"<", start)
+
+
+def _find_end_v2(data: bytes) -> int:
+    """OFXv2 header ends with the OFX declaration"""
+    start = data.find(b"<?OFX")
+    end = -1 if start < 0 else data.find(b"?>", start)
+    return -1 if end < 0 else end + 2
 
-    # Skip any empty lines at the beginning
-    while True:
-        # OFX header is read by nice clean machines, not meatbags -
-        # should not contain 💩, 漢字, or what have you.
-        line = source.readline().decode("ascii")
-        if line.strip():
-            break
-
-    # If the first non-empty line contains an XML declaration, it's OFX v2
-    xml_match = XML_REGEX.match(line)
-    if xml_match:
+
+def read_header(source: Union[BinaryIO, mmap.mmap]) -> Tuple[OFXHeaderType, bytes]:
+    """
+    Consume only as much of source as needed to find the end of the OFX header;
+    feed it to appropriate class constructor which performs validation/type
+    conversion on OFX header.
+
+    Doesn't require a seekable source; the rest of the OFX data body may be read
+    from source after this function returns.  Source may also be a memory map,
+    read from its current position.
+
+    Returns a 2-tuple of:
+        * instance of OFXHeaderV1/OFXHeaderV2 containing parsed data, and
+        * raw (undecoded) start of OFX data body that was read past the header
+    """
+    logger.info("Reading OFX header")
+
+    prefix = b""
+
+    def read_until(predicate: Callable[[bytes], bool]) -> None:
+        """Read blocks into prefix until predicate is true, or source is exhausted"""
+        nonlocal prefix
+        while not predicate(prefix):
+            if len(prefix) >= HEADER_MAXSIZE:
+                raise OFXHeaderError(f"Can't find end of OFX header:\n{prefix!r}")
+            block = source.read(HEADER_BLOCKSIZE)
+            if not block:
+                return
+            prefix += block
+
+    # Skip any whitespace at the beginning; we need to see enough of what follows
+    # to recognize an XML declaration.
+    read_until(lambda data: len(data.lstrip()) >= len(b"<?xml"))
+    prefix = prefix.lstrip()
+
+    if prefix.startswith(b"<?xml"):
         logger.debug("Found XML declaration - OFX version 2")
-        # OFXv2 spec doesn't require newlines between XML declaration;
-        # OFX declaration, and data elements; ``line`` may or may not
-        # contain the latter two.
-        #
-        # Just rewind, read the whole file (it must be UTF-8 encoded per
-        # the spec) and slice the OFX data body from the end of the
-        # OFX declaration
-        source.seek(0)
-        decoded_source = source.read().decode(OFXHeaderV2.codec)
-        header, header_end_index = OFXHeaderV2.parse(decoded_source)
-        message = decoded_source[header_end_index:]
+        HeaderClass: Any = OFXHeaderV2
+        find_end = _find_end_v2
     else:
         logger.debug("No XML declaration - OFX version 1")
-        rawheader = line + "\n"
-        # First line is OFXHEADER; need to read next 8 lines for a fixed
-        # total of 9 fields required by OFX v1 spec.
-        for n in range(8):
-            rawheader += source.readline().decode("ascii")
-        header, header_end_index = OFXHeaderV1.parse(rawheader)
-
-        #  Input source stream position should have advanced to the beginning of
-        #  the OFX body tag soup, which is where subsequent calls
-        #  to read()/readlines() will pick up.
-        #
-        #  The seek call will correct the position when \r newline character is used
-        #  (Issue #84)
-        source.seek(header_end_index)
-
-        #  Decode the OFX data body according to the encoding declared
-        #  in the OFX header
-        message = source.read().decode(header.codec)
-
-    return header, message.strip()
+        HeaderClass = OFXHeaderV1
+        find_end = _find_end_v1
+
+    read_until(lambda data: find_end(data) >= 0)
+    header_end = find_end(prefix)
+    if header_end < 0:
+        header_end = len(prefix)
+
+    # OFX header is read by nice clean machines, not meatbags -
+    # should not contain 💩, 漢字, or what have you.
+    rawheader = prefix[:header_end].decode("ascii")
+    header, header_end_index = HeaderClass.parse(rawheader)
+    return header, prefix[header_end_index:]
 
 
 def make_header(
@@ -241,6 +241,9 @@ class BALLIST(Aggregate):
 class STMTRS(Aggregate):
     """OFX section 11.4.2.2"""
 
+    # Wrapper TRNUID & CLTCOOKIE, stapled on by ``*MSGSRSV1.statements``
+    __slots__ = ("trnuid", "cltcookie")
+
     curdef = OneOf(*CURRENCY_CODES, required=True)
     bankacctfrom = SubAggregate(BANKACCTFROM, required=True)
     banktranlist = SubAggregate(BANKTRANLIST)
@@ -301,6 +304,9 @@ class CCSTMTRQ(Aggregate):
 class CCSTMTRS(Aggregate):
     """OFX section 11.4.3.2"""
 
+    # Wrapper TRNUID & CLTCOOKIE, stapled on by ``*MSGSRSV1.statements``
+    __slots__ = ("trnuid", "cltcookie")
+
     curdef = OneOf(*CURRENCY_CODES, required=True)
     ccacctfrom = SubAggregate(CCACCTFROM, required=True)
     banktranlist = SubAggregate(BANKTRANLIST)
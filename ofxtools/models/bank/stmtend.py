@@ -68,6 +68,9 @@ class STMTENDRQ(Aggregate):
 class STMTENDRS(Aggregate):
     """OFX section 11.5.2"""
 
+    # Wrapper TRNUID & CLTCOOKIE, stapled on by ``*MSGSRSV1.statements``
+    __slots__ = ("trnuid", "cltcookie")
+
     curdef = OneOf(*CURRENCY_CODES, required=True)
     bankacctfrom = SubAggregate(BANKACCTFROM, required=True)
     closing = ListAggregate(CLOSING)
@@ -138,6 +141,9 @@ class CCSTMTENDRQ(Aggregate):
 class CCSTMTENDRS(Aggregate):
     """OFX section 11.5.4"""
 
+    # Wrapper TRNUID & CLTCOOKIE, stapled on by ``*MSGSRSV1.statements``
+    __slots__ = ("trnuid", "cltcookie")
+
     curdef = OneOf(*CURRENCY_CODES, required=True)
     ccacctfrom = SubAggregate(CCACCTFROM, required=True)
     ccclosing = ListAggregate(CCCLOSING)
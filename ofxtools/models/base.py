@@ -13,21 +13,26 @@ by the ``Types.SubAggregate`` and ``ListAggregate`` classes) and/or data-bearing
 "Elements", i.e. leaf nodes, which are defined in ``ofxtools.Types``.
 
 Names of all Aggregate classes must be ALL CAPS, following the convention of
-the OFX spec, to be found in the package namespace by
-``Aggregate.from_etree()`` which is called by the ``ofxtools.Parser``.
+the OFX spec; each class is registered under its name as the OFX tag it converts,
+to be found by ``Aggregate.from_etree()`` which is called by the ``ofxtools.Parser``.
+Cf. ``Aggregate.register()`` for handling other tags.
 """
 
 
-__all__ = ["Aggregate", "ElementList"]
+__all__ = ["Aggregate", "ElementList", "AggregateSchema"]
 
 
 # stdlib imports
-import xml.etree.ElementTree as ET
-from copy import deepcopy
+import copyreg
 import functools
+import inspect
+import xml.etree.ElementTree as ET
+from types import MappingProxyType
 from typing import (
     Any,
+    BinaryIO,
     Dict,
+    List,
     Tuple,
     Callable,
     Sequence,
@@ -35,6 +40,9 @@ from typing import (
     Union,
     Optional,
     ChainMap,
+    Type,
+    NamedTuple,
+    FrozenSet,
 )
 import logging
 import warnings
@@ -42,9 +50,8 @@ import warnings
 
 # local imports
 from ofxtools import Types
-
-import ofxtools.models
-from ofxtools.utils import classproperty
+from ofxtools.header import make_header
+from ofxtools.utils import classproperty, _Output, _write_leaf
 
 
 logger = logging.getLogger(__name__)
@@ -74,12 +81,80 @@ class UnknownTagWarning(OFXAggregateWarning):
     """
 
 
-class Aggregate(list):
+class AggregateSchema(NamedTuple):
+    """
+    Class attribute metadata of an ``Aggregate`` subclass.
+
+    Computed once per class when it's created (by ``Aggregate.__init_subclass__()``)
+    and stored as ``cls._schema``, so that conversion & instantiation don't need
+    to walk the MRO for every Element they handle.
+
+    Mappings are read-only, and ordered like ``Aggregate.spec``; their values
+    are the ``Types.Element`` / ``Types.Unsupported`` instances that convert
+    each attribute.
+    """
+
+    spec: Mapping[str, Union[Types.Element, Types.Unsupported]]
+    spec_no_listaggregates: Mapping[str, Union[Types.Element, Types.Unsupported]]
+    elements: Mapping[str, Types.Element]
+    subaggregates: Mapping[str, Types.SubAggregate]
+    unsupported: Mapping[str, Types.Unsupported]
+    listaggregates: Mapping[str, Union[Types.ListAggregate, Types.ListElement]]
+    listelements: Mapping[str, Types.ListElement]
+    # Position of each attribute name within ``spec``
+    positions: Mapping[str, int]
+    # Names of ListAggregates & ListElements
+    listmembers: FrozenSet[str]
+    # Lower-cased OFX tag -> (attribute name, index, is_listmember, is_unsupported)
+    tags: Mapping[str, Tuple[str, int, bool, bool]]
+    # Attribute name -> OFX tag
+    tagnames: Mapping[str, str]
+
+
+class _AggregateMeta(type):
+    """
+    Give each ``Aggregate`` subclass empty ``__slots__`` unless it declares its
+    own, so that subclass instances don't get a ``__dict__`` either.
+
+    Mixins for ``Aggregate`` subclasses (e.g. ``models.i18n.Origcurrency``)
+    aren't created by this metaclass, and must declare ``__slots__ = ()``
+    themselves.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class Aggregate(list, metaclass=_AggregateMeta):
     """
     Base class for Python representation of OFX 'aggregate', i.e. SGML/XML
     parent node that is empty of data text.
     """
 
+    # Values of ``Types.Element`` attributes, indexed like ``spec``, instead of
+    # a ``__dict__`` entry apiece; cf. ``Types.Element.__get__()``.
+    # Unsupported attributes & list members take up a (null) position as well.
+    #
+    # ``_lazy`` is only set on instances created by ``_convert_lazy()``; it holds
+    # the ``ET.Element`` until ``_scan()`` sorts its children into a dict of
+    # pending values.
+    #
+    # ``__weakref__`` keeps instances weakly referenceable, as they were before
+    # ``__slots__``; it costs a single pointer apiece.
+    __slots__ = ("_values", "_lazy", "__weakref__")
+    _values: List[Any]
+    _lazy: Union[ET.Element, Dict[str, Any]]
+
+    # Class attribute metadata; cf. ``AggregateSchema`` above.
+    _schema: AggregateSchema
+
+    # Aggregate subclasses by OFX tag, for ``from_etree()``; cf. ``register()``.
+    _registry: Dict[str, Type["Aggregate"]] = {}
+
+    # OFX tag for ``to_etree()``
+    _tag: str = "Aggregate"
+
     # Validation constraints used by ``validate_args()``.
 
     # Aggregate MAY have at most child from  `optionalMutexes``
@@ -88,15 +163,40 @@ class Aggregate(list):
     # Aggregate MUST contain exactly one child from ``requiredMutexes``
     requiredMutexes: Sequence[Sequence[str]] = []
 
+    # OFX tags whose attribute names differ, e.g. {"YIELD": "yld"} where the
+    # OFX tag is a Python reserved word.
+    tagAliases: Mapping[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Precompute the class ``AggregateSchema``.
+
+        N.B. class attributes defining the spec must be in place when the class
+        is created; Elements assigned to the class afterward won't be picked up.
+        """
+        super().__init_subclass__(**kwargs)
+        for hook in ("groom", "ungroom"):
+            if hook in cls.__dict__:
+                msg = (
+                    f"{cls.__name__}.{hook}() is deprecated; "
+                    "declare tagAliases instead"
+                )
+                # Point at the class statement, past ``_AggregateMeta.__new__()``
+                warnings.warn(msg, category=DeprecationWarning, stacklevel=3)
+        cls._schema = cls._build_schema()
+        cls._tag = cls.__name__
+        Aggregate._registry.setdefault(cls._tag, cls)
+
     def __init__(self, *args, **kwargs):
         """
         Positional args interepreted as list items (of variable #).
         kwargs interpreted as singular sub-elements.
         """
         list.__init__(self)
+        self._values = [None] * len(self._schema.spec)
         self.validate_args(*args, **kwargs)
 
-        for attr in self.spec_no_listaggregates:
+        for attr in self._schema.spec_no_listaggregates:
             value = kwargs.pop(attr, None)
             try:
                 # If attr is an element (i.e. its class is defined in
@@ -164,7 +264,7 @@ class Aggregate(list):
             if isinstance(member, Aggregate):
                 # ListAggregate - validate type against spec
                 arg = member.__class__.__name__.lower()
-                if arg not in self.listaggregates:
+                if arg not in self._schema.listaggregates:
                     msg = f"{clsnm} can't contain {arg} as list item: {member}"
                     raise TypeError(msg)
             else:
@@ -181,42 +281,101 @@ class Aggregate(list):
     def _apply_residual_kwargs(self, **kwargs) -> None:
         # Check that all kwargs have been consumed
         if kwargs:
-            args = [
-                k
-                for k in kwargs.keys()
-                if k in self.listaggregates or k in self.listelements
-            ]
+            schema = self._schema
+            args = [k for k in kwargs.keys() if k in schema.listmembers]
             if args:
                 msg = f"{args}: pass list members as args, not kwargs"
                 raise SyntaxError(msg)
             else:
                 cls = self.__class__.__name__
                 kw = str(list(kwargs.keys()))
-                spc = str(list(self.spec.keys()))
+                spc = str(list(schema.spec.keys()))
                 msg = f"Aggregate {cls} does not define {kw} (spec={spc})"
                 raise OFXSpecError(msg)
 
     @classmethod
-    def from_etree(cls, elem: ET.Element) -> "Aggregate":
+    def _from_trusted(cls, *args, **values) -> "Aggregate":
+        """
+        Instantiate from values that are known to be valid, e.g. taken from
+        instances converted previously and stored in a cache or database.
+
+        Like ``__init__()``, except that values are assigned as they are, without
+        validation or type conversion; they must therefore already be of the
+        types that ``__init__()`` would convert them to.
+        """
+        instance = cls.__new__(cls)
+        instance._values = slots = [None] * len(cls._schema.spec)
+        positions = cls._schema.positions
+        for attr, value in values.items():
+            slots[positions[attr]] = value
+        list.extend(instance, args)
+        return instance
+
+    @classmethod
+    def from_etree(
+        cls, elem: ET.Element, lazy: bool = False, validate: bool = True
+    ) -> "Aggregate":
         """
         Instantiate from ``xml.etree.ElementTree.Element``.
 
         Look up `Aggregate`` subclass corresponding to ``ET.Element.tag``
         and pass to the subclass ``_convert()``, which actually perfoms the
         instantiation.
+
+        If ``lazy`` is true, instead return an instance that holds onto ``elem``
+        and converts (and validates) its contents piecemeal, as they're accessed;
+        cf. ``_convert_lazy()``.
+
+        If ``validate`` is false, skip checking the contents against the OFX
+        spec, beyond converting Elements to their types; cf. ``_convert_unvalidated()``.
         """
         if not isinstance(elem, ET.Element):
             msg = f"Bad type {type(elem)} - should be xml.etree.ElementTree.Element"
             raise TypeError(msg)
-        try:
-            SubClass = getattr(ofxtools.models, elem.tag)
-        except AttributeError:
-            raise OFXSpecError(f"ofxtools.models doesn't define {elem.tag}")
+        SubClass = cls._lookup_class(elem.tag)
 
         logger.info(f"Converting <{elem.tag}> to {SubClass.__name__}")
+        if lazy:
+            if not validate:
+                raise ValueError("Lazy conversion can't skip validation")
+            return SubClass._convert_lazy(elem)
+        if not validate:
+            return SubClass._convert_unvalidated(elem)
         instance = SubClass._convert(elem)
         return instance
 
+    @classmethod
+    def register(cls, tag: Optional[str] = None) -> Type["Aggregate"]:
+        """
+        Convert Elements tagged *tag* (by default, the class name) to this class,
+        in place of any class previously registered for the tag.
+
+        Every ``Aggregate`` subclass is registered under its own name when it's
+        defined, unless that's already taken (e.g. by the class in ``ofxtools.models``).
+        Call this to override such a class, or to handle an extension tag that
+        isn't a valid class name, e.g. ``INTUXXX.register("INTU.XXX")``.
+        The class then uses *tag* in ``to_etree()`` as well.
+
+        N.B. to get converted, an extension tag must also be defined by the
+        spec of its parent aggregate, e.g. by subclassing the parent with
+        ``intuxxx = SubAggregate(INTUXXX)`` & ``tagAliases = {"INTU.XXX": "intuxxx"}``
+        and registering that subclass in turn.
+
+        Returns the class.
+        """
+        tag = tag or cls.__name__
+        Aggregate._registry[tag] = cls
+        cls._tag = tag
+        return cls
+
+    @staticmethod
+    def _lookup_class(tag: str) -> Type["Aggregate"]:
+        """Look up ``Aggregate`` subclass registered for an OFX tag"""
+        try:
+            return Aggregate._registry[tag]
+        except KeyError:
+            raise OFXSpecError(f"ofxtools.models doesn't define {tag}")
+
     @classmethod
     def _convert(cls, elem: ET.Element) -> "Aggregate":
         """Instantiate from ``xml.etree.ElementTree.Element``.
@@ -227,71 +386,102 @@ class Aggregate(list):
         if len(elem) == 0:
             return cls()
 
-        # Hook to modify incoming ``ET.Element`` before conversion
-        elem = cls.groom(elem)
-
-        clsnm = cls.__name__
-        spec = list(cls.spec)
-        listaggregates = cls.listaggregates
-        listelements = cls.listelements
-
-        #  Type alias - accumulator for functools.reduce()
-        Accum = Tuple[list, dict, int, bool]
-        " args, kwargs, previous attr index within spec, previous attr is list member? "
-
-        def update_args(accum: Accum, elem: ET.Element) -> Accum:
-            """Extend ``functools.reduce()`` accumulator with parsed ``ET.Element``
-            value (either OFX `aggregate` or OFX 'element').
-
-            List members are stored as positional args (i.e. list); everything
-            else is stored as keyword args (i.e. dict).
-
-            Check index within the ``Aggregate.spec`` sequence against previous
-            ``ET.Element`` and return sequencing info for current ``ET.Element``
-            to be used in the next iteration.
-            """
-            args, kwargs, prev_index, prev_is_listmember = accum
-            attrname = elem.tag.lower()
-
-            #  OFX messages have a sequence order defined by the spec.  This order maps
-            #  to the order of class attributes defined by ``Aggregate`` subclasses.
-            #  Cf. discussion of ordering above in the docstring for ``_filter_attrs()``.
-            #
-            #  Class attributes defined as list members (i.e. ListAggregate / ListElement,
-            #  identified as "one or more" or "zero or more" in the OFX spec) may
-            #  occur in any order, so we don't validate the relative order of list
-            #  members.  Other than, we require that the index of an attribute within
-            #  the ``Aggregate.spec`` sequence must increase monotonically.
-            try:
-                index = spec.index(attrname)
-            except ValueError:
-                #  raise OFXSpecError(f"{clsnm}.spec = {spec}; doesn't contain {attrname}")
-                msg = (
-                    f"While parsing {clsnm}, encountered unknown tag {elem.tag}; "
-                    "skipping."
-                )
-                warnings.warn(msg, category=UnknownTagWarning)
-                return accum
+        args, kwargs = cls._parse_children(elem)
+        return cls(*args, **kwargs)
 
-            is_listmember = attrname in listaggregates or attrname in listelements
-            if index <= prev_index and not (is_listmember and prev_is_listmember):
-                msg = (
-                    f"Elements out of order: According to the class spec for {clsnm}, "
-                    f"{attrname.upper()} should occur before "
-                    f"{spec[prev_index].upper()}, not after it."
-                )
-                raise OFXSpecError(msg)
+    @classmethod
+    def _convert_unvalidated(cls, elem: ET.Element) -> "Aggregate":
+        """
+        Instantiate from ``xml.etree.ElementTree.Element``, like ``_convert()``,
+        but without validation; cf. ``_from_parsed()``.
+        """
+        if len(elem) == 0:
+            return cls._from_trusted()
+
+        args, kwargs = cls._parse_children(elem, validate=False)
+        return cls._from_parsed(args, kwargs)
+
+    @classmethod
+    def _from_parsed(cls, args: list, kwargs: Dict[str, Any]) -> "Aggregate":
+        """
+        Instantiate from args/kwargs as sorted by ``_parse_children()``, skipping
+        the checks made by ``__init__()`` - i.e. ``validate_args()``, the types of
+        list members, and missing required Elements.  Element text still needs
+        type conversion, which still rejects malformed values.
+        """
+        spec = cls._schema.spec
+        for attr, value in kwargs.items():
+            converter = spec[attr]
+            #  Unsupported attributes are always None, never str.
+            if value.__class__ is str and isinstance(converter, Types.Element):
+                try:
+                    kwargs[attr] = converter._str_converter(value)
+                except ValueError as exc:
+                    # Same as ``__init__()``
+                    msg = exc.args[0]
+                    raise type(exc)(
+                        f"Can't set {cls.__name__}.{attr} to {value}: {msg}"
+                    )
+        if cls._schema.listelements:
+            (converter,) = cls._schema.listelements.values()
+            args = [converter.convert(member) for member in args]
+        return cls._from_trusted(*args, **kwargs)
+
+    @classmethod
+    def _parse_children(
+        cls, elem: ET.Element, lazy: bool = False, validate: bool = True
+    ) -> Tuple[list, Dict[str, Any]]:
+        """
+        Sort the children of ``xml.etree.ElementTree.Element`` into args for
+        ``__init__()``, i.e. list members (positional args) and everything else
+        (keyword args); child Aggregates are converted recursively.
+
+        If ``lazy`` is true, child Aggregates are converted with ``lazy=True``,
+        except for non-list members, which are passed through unconverted.
+        ``validate`` is likewise passed on to child Aggregates.
+        """
+        # Deprecated hook to modify incoming ``ET.Element`` before conversion
+        if cls.groom is not Aggregate.groom:
+            elem = cls.groom(elem)
+
+        lookup_tag = cls._lookup_tag
+
+        #  List members are stored as positional args (i.e. list); everything
+        #  else is stored as keyword args (i.e. dict).
+        args: list = []
+        kwargs: dict = {}
+
+        #  Index within ``Aggregate.spec`` of previous attr; previous attr is list member?
+        prev_index = -1
+        prev_is_listmember = False
+
+        #  ElementTree API: child Elements stored as a sequence, accessible
+        #  by iterating over the parent Element.
+        #  https://effbot.org/zone/pythondoc-elementtree-ElementTree.htm#elementtree.ElementTree._ElementInterface-class
+        #
+        #  ``_lookup_tag()`` applies ``tagAliases`` and skips extended tags
+        #  (e.g. INTU.XXX) as we go, leaving the input ``ET.Element`` untouched.
+        for child in elem:
+            location = lookup_tag(child.tag, prev_index, prev_is_listmember)
+            if location is None:
+                continue
+            attrname, index, is_listmember, is_unsupported = location
 
             # Parse attribute value
-            if attrname in cls.unsupported:
-                value: Optional[Union[str, Aggregate]] = None
-            elif elem.text:
+            if is_unsupported:
+                value: Optional[Union[str, Aggregate, ET.Element]] = None
+            elif child.text:
                 # Element - extract as string; value will be type-converted upon
                 # instance initialization by ``ofxtools.Types.Element.__set__()``.
-                value = elem.text
-            else:
+                value = child.text
+            elif not lazy:
                 # Aggregate - recurse
-                value = Aggregate.from_etree(elem)
+                value = Aggregate.from_etree(child, validate=validate)
+            elif is_listmember:
+                value = Aggregate.from_etree(child, lazy=True)
+            else:
+                # SubAggregate - left for ``_materialize()``
+                value = child
 
             # Append attr value to args (list members) or kwargs (everything else)
             if is_listmember:
@@ -301,34 +491,142 @@ class Aggregate(list):
                     raise OFXSpecError
                 kwargs[attrname] = value
 
-            return args, kwargs, index, is_listmember
+            prev_index = index
+            prev_is_listmember = is_listmember
 
-        #  ElementTree API: child Elements stored as a sequence, accessible
-        #  by iterating over the parent Element.
-        #  https://effbot.org/zone/pythondoc-elementtree-ElementTree.htm#elementtree.ElementTree._ElementInterface-class
-        initial: Accum = ([], {}, -1, False)
-        args, kwargs = functools.reduce(update_args, elem, initial)[:2]
-        return cls(*args, **kwargs)
+        return args, kwargs
+
+    @classmethod
+    def _convert_lazy(cls, elem: ET.Element) -> "Aggregate":
+        """
+        Instantiate from ``xml.etree.ElementTree.Element`` without converting
+        its contents.
+
+        The instance keeps ``elem`` and defers work until it's needed.  Upon
+        first access to an attribute (cf. ``Types.Element.__get__()``), children
+        of ``elem`` are sorted & validated as by ``_convert()``, and the requested
+        attribute is type-converted (or, for SubAggregates, lazily instantiated)
+        and cached; other attributes are left for their own first access.
+
+        Since ``Aggregate`` is a list, which can't defer its contents, list
+        members are instantiated (lazily) up front.
+        """
+        schema = cls._schema
+        values = [Types.UNSET] * len(schema.spec)
+        #  Unsupported attributes are never set (cf. ``Types.Unsupported``), so
+        #  they'd never be materialized either.
+        for attr in schema.unsupported:
+            values[schema.positions[attr]] = None
+
+        instance = cls.__new__(cls)
+        instance._values = values
+        instance._lazy = elem
+        if cls._schema.listmembers:
+            instance._scan()
+        return instance
+
+    def _scan(self) -> Dict[str, Any]:
+        """
+        Return attributes of a lazily converted instance that haven't yet been
+        converted, as a mapping of attribute name to unconverted value
+        (``str``, ``ET.Element``, or None).
+
+        On first call, sort the children of the ``ET.Element`` wrapped by
+        ``_convert_lazy()``, and validate & store the list members.
+        """
+        pending = self._lazy
+        if isinstance(pending, ET.Element):
+            cls = self.__class__
+            args, pending = cls._parse_children(pending, lazy=True)
+            cls.validate_args(*args, **pending)
+            self._apply_args(*args)
+            self._lazy = pending
+        return pending
+
+    def _materialize(self, attr: str) -> Any:
+        """
+        Convert & cache the value of an attribute of a lazily converted instance.
+
+        Called by ``Types.Element.__get__()`` for attributes that haven't been set.
+        """
+        if attr not in self._schema.spec_no_listaggregates:
+            # List members are held in the list proper
+            self._values[self._schema.positions[attr]] = None
+            return None
+
+        value = self._scan().pop(attr, None)
+        if isinstance(value, ET.Element):
+            value = Aggregate.from_etree(value, lazy=True)
+
+        try:
+            setattr(self, attr, value)
+        except ValueError as exc:
+            cls = self.__class__.__name__
+            msg = exc.args[0]
+            raise type(exc)(f"Can't set {cls}.{attr} to {value}: {msg}")
+
+        return self._values[self._schema.positions[attr]]
+
+    @classmethod
+    def _lookup_tag(
+        cls, tag: str, prev_index: int, prev_is_listmember: bool
+    ) -> Optional[Tuple[str, int, bool, bool]]:
+        """
+        Locate a child Element tag within the class spec, given the location of
+        the previous child, returning (attribute name, index within spec,
+        is list member?, is Unsupported?).
+
+        Return None for tags that should be skipped: extended tags (e.g. INTU.XXX)
+        and tags not in the spec (which latter also emits a warning).
+        """
+        try:
+            location = cls._schema.tags[tag.lower()]
+        except KeyError:
+            if "." in tag:
+                logger.debug(f"Skipping extended tag <{tag}>")
+                return None
+            #  raise OFXSpecError(f"{clsnm}.spec = {spec}; doesn't contain {attrname}")
+            msg = (
+                f"While parsing {cls.__name__}, encountered unknown tag {tag}; "
+                "skipping."
+            )
+            warnings.warn(msg, category=UnknownTagWarning)
+            return None
+
+        #  OFX messages have a sequence order defined by the spec.  This order maps
+        #  to the order of class attributes defined by ``Aggregate`` subclasses.
+        #  Cf. discussion of ordering above in the docstring for ``_filter_attrs()``.
+        #
+        #  Class attributes defined as list members (i.e. ListAggregate / ListElement,
+        #  identified as "one or more" or "zero or more" in the OFX spec) may
+        #  occur in any order, so we don't validate the relative order of list
+        #  members.  Other than, we require that the index of an attribute within
+        #  the ``Aggregate.spec`` sequence must increase monotonically.
+        attrname, index, is_listmember, is_unsupported = location
+        if index <= prev_index and not (is_listmember and prev_is_listmember):
+            prev_attrname = list(cls._schema.spec)[prev_index]
+            msg = (
+                f"Elements out of order: According to the class spec for "
+                f"{cls.__name__}, {tag.upper()} should occur before "
+                f"{cls._schema.tagnames[prev_attrname]}, not after it."
+            )
+            raise OFXSpecError(msg)
+
+        return location
 
     @staticmethod
     def groom(elem: ET.Element) -> ET.Element:
         """
         Modify incoming ``ET.Element`` to play nice with our Python schema.
 
-        Default action is to remove extended tags, e.g. INTU.XXX
-
-        Extend in subclass.
+        Deprecated - ``_convert()`` itself skips extended tags (e.g. INTU.XXX)
+        and applies ``tagAliases``, so the default action is to return it
+        unchanged.  Overrides are still called by ``from_etree()``, but not by
+        ``OFXTree.parse_models()``, which builds no ``ET.Element``.
 
         N.B. make sure to perform modifications on a copy.deepcopy(), in order
         to keep the input free of side effects!
         """
-        elem = deepcopy(elem)
-
-        for child in set(elem):
-            if "." in child.tag:
-                logger.debug(f"Removing extended tag <{child.tag}>")
-                elem.remove(child)
-
         return elem
 
     def to_etree(self) -> ET.Element:
@@ -336,10 +634,11 @@ class Aggregate(list):
         Convert self and children to `ElementTree.Element` hierarchy
         """
         cls = self.__class__
-        root = ET.Element(cls.__name__)
+        root = ET.Element(cls._tag)
+        tagnames = cls._schema.tagnames
         do_list = True  # HACK
 
-        for attr, type_ in self.spec.items():
+        for attr, type_ in cls._schema.spec.items():
             if isinstance(type_, (Types.ListAggregate, Types.ListElement)):
                 # HACK - the assumption here is that all list members
                 # occur immediately adjacent to each other in the class
@@ -358,22 +657,128 @@ class Aggregate(list):
                     child = value.to_etree()
                     root.append(child)
                 else:
-                    converter = cls._superdict[attr]
-                    text = converter.unconvert(value)
-                    ET.SubElement(root, attr.upper()).text = text
+                    #  Unsupported attributes are always None
+                    assert isinstance(type_, Types.Element)
+                    text = type_.unconvert(value)
+                    ET.SubElement(root, tagnames[attr]).text = text
 
-        # Hook to modify `ET.ElementTree` after conversion
+        # Deprecated hook to modify `ET.ElementTree` after conversion
         return cls.ungroom(root)
 
     def _listAppend(self, root: ET.Element, member) -> None:
         root.append(member.to_etree())
 
+    def write(
+        self,
+        fp: BinaryIO,
+        version: Optional[int] = None,
+        prettyprint: bool = False,
+        close_elements: bool = True,
+    ) -> None:
+        """
+        Serialize self and children as OFX markup, encoded as UTF-8, to a
+        binary file object.
+
+        The output is the same as ``ET.tostring(method="html")`` of
+        ``to_etree()`` (indented by ``utils.indent()`` if ``prettyprint``),
+        but written straight from the models, a transaction list at a time,
+        without building the Element tree.
+
+        If ``version`` is given, write the OFX header for it first.
+        Unless ``close_elements``, data-bearing elements are left unclosed,
+        SGML-style - which only OFXv1 allows.
+        """
+        if version is not None:
+            if not close_elements and int(version) >= 200:
+                raise ValueError(
+                    f"OFX version {version} requires ending tags for elements"
+                )
+            fp.write(str(make_header(version=version)).encode("utf_8"))
+
+        out = _Output(fp)
+        if prettyprint:
+            # Like ``utils.indent()``, which leaves an empty root be
+            if self._write(out, "\n", close_elements):
+                out.append("\n")
+        else:
+            self._write(out, None, close_elements)
+        out.flush()
+
+    def _write(
+        self, out: "_Output", indent: Optional[str], close_elements: bool
+    ) -> bool:
+        """
+        Append markup of self and children to ``out``; cf. ``write()``.
+
+        ``indent`` is the newline & indentation preceding self, or None
+        if not prettyprinting.
+
+        Returns whether self has any children.
+        """
+        cls = self.__class__
+        if cls.ungroom is not Aggregate.ungroom:
+            # Let the deprecated hook have its way with the Element tree
+            return _write_element(out, self.to_etree(), indent, close_elements)
+
+        tag = cls._tag
+        out.append(f"<{tag}>")
+        inner = None if indent is None else indent + "  "
+        tagnames = cls._schema.tagnames
+        listmembers = cls._schema.listmembers
+        empty = True
+        do_list = True  # Cf. to_etree()
+
+        for (attr, type_), value in zip(cls._schema.spec.items(), self._values):
+            if attr in listmembers:
+                if do_list:
+                    for member in self:
+                        if inner is not None:
+                            out.append(inner)
+                        self._write_member(out, member, inner, close_elements)
+                        empty = False
+                        if len(out) >= out.maxlen:
+                            out.flush()
+                    do_list = False
+                continue
+
+            if value is Types.UNSET:
+                value = getattr(self, attr)
+            if value is None:
+                continue
+            if inner is not None:
+                out.append(inner)
+            if isinstance(value, Aggregate):
+                value._write(out, inner, close_elements)
+            else:
+                assert isinstance(type_, Types.Element)
+                unconvert = _unconverter(type_.__class__, value.__class__)
+                text = unconvert(type_, value)
+                _write_leaf(out, tagnames[attr], text, close_elements)
+            empty = False
+
+        if indent is not None and not empty:
+            out.append(indent)
+        out.append(f"</{tag}>")
+        return not empty
+
+    def _write_member(
+        self,
+        out: "_Output",
+        member: Any,
+        indent: Optional[str],
+        close_elements: bool,
+    ) -> None:
+        """Counterpart of ``_listAppend()`` for ``_write()``"""
+        member._write(out, indent, close_elements)
+
     @staticmethod
     def ungroom(elem: ET.Element) -> ET.Element:
         """
         Reverse groom() when converting back to ElementTree.
 
-        Override in subclass.
+        Deprecated - ``to_etree()`` itself reverses ``tagAliases``, so the
+        default action is to return it unchanged.  Overriding it makes
+        ``write()`` fall back to serializing ``to_etree()``.
 
         N.B. make sure to perform modifications on a copy.deepcopy(), in order
         to keep the input free of side effects.
@@ -432,6 +837,63 @@ class Aggregate(list):
         """
         return {k: v for k, v in cls._superdict.items() if predicate(v)}
 
+    @classmethod
+    def _build_schema(cls) -> AggregateSchema:
+        """
+        Collect class attribute metadata into an ``AggregateSchema``.
+
+        Cf. discussion of ordering above in the docstring for ``_filter_attrs()``.
+        """
+        spec = cls._filter_attrs(
+            lambda v: isinstance(v, (Types.Element, Types.Unsupported))
+        )
+        listmembers = {
+            k: v
+            for k, v in spec.items()
+            if isinstance(v, (Types.ListAggregate, Types.ListElement))
+        }
+        listelements = {
+            k: v for k, v in listmembers.items() if isinstance(v, Types.ListElement)
+        }
+        unsupported = {
+            k: v for k, v in spec.items() if isinstance(v, Types.Unsupported)
+        }
+
+        tagnames = {attr: attr.upper() for attr in spec}
+        for tag, attr in cls.tagAliases.items():
+            if attr not in spec:
+                msg = f"{cls.__name__}.tagAliases: {tag} aliases unknown attr {attr}"
+                raise OFXAggregateError(msg)
+            tagnames[attr] = tag
+        tags = {
+            tag.lower(): (attr, i, attr in listmembers, attr in unsupported)
+            for i, (attr, tag) in enumerate(tagnames.items())
+        }
+        #  Also accept the attribute name itself as a tag, e.g. <YLD>
+        tags.update({attr: tags[tag.lower()] for attr, tag in tagnames.items()})
+
+        def select(predicate: Callable) -> Mapping[str, Any]:
+            return MappingProxyType({k: v for k, v in spec.items() if predicate(v)})
+
+        return AggregateSchema(
+            spec=MappingProxyType(spec),
+            spec_no_listaggregates=select(
+                lambda v: not isinstance(v, (Types.ListAggregate, Types.ListElement))
+            ),
+            elements=select(
+                lambda v: isinstance(v, Types.Element)
+                and not isinstance(v, Types.SubAggregate)
+            ),
+            subaggregates=select(lambda v: isinstance(v, Types.SubAggregate)),
+            unsupported=MappingProxyType(unsupported),
+            listaggregates=select(lambda v: isinstance(v, Types.ListAggregate)),
+            listelements=MappingProxyType(listelements),
+            positions=MappingProxyType({attr: i for i, attr in enumerate(spec)}),
+            listmembers=frozenset(listmembers),
+            tags=MappingProxyType(tags),
+            tagnames=MappingProxyType(tagnames),
+        )
+
     @classproperty
     @classmethod
     def spec(cls) -> Mapping[str, Union[Types.Element, Types.Unsupported]]:
@@ -442,9 +904,7 @@ class Aggregate(list):
 
         N.B. Types.SubAggregate is a subclass of Element.
         """
-        return cls._filter_attrs(
-            lambda v: isinstance(v, (Types.Element, Types.Unsupported))
-        )
+        return dict(cls._schema.spec)
 
     @classproperty
     @classmethod
@@ -455,10 +915,7 @@ class Aggregate(list):
         Mapping of all class attributes that are
         Elements/SubAggregates/Unsupported, excluding ListAggregates/ListElements.
         """
-        return cls._filter_attrs(
-            lambda v: isinstance(v, (Types.Element, Types.Unsupported))
-            and not isinstance(v, (Types.ListAggregate, Types.ListElement))
-        )
+        return dict(cls._schema.spec_no_listaggregates)
 
     @classproperty
     @classmethod
@@ -468,10 +925,7 @@ class Aggregate(list):
 
         N.B. Types.SubAggregate is a subclass of Element.
         """
-        return cls._filter_attrs(
-            lambda v: isinstance(v, Types.Element)
-            and not isinstance(v, Types.SubAggregate)
-        )
+        return dict(cls._schema.elements)
 
     @classproperty
     @classmethod
@@ -479,7 +933,7 @@ class Aggregate(list):
         """
         Mapping of all class attributes that are SubAggregates.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.SubAggregate))
+        return dict(cls._schema.subaggregates)
 
     @classproperty
     @classmethod
@@ -487,23 +941,26 @@ class Aggregate(list):
         """
         Mapping of all class attributes that are Unsupported.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.Unsupported))
+        return dict(cls._schema.unsupported)
 
     @classproperty
     @classmethod
-    def listaggregates(cls) -> Mapping[str, Types.ListAggregate]:
+    def listaggregates(
+        cls,
+    ) -> Mapping[str, Union[Types.ListAggregate, Types.ListElement]]:
         """
-        Mapping of all class attributes that are ListAggregates.
+        Mapping of all class attributes that are ListAggregates
+        (ListElements, for ``ElementList``).
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.ListAggregate))
+        return dict(cls._schema.listaggregates)
 
     @classproperty
     @classmethod
-    def listelements(cls) -> Mapping[str, Types.ListAggregate]:
+    def listelements(cls) -> Mapping[str, Types.ListElement]:
         """
         Mapping of all class attributes that are ListElements.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.ListElement))
+        return dict(cls._schema.listelements)
 
     @property
     def _spec_repr(self) -> Sequence[Tuple[str, Any]]:
@@ -517,7 +974,7 @@ class Aggregate(list):
         # "walrus operator" provided in Python 3.8.
         attrs = [
             (attr, repr(getattr(self, attr)))
-            for attr in self.spec_no_listaggregates.keys()
+            for attr in self._schema.spec_no_listaggregates.keys()
             if getattr(self, attr) is not None
         ]
         return attrs
@@ -539,7 +996,12 @@ class Aggregate(list):
 
     def __getattr__(self, attr: str):
         """Proxy access to attributes of SubAggregates"""
-        for subaggregate in self.subaggregates:
+        if attr.startswith("_"):
+            # Not an OFX attribute - e.g. an unset ``__slots__`` member
+            cls = self.__class__.__name__
+            raise AttributeError(f"'{cls}' object has no attribute '{attr}'")
+
+        for subaggregate in self._schema.subaggregates:
             subagg = getattr(self, subaggregate)
             try:
                 return getattr(subagg, attr)
@@ -548,31 +1010,135 @@ class Aggregate(list):
         cls = self.__class__.__name__
         raise AttributeError(f"'{cls}' object has no attribute '{attr}'")
 
+    def __reduce__(self):
+        """
+        Pickle compactly (cf. ``__getstate__()``), to be restored by
+        ``__setstate__()`` without calling ``__init__()`` - i.e. without
+        validating & type-converting all over again.
+        """
+        return copyreg.__newobj__, (self.__class__,), self.__getstate__()
+
+    def __getstate__(self) -> Tuple[tuple, tuple]:
+        """
+        Return (attribute values in order of ``spec``, less trailing Nones;
+        list items).
+
+        N.B. values are identified only by their position in the class spec,
+        so pickles should only be loaded by the same version of ``ofxtools``.
+
+        Lazily converted instances are converted in full first.
+        """
+        values = self._values
+        if Types.UNSET in values:
+            for attr, index in self._schema.positions.items():
+                if values[index] is Types.UNSET:
+                    self._materialize(attr)
+                # Never pickle the sentinel itself, which wouldn't survive
+                # unpickling as ``Types.UNSET``.
+                if values[index] is Types.UNSET:
+                    values[index] = None
+
+        end = len(values)
+        while end and values[end - 1] is None:
+            end -= 1
+        return tuple(values[:end]), tuple(self)
+
+    def __setstate__(self, state: Tuple[tuple, tuple]) -> None:
+        values, items = state
+        padding = [None] * (len(self._schema.spec) - len(values))
+        self._values = list(values) + padding
+        self._lazy = {}
+        list.extend(self, items)
+
 
 class ElementList(Aggregate):
     """
     Aggregate whose sequence contents are ListElements instead of ListAggregates
     """
 
-    @classproperty
     @classmethod
-    def listaggregates(cls) -> Mapping[str, Types.ListElement]:
+    def _build_schema(cls) -> AggregateSchema:
         """
-        ElementList.listaggregates returns ListElements instead of ListAggregates
+        ElementList.listaggregates holds ListElements instead of ListAggregates
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.ListElement))
+        schema = super()._build_schema()
+        return schema._replace(listaggregates=schema.listelements)
 
     def _apply_args(self, *args) -> None:
         # Interpret positional args as contained list items (of variable #)
-        assert len(self.listaggregates) == 1
-        converter = list(self.listaggregates.values())[0]
+        listaggregates = self._schema.listaggregates
+        assert len(listaggregates) == 1
+        converter = list(listaggregates.values())[0]
         for member in args:
             self.append(converter.convert(member))
 
     def _listAppend(self, root: ET.Element, member) -> None:
-        assert len(self.listaggregates) == 1
-        spec = list(self.listaggregates.items())[0]
+        listaggregates = self._schema.listaggregates
+        assert len(listaggregates) == 1
+        spec = list(listaggregates.items())[0]
         attr, converter = spec
 
         text = converter.unconvert(member)
-        ET.SubElement(root, attr.upper()).text = text
+        ET.SubElement(root, self._schema.tagnames[attr]).text = text
+
+    def _write_member(
+        self,
+        out: "_Output",
+        member: Any,
+        indent: Optional[str],
+        close_elements: bool,
+    ) -> None:
+        ((attr, converter),) = self._schema.listaggregates.items()
+        text = converter.unconvert(member)
+        _write_leaf(out, self._schema.tagnames[attr], text, close_elements)
+
+
+Unconverter = Callable[[Types.Element, Any], Optional[str]]
+
+#  Memo of ``_unconverter()``, keyed by (``Types.Element`` subclass, value type)
+_unconverters: Dict[Tuple[type, type], Unconverter] = {}
+
+
+def _unconverter(element_cls: Type[Types.Element], value_cls: type) -> Unconverter:
+    """
+    Look up the implementation of ``Types.Element.unconvert()`` for a type of
+    value, to call directly - sparing ``Aggregate.write()`` the overhead of
+    ``functools.singledispatchmethod`` binding the method for every call.
+
+    Memoized per class rather than per ``Types.Element`` instance, since the
+    implementation depends only on the class.
+    """
+    key = (element_cls, value_cls)
+    method = _unconverters.get(key)
+    if method is None:
+        method = inspect.getattr_static(element_cls, "unconvert")
+        if isinstance(method, functools.singledispatchmethod):
+            method = method.dispatcher.dispatch(value_cls)
+        _unconverters[key] = method
+    return method
+
+
+def _write_element(
+    out: List[str], elem: ET.Element, indent: Optional[str], close_elements: bool
+) -> bool:
+    """
+    Append markup of an ``ET.Element`` as returned by ``Aggregate.to_etree()``
+    to ``out``, the same as ``Aggregate._write()``.
+    """
+    if len(elem) == 0 and elem.text:
+        _write_leaf(out, elem.tag, elem.text, close_elements)
+        return False
+
+    out.append(f"<{elem.tag}>")
+    inner = None if indent is None else indent + "  "
+    for child in elem:
+        if inner is not None:
+            out.append(inner)
+        _write_element(out, child, inner, close_elements)
+    if indent is not None and len(elem):
+        out.append(indent)
+    out.append(f"</{elem.tag}>")
+    return len(elem) > 0
+
+
+Aggregate._schema = Aggregate._build_schema()
@@ -0,0 +1,270 @@
+# coding: utf-8
+"""
+Column-oriented export of transaction lists.
+
+``ColumnBuilder`` collects selected attributes of the transactions in one or
+more *TRANLISTs into one sequence per attribute, rather than one object per
+transaction - i.e. the layout wanted by dataframe/analytics libraries.  It
+reads either converted ``Aggregate`` instances, or the
+``xml.etree.ElementTree.Element`` structure directly (in which case only the
+selected Elements get type-converted, and no transaction instances are created).
+
+Columns are typed according to the ``Types.Element`` that converts each attribute:
+
+    * ``DateTime`` - ``array('q')`` of microseconds since the Unix epoch (UTC)
+    * ``Integer`` - ``array('q')``
+    * ``Decimal`` - ``tuple`` of ``decimal.Decimal``; or, if a ``scale`` is given,
+      ``array('q')`` of the values multiplied by ``10 ** scale`` (e.g. cents
+      for ``scale=2``) & rounded to integers
+    * ``OneOf`` - ``tuple`` of interned ``str``
+    * anything else - ``tuple`` of converted values
+
+Missing values are ``None`` in tuples, and ``NULL`` in arrays.
+
+If NumPy is installed, the columns are returned as NumPy arrays instead:
+``datetime64[us]`` (where ``NULL`` is ``NaT``), ``int64``, or ``object``.
+
+Users normally get here via ``TranList.to_columns()``,
+``TranList.columns_from_etree()``, or ``OFX.to_columns()``.
+"""
+
+__all__ = ["NULL", "ColumnBuilder"]
+
+
+# stdlib imports
+import datetime
+import sys
+import xml.etree.ElementTree as ET
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+# local imports
+from ofxtools import Types
+from ofxtools.utils import UTC
+from ofxtools.models.base import Aggregate
+
+#  Stand-in for missing values in integer arrays - the same bit pattern as
+#  NumPy's ``NaT``.
+NULL = -(1 << 63)
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=UTC)
+MICROSECOND = datetime.timedelta(microseconds=1)
+
+#  Each candidate location of an attribute within a transaction class:
+#  (path of SubAggregate attribute names, Element converting the attribute)
+Location = Tuple[Tuple[str, ...], Types.Element]
+
+
+def _import_numpy():
+    """Return the ``numpy`` module, or None if it's not installed"""
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        return None
+    return numpy
+
+
+def locate(cls: Type[Aggregate], attr: str) -> List[Location]:
+    """
+    Find where an ``Aggregate`` subclass keeps an attribute - directly, or in
+    its SubAggregates (or their SubAggregates, etc.), in the same order that
+    ``Aggregate.__getattr__()`` searches them for proxy access.
+    """
+    schema = cls._schema
+    element = schema.elements.get(attr)
+    if element is not None:
+        return [((), element)]
+
+    locations = []
+    for name, subaggregate in schema.subaggregates.items():
+        for path, element in locate(subaggregate.__type__, attr):
+            locations.append(((name,) + path, element))
+    return locations
+
+
+class Column:
+    """
+    Accumulate the values of one attribute, converted to a column type.
+
+    Integer-kind columns ("datetime", "integer") accumulate in ``integers``;
+    "object" columns accumulate in ``objects``.
+    """
+
+    def __init__(self, element: Optional[Types.Element], scale: Optional[int]):
+        self.integers = array("q")
+        self.objects: List[Any] = []
+        self.append: Callable[[Any], None]
+        if isinstance(element, Types.DateTime) and not isinstance(element, Types.Time):
+            self.kind = "datetime"
+            self.append = self._append_datetime
+        elif isinstance(element, Types.Integer):
+            self.kind = "integer"
+            self.append = self._append_integer
+        elif isinstance(element, Types.Decimal) and scale is not None:
+            self.kind = "integer"
+            self.exponent = scale
+            self.append = self._append_decimal
+        elif isinstance(element, Types.OneOf):
+            self.kind = "object"
+            self.append = self._append_enum
+        else:
+            self.kind = "object"
+            self.append = self.objects.append
+
+    def _append_datetime(self, value: Optional[datetime.datetime]) -> None:
+        self.integers.append(NULL if value is None else (value - EPOCH) // MICROSECOND)
+
+    def _append_integer(self, value: Optional[int]) -> None:
+        self.integers.append(NULL if value is None else value)
+
+    def _append_decimal(self, value) -> None:
+        if value is None:
+            self.integers.append(NULL)
+        else:
+            self.integers.append(int(value.scaleb(self.exponent).to_integral_value()))
+
+    def _append_enum(self, value: Optional[str]) -> None:
+        self.objects.append(None if value is None else sys.intern(value))
+
+    def export(self, numpy) -> Union[array, tuple, Any]:
+        if self.kind == "object":
+            if numpy is None:
+                return tuple(self.objects)
+            column = numpy.empty(len(self.objects), dtype=object)
+            column[:] = self.objects
+            return column
+        if numpy is None:
+            return self.integers
+        integers = numpy.frombuffer(self.integers, dtype="int64")
+        if self.kind == "datetime":
+            return integers.view("datetime64[us]")
+        return integers
+
+
+class ColumnBuilder:
+    """
+    Collect transaction attributes (``fields``) from *TRANLISTs into columns.
+
+    Call ``add()`` / ``add_etree()`` for each *TRANLIST, then ``build()``.
+
+    If ``fields`` isn't given, it defaults to all the Elements defined directly
+    on the transaction classes (in order of definition) of the first *TRANLIST
+    added - e.g. ``STMTTRN.trnamt`` but not ``INVBUY.total``.
+    """
+
+    def __init__(
+        self, fields: Optional[Sequence[str]] = None, scale: Optional[int] = None
+    ):
+        self.fields = None if fields is None else list(fields)
+        self.scale = scale
+        self.columns: Dict[str, Column] = {}
+        #  Transaction class -> (field locations, in order of ``self.fields``)
+        self._locations: Dict[Type[Aggregate], List[List[Location]]] = {}
+
+    def add(self, tranlist: Aggregate) -> None:
+        """Collect the transactions of a converted *TRANLIST"""
+        self._prepare(type(tranlist))
+        for tx in tranlist:
+            appends = zip(self._locate(tx.__class__), self._appends)
+            for locations, append in appends:
+                append(self._getvalue(tx, locations))
+
+    def add_etree(self, elem: ET.Element) -> None:
+        """
+        Collect the transactions of a *TRANLIST from its ``Element``, without
+        instantiating ``Aggregate`` classes for the transactions.
+        """
+        tranlist_cls = Aggregate._lookup_class(elem.tag)
+        self._prepare(tranlist_cls)
+        tags = tranlist_cls._schema.tags
+        for row in elem:
+            try:
+                is_listmember = tags[row.tag.lower()][2]
+            except KeyError:
+                continue
+            if not is_listmember:
+                continue
+            cls = Aggregate._lookup_class(row.tag)
+            row = cls.groom(row)
+            children = {child.tag: child for child in row}
+            for locations, append in zip(self._locate(cls), self._appends):
+                append(self._findvalue(cls, children, locations))
+
+    def build(self) -> Dict[str, Any]:
+        """Return a mapping of field name to column"""
+        numpy = _import_numpy()
+        if self.fields is None:
+            return {}
+        return {field: self.columns[field].export(numpy) for field in self.fields}
+
+    def _prepare(self, tranlist_cls: Type[Aggregate]) -> None:
+        """Locate the fields within each transaction class of a *TRANLIST class"""
+        classes = [
+            listaggregate.__type__
+            for listaggregate in tranlist_cls._schema.listaggregates.values()
+        ]
+
+        if self.fields is None:
+            fields: Dict[str, None] = {}
+            for cls in classes:
+                fields.update(dict.fromkeys(cls._schema.elements))
+            self.fields = list(fields)
+
+        for n, field in enumerate(self.fields):
+            if field in self.columns:
+                continue
+            for cls in classes:
+                locations = self._locate(cls)[n]
+                if locations:
+                    self.columns[field] = Column(locations[0][1], self.scale)
+                    break
+            else:
+                tranlist = tranlist_cls.__name__
+                raise ValueError(f"{tranlist} transactions have no attribute '{field}'")
+
+        self._appends = [self.columns[field].append for field in self.fields]
+
+    def _locate(self, cls: Type[Aggregate]) -> List[List[Location]]:
+        try:
+            return self._locations[cls]
+        except KeyError:
+            assert self.fields is not None
+            locations = [locate(cls, field) for field in self.fields]
+            self._locations[cls] = locations
+            return locations
+
+    @staticmethod
+    def _getvalue(tx: Aggregate, locations: List[Location]) -> Any:
+        #  Like ``Aggregate.__getattr__()``, take the first location whose
+        #  SubAggregates are all present.
+        for path, element in locations:
+            node = tx
+            for name in path:
+                node = getattr(node, name)
+                if node is None:
+                    break
+            else:
+                return getattr(node, element.name)
+        return None
+
+    @staticmethod
+    def _findvalue(
+        cls: Type[Aggregate], children: Dict[str, ET.Element], locations: List[Location]
+    ) -> Any:
+        for path, element in locations:
+            owner = cls
+            node: Optional[ET.Element] = None
+            for name in path:
+                tag = owner._schema.tagnames[name]
+                node = children.get(tag) if node is None else node.find(tag)
+                if node is None:
+                    break
+                owner = owner._schema.subaggregates[name].__type__
+                node = owner.groom(node)
+            else:
+                tag = owner._schema.tagnames[element.name]
+                leaf = children.get(tag) if node is None else node.find(tag)
+                if leaf is None or leaf.text is None:
+                    return element.convert(None)
+                return element._str_converter(leaf.text)
+        return None
@@ -24,7 +24,6 @@ __all__ = [
 
 
 # stdlib imports
-from copy import deepcopy
 import logging
 
 
@@ -50,35 +49,8 @@ class MAIL(Aggregate):
     incimages = Bool(required=True)
     usehtml = Bool(required=True)
 
-    @staticmethod
-    def groom(elem):
-        """
-        Rename all Elements tagged FROM (reserved Python keyword) to FROM
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        frm = elem.find("./FROM")
-        if frm is not None:
-            logger.debug("Renaming <FROM> to <FRM>")
-            frm.tag = "FRM"
-
-        return super(MAIL, MAIL).groom(elem)
-
-    @staticmethod
-    def ungroom(elem):
-        """
-        Rename FRM back to FROM
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        frm = elem.find("./FRM")
-        if frm is not None:
-            logger.debug("Renaming <FRM> to <FROM>")
-            frm.tag = "FROM"
-
-        return super(MAIL, MAIL).ungroom(elem)
+    # Rename FROM (reserved Python keyword) to FRM
+    tagAliases = {"FROM": "frm"}
 
 
 class MAILRQ(Aggregate):
@@ -1203,6 +1203,8 @@ class ORIGCURRENCY(Aggregate):
 class Origcurrency:
     """Mixin providing property aliases and CURRENCY/ORIGCURRENCY mutex"""
 
+    __slots__ = ()
+
     optionalMutexes: Sequence[Sequence[str]] = [["currency", "origcurrency"]]
 
     @property
@@ -26,7 +26,6 @@ __all__ = [
 
 
 # stdlib imports
-from copy import deepcopy
 import logging
 
 
@@ -155,35 +154,8 @@ class MFINFO(Aggregate):
     mfassetclass = SubAggregate(MFASSETCLASS)
     fimfassetclass = SubAggregate(FIMFASSETCLASS)
 
-    @staticmethod
-    def groom(elem):
-        """
-        Rename all Elements tagged YIELD (reserved Python keyword) to YLD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YIELD")
-        if yld is not None:
-            logger.debug("Renaming <YIELD> to <YLD>")
-            yld.tag = "YLD"
-
-        return super(MFINFO, MFINFO).groom(elem)
-
-    @staticmethod
-    def ungroom(elem):
-        """
-        Rename YLD back to YIELD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YLD")
-        if yld is not None:
-            logger.debug("Renaming <YLD> to <YIELD>")
-            yld.tag = "YIELD"
-
-        return super(MFINFO, MFINFO).ungroom(elem)
+    # Rename YIELD (reserved Python keyword) to YLD
+    tagAliases = {"YIELD": "yld"}
 
 
 class OPTINFO(Aggregate):
@@ -219,35 +191,8 @@ class STOCKINFO(Aggregate):
     assetclass = OneOf(*ASSETCLASSES)
     fiassetclass = String(32)
 
-    @staticmethod
-    def groom(elem):
-        """
-        Rename all Elements tagged YIELD (reserved Python keyword) to YLD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YIELD")
-        if yld is not None:
-            logger.debug("Renaming <YIELD> to <YLD>")
-            yld.tag = "YLD"
-
-        return super(STOCKINFO, STOCKINFO).groom(elem)
-
-    @staticmethod
-    def ungroom(elem):
-        """
-        Rename YLD back to YIELD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YLD")
-        if yld is not None:
-            logger.debug("Renaming <YLD> to <YIELD>")
-            yld.tag = "YIELD"
-
-        return super(STOCKINFO, STOCKINFO).ungroom(elem)
+    # Rename YIELD (reserved Python keyword) to YLD
+    tagAliases = {"YIELD": "yld"}
 
 
 class SECLIST(Aggregate):
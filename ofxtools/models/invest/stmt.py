@@ -204,6 +204,8 @@ class LOANINFO(Aggregate):
 
 
 class Inv401kSubaccountMixin:
+    __slots__ = ()
+
     pretax = Decimal()
     aftertax = Decimal()
     match = Decimal()
@@ -227,6 +229,8 @@ class EARNINGS(Aggregate, Inv401kSubaccountMixin):
 
 
 class ToDateMixin:
+    __slots__ = ()
+
     dtstart = DateTime(required=True)
     dtend = DateTime(required=True)
     contributions = SubAggregate(CONTRIBUTIONS)
@@ -275,6 +279,9 @@ class INV401K(Aggregate):
 class INVSTMTRS(Aggregate):
     """OFX section 13.9.2.1"""
 
+    # Wrapper TRNUID & CLTCOOKIE, stapled on by ``*MSGSRSV1.statements``
+    __slots__ = ("trnuid", "cltcookie")
+
     dtasof = DateTime(required=True)
     curdef = OneOf(*CURRENCY_CODES, required=True)
     invacctfrom = SubAggregate(INVACCTFROM, required=True)
@@ -8,6 +8,10 @@ balances, and securities.
 __all__ = ["OFX"]
 
 
+# stdlib imports
+from typing import Any, Dict, Optional, Sequence
+
+
 # local imports
 from ofxtools.Types import SubAggregate, Unsupported
 from ofxtools.models.base import Aggregate
@@ -33,6 +37,7 @@ from ofxtools.models.invest.msgsets import (
     SECLISTMSGSRSV1,
 )
 from ofxtools.models.tax1099 import TAX1099MSGSRQV1, TAX1099MSGSRSV1
+from ofxtools.models.columns import ColumnBuilder
 from ofxtools.utils import all_equal
 
 
@@ -90,9 +95,11 @@ class OFX(Aggregate):
 
     def __repr__(self):
         s = "<{} ".format(self.__class__.__name__)
-        signon = self.signon
-        if signon.fi is not None:
-            s += f"fid='{signon.fi.fid}' org='{signon.fi.org}' "
+        # Signon may be missing after ``OFXTree.parse(include=...)``
+        if self.signonmsgsrqv1 is not None or self.signonmsgsrsv1 is not None:
+            signon = self.signon
+            if signon is not None and signon.fi is not None:
+                s += f"fid='{signon.fi.fid}' org='{signon.fi.org}' "
         s += f"len(statements)={len(self.statements)} "
         s += f"len(securities)={len(self.securities)}>"
         return s
@@ -129,3 +136,17 @@ class OFX(Aggregate):
             if msg:
                 stmts.extend(msg.statements)
         return stmts
+
+    def to_columns(
+        self, fields: Optional[Sequence[str]] = None, scale: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the transactions of all ``statements`` as columns, concatenated
+        in order - cf. ``TranList.to_columns()``.
+        """
+        builder = ColumnBuilder(fields, scale)
+        for stmt in self.statements:
+            tranlist = stmt.transactions
+            if tranlist is not None:
+                builder.add(tranlist)
+        return builder.build()
@@ -10,10 +10,16 @@ create circular imports.
 __all__ = ["TrnRq", "TrnRs", "SyncRqList", "SyncRsList"]
 
 
+# stdlib imports
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Optional, Sequence
+
+
 # local imports
 from ofxtools.Types import Bool, String, DateTime, SubAggregate
 from ofxtools.models.base import Aggregate
 from ofxtools.models.common import STATUS, OFXEXTENSION
+from ofxtools.models.columns import ColumnBuilder
 
 
 class TrnRq(Aggregate):
@@ -57,6 +63,41 @@ class TranList(Aggregate):
             self.__class__.__name__, self.dtstart, self.dtend, len(self)
         )
 
+    def to_columns(
+        self, fields: Optional[Sequence[str]] = None, scale: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Return transaction attributes as columns, i.e. a dict mapping each of
+        ``fields`` to a sequence of values (one per transaction).
+
+        ``fields`` may name attributes of SubAggregates, as for proxy access
+        (e.g. ``dttrade`` for ``INVBUY.invtran.dttrade``); by default, they're
+        the Elements defined directly on the transaction classes.
+
+        Cf. ``ofxtools.models.columns`` for the column types, and ``scale``.
+        """
+        builder = ColumnBuilder(fields, scale)
+        builder.add(self)
+        return builder.build()
+
+    @classmethod
+    def columns_from_etree(
+        cls,
+        elem: ET.Element,
+        fields: Optional[Sequence[str]] = None,
+        scale: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Like ``to_columns()``, but read a *TRANLIST straight from its
+        ``xml.etree.ElementTree.Element``, skipping conversion of the
+        transactions into ``Aggregate`` instances.
+
+        Only the Elements selected by ``fields`` are validated.
+        """
+        builder = ColumnBuilder(fields, scale)
+        builder.add_etree(elem)
+        return builder.build()
+
 
 class SyncRqList(Aggregate):
     """Base class for *SYNCRQ"""
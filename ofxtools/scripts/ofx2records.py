@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Export transactions from OFX files as flat records - one CSV row or JSON line
+per bank/credit card ``STMTTRN`` or investment transaction, tagged with the
+account id & currency of its statement, and with the ticker & name of the
+security it trades (from the file's SECLIST).
+
+    ofx2records [-f {csv,jsonl}] [-o OUTPUT] [-w WORKERS] PATH [PATH ...]
+
+Directories are searched recursively for *.ofx & *.qfx files.
+
+Files are parsed with ``OFXTree.iterparse()``, so memory use doesn't grow with
+file size.  Securities are usually listed after the statements; when an
+investment transaction comes first, the file's SECLIST is read in a
+separate pass.
+
+Files are processed in parallel by a pool of ``WORKERS`` processes, each
+writing its records to a temporary file; these are copied to the output in
+the order the input files were given.  Files that can't be parsed are
+logged & skipped, without writing any of their records.
+"""
+
+__all__ = ["FIELDS", "iter_records", "export_file", "main"]
+
+
+# stdlib imports
+import argparse
+import concurrent.futures
+import csv
+import datetime
+import decimal
+import functools
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+# local imports
+from ofxtools import config, models
+from ofxtools.batch import find_files
+from ofxtools.Parser import OFXTree
+from ofxtools.models.base import Aggregate
+
+logger = logging.getLogger(__name__)
+
+
+FIELDS = (
+    "file",
+    "acctid",
+    "currency",
+    "type",
+    "fitid",
+    "trntype",
+    "date",
+    "amount",
+    "name",
+    "memo",
+    "checknum",
+    "uniqueidtype",
+    "uniqueid",
+    "ticker",
+    "secname",
+    "units",
+    "unitprice",
+)
+
+#  Investment transactions, except INVBANKTRAN - whose STMTTRN is exported
+#  in its place, same as for bank statements.
+INVTRAN_TAGS = frozenset(
+    listaggregate.__type__.__name__
+    for listaggregate in models.INVTRANLIST.listaggregates.values()
+) - {"INVBANKTRAN"}
+
+TRANSACTION_TAGS = INVTRAN_TAGS | {"STMTTRN"}
+
+SECINFO_TAGS = frozenset(
+    listaggregate.__type__.__name__
+    for listaggregate in models.SECLIST.listaggregates.values()
+)
+
+#  Start of each statement (*STMTRS)
+CURDEF_TAG = "CURDEF"
+
+ACCTFROM_TAGS = frozenset(["BANKACCTFROM", "CCACCTFROM", "INVACCTFROM"])
+
+#  Investment transaction attributes reported as ``trntype``
+INVTRAN_TYPES = (
+    "buytype",
+    "selltype",
+    "optbuytype",
+    "optselltype",
+    "incometype",
+    "tferaction",
+    "optaction",
+)
+
+Securities = Dict[Tuple[str, str], Tuple[Optional[str], Optional[str]]]
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Generate a record (mapping of ``FIELDS`` to values as ``str``, or None)
+    for each transaction in an OFX file, in document order.
+    """
+    securities: Optional[Securities] = None
+    acctid = None
+    curdef = None
+
+    tags = TRANSACTION_TAGS | SECINFO_TAGS | ACCTFROM_TAGS | {CURDEF_TAG}
+    for elem in OFXTree().iterparse(path, tags=tags, convert=False):
+        tag = elem.tag
+        if tag == CURDEF_TAG:
+            curdef = elem.text
+            acctid = None
+        elif tag in ACCTFROM_TAGS:
+            acctid = Aggregate.from_etree(elem).acctid
+        elif tag in SECINFO_TAGS:
+            if securities is None:
+                securities = {}
+            _add_security(securities, Aggregate.from_etree(elem))
+        elif tag == "STMTTRN":
+            yield _stmttrn_record(path, acctid, curdef, Aggregate.from_etree(elem))
+        else:
+            if securities is None:
+                securities = read_securities(path)
+            tx = Aggregate.from_etree(elem)
+            yield _invtran_record(path, acctid, curdef, securities, tx)
+
+
+def read_securities(path: str) -> Securities:
+    """
+    Map (uniqueidtype, uniqueid) to (ticker, secname) for the securities
+    listed in an OFX file.
+    """
+    securities: Securities = {}
+    #  Select the transactions as well, just to prune them from the tree.
+    tags = TRANSACTION_TAGS | SECINFO_TAGS
+    for elem in OFXTree().iterparse(path, tags=tags, convert=False):
+        if elem.tag in SECINFO_TAGS:
+            _add_security(securities, Aggregate.from_etree(elem))
+    return securities
+
+
+def _add_security(securities: Securities, secinfo: Aggregate) -> None:
+    key = (secinfo.uniqueidtype, secinfo.uniqueid)
+    securities[key] = (secinfo.ticker, secinfo.secname)
+
+
+def _stmttrn_record(
+    path: str, acctid: Optional[str], curdef: Optional[str], tx: Aggregate
+) -> Dict[str, Optional[str]]:
+    return _record(
+        file=path,
+        acctid=acctid,
+        currency=_currency(tx, curdef),
+        type="STMTTRN",
+        fitid=tx.fitid,
+        trntype=tx.trntype,
+        date=tx.dtposted,
+        amount=tx.trnamt,
+        name=tx.name,
+        memo=tx.memo,
+        checknum=tx.checknum,
+    )
+
+
+def _invtran_record(
+    path: str,
+    acctid: Optional[str],
+    curdef: Optional[str],
+    securities: Securities,
+    tx: Aggregate,
+) -> Dict[str, Optional[str]]:
+    trntype = None
+    for attr in INVTRAN_TYPES:
+        trntype = _getattr(tx, attr)
+        if trntype is not None:
+            break
+
+    uniqueidtype = uniqueid = ticker = secname = None
+    secid = _getattr(tx, "secid")
+    if secid is not None:
+        uniqueidtype, uniqueid = secid.uniqueidtype, secid.uniqueid
+        ticker, secname = securities.get((uniqueidtype, uniqueid), (None, None))
+
+    return _record(
+        file=path,
+        acctid=acctid,
+        currency=_currency(tx, curdef),
+        type=type(tx).__name__,
+        fitid=tx.fitid,
+        trntype=trntype,
+        date=tx.dttrade,
+        amount=_getattr(tx, "total"),
+        memo=tx.memo,
+        uniqueidtype=uniqueidtype,
+        uniqueid=uniqueid,
+        ticker=ticker,
+        secname=secname,
+        units=_getattr(tx, "units"),
+        unitprice=_getattr(tx, "unitprice"),
+    )
+
+
+def _getattr(tx: Aggregate, attr: str) -> Any:
+    """Attribute of transaction (or its SubAggregates), if its class has one"""
+    try:
+        return getattr(tx, attr)
+    except AttributeError:
+        return None
+
+
+def _currency(tx: Aggregate, curdef: Optional[str]) -> Optional[str]:
+    #  Amounts are in the statement's default currency, unless the transaction
+    #  has a CURRENCY (N.B. ORIGCURRENCY means it's been converted).
+    currency = _getattr(tx, "currency")
+    if currency is not None:
+        return currency.cursym
+    return curdef
+
+
+def _record(**values) -> Dict[str, Optional[str]]:
+    record = dict.fromkeys(FIELDS)
+    for field, value in values.items():
+        if isinstance(value, datetime.datetime):
+            value = value.isoformat()
+        elif isinstance(value, decimal.Decimal):
+            value = str(value)
+        record[field] = value
+    return record
+
+
+def write_records(
+    records: Iterable[Dict[str, Optional[str]]], fp: TextIO, format: str
+) -> int:
+    """Write records to a text file (opened with ``newline=""``); return #"""
+    count = 0
+    if format == "csv":
+        writer = csv.writer(fp)
+        for record in records:
+            writer.writerow(record.values())
+            count += 1
+    else:
+        for record in records:
+            fp.write(json.dumps(record))
+            fp.write("\n")
+            count += 1
+    return count
+
+
+def export_file(path: str, format: str) -> Tuple[str, Optional[str], int, str]:
+    """
+    Write the records of an OFX file to a temporary file.
+
+    Returns (path, name of temporary file or None, # records, error message).
+    Runs in the worker processes.
+    """
+    fd, tmpname = tempfile.mkstemp(prefix="ofx2records-", suffix=f".{format}")
+    try:
+        with open(fd, "w", newline="", encoding="utf-8") as fp:
+            count = write_records(iter_records(path), fp, format)
+    except Exception as err:
+        os.unlink(tmpname)
+        return path, None, 0, f"{err.__class__.__name__}: {err}"
+    return path, tmpname, count, ""
+
+
+def export(
+    paths: Iterable[str], output: TextIO, format: str = "csv", workers: int = 1
+) -> Tuple[int, List[str]]:
+    """
+    Write the records of all OFX files to ``output`` (opened with ``newline=""``),
+    in input order.  Returns (# records, list of paths that failed).
+    """
+    if format == "csv":
+        csv.writer(output).writerow(FIELDS)
+
+    files = list(find_files(paths))
+    count = 0
+    failed = []
+
+    task = functools.partial(export_file, format=format)
+    executor = None
+    if workers > 1 and len(files) > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        chunksize = max(1, min(64, len(files) // (workers * 4)))
+        results = executor.map(task, files, chunksize=chunksize)
+    else:
+        results = map(task, files)
+
+    try:
+        for path, tmpname, n, error in results:
+            if tmpname is None:
+                logger.error(f"Can't export {path} - {error}")
+                failed.append(path)
+                continue
+            try:
+                with open(tmpname, "r", newline="", encoding="utf-8") as fp:
+                    shutil.copyfileobj(fp, output)
+            finally:
+                os.unlink(tmpname)
+            logger.info(f"Exported {n} records from {path}")
+            count += n
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return count, failed
+
+
+def make_argparser() -> argparse.ArgumentParser:
+    argparser = argparse.ArgumentParser(
+        description="Export OFX transactions as CSV or JSON lines",
+    )
+    argparser.add_argument(
+        "paths", nargs="+", metavar="PATH", help="OFX file, or directory thereof"
+    )
+    argparser.add_argument(
+        "-f", "--format", choices=["csv", "jsonl"], default="csv", help="Output format"
+    )
+    argparser.add_argument(
+        "-o", "--output", type=Path, help="Output file (default: stdout)"
+    )
+    argparser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: # CPUs)",
+    )
+    argparser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="Give more output (option can be repeated)",
+    )
+    return argparser
+
+
+LOG_LEVELS = {0: logging.WARN, 1: logging.INFO, 2: logging.DEBUG}
+
+
+def main() -> None:
+    args = make_argparser().parse_args()
+
+    log_level = LOG_LEVELS.get(args.verbose, logging.DEBUG)
+    config.configure_logging(log_level)
+
+    if args.output is None:
+        sys.stdout.reconfigure(newline="")  # type: ignore
+        count, failed = export(args.paths, sys.stdout, args.format, args.workers)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as output:
+            count, failed = export(args.paths, output, args.format, args.workers)
+
+    logger.info(f"Exported {count} records")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
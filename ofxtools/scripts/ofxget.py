@@ -36,6 +36,7 @@ from typing import (
     Iterable,
     Iterator,
     ChainMap,
+    BinaryIO,
 )
 from pathlib import Path
 
@@ -1286,17 +1287,12 @@ def _read_scan_response(
         return valid, signoninfo
 
     if read_signoninfo:
-        # ``response`` is an HTTPResponse; doesn't have seek() method used
-        # by ``header.parse_header()``.  Repackage as BytesIO for parsing.
-        with response as f:
-            response_ = f.read()
+        # ``response`` is an HTTPResponse; parse it straight off the socket
+        # (``header.parse_header()`` doesn't need to seek).  An empty response
+        # raises OFXHeaderError.
         try:
-            if not response_:
-                return valid, signoninfo
-
-            signoninfos: Iterator[models.SIGNONINFO] = extract_signoninfos(
-                BytesIO(response_)
-            )
+            with response as f:
+                signoninfos: Iterator[models.SIGNONINFO] = extract_signoninfos(f)
 
             # Assume that all the SIGNONINFOs have the same content
             valid = True
@@ -1389,7 +1385,7 @@ def _acctIsActive(acctinfo: AcctInfo) -> bool:
     return acctinfo.svcstatus == "ACTIVE"
 
 
-def extract_signoninfos(markup: BytesIO) -> Iterator[models.SIGNONINFO]:
+def extract_signoninfos(markup: BinaryIO) -> Iterator[models.SIGNONINFO]:
     """
     Input seralized OFX containing PROFRS
     Output list of ofxtools.models.SIGNONINFO instances
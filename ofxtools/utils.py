@@ -6,7 +6,17 @@ import datetime
 import os
 import itertools
 import xml.etree.ElementTree as ET
-from typing import Any, Optional, Tuple, Callable, Iterable, Sequence
+from io import BytesIO
+from typing import (
+    Any,
+    BinaryIO,
+    Optional,
+    List,
+    Tuple,
+    Callable,
+    Iterable,
+    Sequence,
+)
 import math
 
 
@@ -119,23 +129,160 @@ def indent(elem: ET.Element, level: int = 0) -> None:
             elem.tail = i
 
 
-# FIXME - this doesn't work quite right
+#  Tags whose serialization ``ET.tostring(method="html")`` special-cases
+_HTML_SPECIAL = frozenset(ET.HTML_EMPTY) | {"script", "style"}  # type: ignore
+
+
+def write_elements(
+    elem: ET.Element,
+    fp: BinaryIO,
+    close_elements: bool = True,
+    encoding: str = "utf_8",
+) -> None:
+    """
+    Serialize xml.etree.ElementTree.Element to a binary file object, in chunks.
+
+    With ``close_elements``, the output is the same as that of
+    ``ET.tostring(elem, encoding, method="html")``.  Otherwise it's SGML-style,
+    leaving out the end tags of elements without children - i.e. OFX data-bearing
+    elements - as OFXv1 allows.  Either way, text & tails go where they belong.
+
+    Walks the tree iteratively, so neither time nor stack depth grows faster
+    than the number of Elements.  Namespaced tags aren't supported.
+    """
+    out = _Output(fp, encoding)
+    write = out.append
+
+    def start(elem: ET.Element) -> None:
+        tag = elem.tag
+        text = elem.text
+        if tag is ET.Comment:
+            write(f"<!--{_escape_cdata(text or '')}-->")
+        elif tag is ET.ProcessingInstruction:
+            write(f"<?{_escape_cdata(text or '')}?>")
+        elif tag is None:
+            if text:
+                write(_escape_cdata(text))
+        else:
+            write(f"<{tag}")
+            for key, value in elem.items():
+                write(f' {key}="{_escape_attrib_html(value)}"')
+            write(">")
+            if text:
+                if tag.lower() in ("script", "style"):
+                    write(text)
+                else:
+                    write(_escape_cdata(text))
+
+    def end(elem: ET.Element) -> None:
+        tag = elem.tag
+        if isinstance(tag, str) and tag.lower() not in ET.HTML_EMPTY:  # type: ignore
+            if close_elements or len(elem):
+                write(f"</{tag}>")
+        if elem.tail:
+            write(_escape_cdata(elem.tail))
+
+    start(elem)
+    #  Elements whose end is pending, along with their remaining children
+    stack = [(elem, iter(elem))]
+    while stack:
+        if len(out) >= out.maxlen:
+            out.flush()
+        parent, children = stack[-1]
+        for child in children:
+            tag = child.tag
+            if len(child) or tag is None:
+                start(child)
+                stack.append((child, iter(child)))
+            elif (
+                isinstance(tag, str)
+                and not child.attrib
+                and tag.lower() not in _HTML_SPECIAL
+            ):
+                #  Data-bearing element, as written by ``Aggregate.write()``
+                _write_leaf(out, tag, child.text, close_elements)
+                if child.tail:
+                    write(_escape_cdata(child.tail))
+            else:
+                start(child)
+                end(child)
+            break
+        else:
+            stack.pop()
+            end(parent)
+    out.flush()
+
+
+class _Output(list):
+    """
+    Markup buffered by ``write_elements()`` and ``Aggregate.write()``, to be
+    encoded & written to file every ``maxlen`` or so pieces.
+    """
+
+    __slots__ = ("fp", "encoding")
+
+    maxlen = 4096
+
+    def __init__(self, fp: BinaryIO, encoding: str = "utf_8"):
+        super().__init__()
+        self.fp = fp
+        self.encoding = encoding
+
+    def flush(self) -> None:
+        # Like ``ET.tostring(encoding=...)``
+        self.fp.write("".join(self).encode(self.encoding, "xmlcharrefreplace"))
+        self.clear()
+
+
+def _write_leaf(
+    out: List[str], tag: str, text: Optional[str], close_elements: bool
+) -> None:
+    """
+    Append markup of an element without children or attributes to ``out``,
+    closed unless ``close_elements`` is false.
+    """
+    if text:
+        text = _escape_cdata(text)
+    else:
+        text = ""
+    if close_elements:
+        out.append(f"<{tag}>{text}</{tag}>")
+    else:
+        out.append(f"<{tag}>{text}")
+
+
 def tostring_unclosed_elements(elem: ET.Element) -> bytes:
     """
     SGML-style string representation of xml.etree.ElementTree, without
-    closing tags.
+    closing tags for elements that have no children.
 
-    Drop-in replacement for xml.etree.ElementTree.tostring().
+    Drop-in replacement for xml.etree.ElementTree.tostring(); cf. ``write_elements()``.
     """
-    if len(elem) == 0:
-        text = "<{}>{}{}".format(elem.tag, elem.text or "", elem.tail or "")
-        output = bytes(text, "utf_8")
-    else:
-        output = bytes("<{}>{}".format(elem.tag, elem.tail or ""), "utf_8")
-        for child in elem:
-            output += tostring_unclosed_elements(child)
-        output += bytes("</{}>{}".format(elem.tag, elem.tail or ""), "utf_8")
-    return output
+    output = BytesIO()
+    write_elements(elem, output, close_elements=False)
+    return output.getvalue()
+
+
+def _escape_cdata(text: str) -> str:
+    """Escape text & tails, like ``ET.tostring(method="html")``"""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _escape_attrib_html(text: str) -> str:
+    """Escape attribute values, like ``ET.tostring(method="html")``"""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    if '"' in text:
+        text = text.replace('"', "&quot;")
+    return text
 
 
 ###############################################################################
@@ -44,7 +44,12 @@ setup(
     # Note: change 'master' to the tag name when releasing a new verion
     #  download_url="{}/master".format(URL_BASE),
     download_url="{}/{}".format(URL_BASE, ABOUT["__version__"]),
-    entry_points={"console_scripts": ["ofxget=ofxtools.scripts.ofxget:main"]},
+    entry_points={
+        "console_scripts": [
+            "ofxget=ofxtools.scripts.ofxget:main",
+            "ofx2records=ofxtools.scripts.ofx2records:main",
+        ]
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
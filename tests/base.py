@@ -5,7 +5,9 @@
 import unittest
 import xml.etree.ElementTree as ET
 from copy import deepcopy
+from io import BytesIO
 import itertools
+import pickle
 from typing import List, Dict, Sequence, Any
 
 # local imports
@@ -13,7 +15,7 @@ import ofxtools.models
 from ofxtools.models.base import Aggregate, UnknownTagWarning
 from ofxtools.models.common import STATUS
 from ofxtools.utils import classproperty, indent
-from ofxtools.Parser import OFXTree, TreeBuilder
+from ofxtools.Parser import OFXTree, TreeBuilder, ModelBuilder
 
 
 class TestAggregate:
@@ -50,6 +52,12 @@ class TestAggregate:
             with self.assertRaises(ValueError):
                 Aggregate.from_etree(etree)
 
+    def testInvalidSoupLazy(self):
+        # Lazy conversion defers errors until the offending data is accessed
+        for etree in self.invalidSoup:
+            with self.assertRaises(ValueError):
+                Aggregate.from_etree(etree, lazy=True).to_etree()
+
     def testRequired(self):
         if self.requiredElements:
             for tag in self.requiredElements:
@@ -153,9 +161,53 @@ class TestAggregate:
     def testFromEtree(self):
         self._eqAggregate(self.aggregate, Aggregate.from_etree(self.etree))
 
+    def testFromEtreeLazy(self):
+        self._eqAggregate(self.aggregate, Aggregate.from_etree(self.etree, lazy=True))
+
     def testToEtree(self):
         self._eqEtree(self.etree, self.aggregate.to_etree())
 
+    def testWrite(self):
+        # Same as serializing to_etree()
+        for prettyprint in (False, True):
+            root = self.aggregate.to_etree()
+            if prettyprint:
+                indent(root)
+            output = BytesIO()
+            self.aggregate.write(output, prettyprint=prettyprint)
+            self.assertEqual(
+                output.getvalue(), ET.tostring(root, encoding="utf_8", method="html")
+            )
+
+        output = BytesIO()
+        self.aggregate.write(output, close_elements=False)
+        builder = TreeBuilder()
+        builder.feed(output.getvalue().decode())
+        self._eqAggregate(self.aggregate, Aggregate.from_etree(builder.close()))
+
+    def testPickleLazy(self):
+        # Lazily converted models are pickled in full, then serialize as usual
+        lazy = Aggregate.from_etree(self.etree, lazy=True)
+        copy = pickle.loads(pickle.dumps(lazy))
+        self._eqAggregate(self.aggregate, copy)
+        output = BytesIO()
+        copy.write(output)
+        root = self.aggregate.to_etree()
+        self.assertEqual(
+            output.getvalue(), ET.tostring(root, encoding="utf_8", method="html")
+        )
+
+    def testModelBuilder(self):
+        # ModelBuilder yields the same result as TreeBuilder + from_etree()
+        markup = ET.tostring(self.etree, short_empty_elements=False).decode()
+        builder = TreeBuilder()
+        builder.feed(markup)
+        aggregate = Aggregate.from_etree(builder.close())
+
+        builder = ModelBuilder()
+        builder.feed(markup)
+        self._eqAggregate(aggregate, builder.close())
+
     def testOneOf(self):
         for tag, choices in self.oneOfs.items():
             self.oneOfTest(tag, choices)
@@ -527,6 +579,11 @@ class OfxTestCase:
         self.assertIsInstance(self.tree._root, ET.Element)
         self._eqAggregate(self.aggregate, self.tree.convert())
 
+    def testModelBuilder(self):
+        builder = ModelBuilder()
+        builder.feed(self.ofx)
+        self._eqAggregate(self.aggregate, builder.close())
+
     def testToOfx(self):
         root = self.aggregate.to_etree()
         indent(root)
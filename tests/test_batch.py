@@ -0,0 +1,136 @@
+# coding: utf-8
+"""Unit tests for ofxtools.batch"""
+
+# stdlib imports
+import unittest
+from unittest.mock import patch
+import os
+import pickle
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+
+# local imports
+from ofxtools import batch
+from ofxtools.Parser import OFXTree
+from ofxtools.header import OFXHeaderV2
+from ofxtools.models.ofx import OFX
+
+DATADIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+class ParseFileTestCase(unittest.TestCase):
+    def testParseFile(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        result = batch.parse_file(path)
+        self.assertEqual(result.path, path)
+        self.assertIsInstance(result.header, OFXHeaderV2)
+        self.assertIsInstance(result.ofx, OFX)
+        self.assertIsNone(result.error)
+
+    def testParseFileNoConvert(self):
+        path = os.path.join(DATADIR, "stmtrs.ofx")
+        result = batch.parse_file(path, convert=False)
+        self.assertIsInstance(result.ofx, ET.Element)
+        self.assertEqual(result.ofx.tag, "OFX")
+        self.assertIsNone(result.error)
+
+    def testParseFileError(self):
+        # Invalid LEDGERBAL.DTASOF
+        path = os.path.join(DATADIR, "stmtrs.ofx")
+        result = batch.parse_file(path)
+        self.assertIsInstance(result.header, OFXHeaderV2)
+        self.assertIsNone(result.ofx)
+        self.assertIsInstance(result.error, ValueError)
+
+    def testParseFileMissing(self):
+        result = batch.parse_file(os.path.join(DATADIR, "nonexistent.ofx"))
+        self.assertIsNone(result.header)
+        self.assertIsInstance(result.error, OSError)
+
+    def testUnpicklableError(self):
+        class CustomError(Exception):
+            def __init__(self, foo, bar):
+                super().__init__(f"{foo} {bar}")
+
+        with patch.object(OFXTree, "parse", side_effect=CustomError("foo", "bar")):
+            result = batch.parse_file(os.path.join(DATADIR, "invstmtrs.ofx"))
+        self.assertIsInstance(result.error, RuntimeError)
+        self.assertEqual(str(result.error), "CustomError: foo bar")
+        pickle.dumps(result)
+
+    def testPickleResult(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        result = batch.parse_file(path)
+        copy = pickle.loads(pickle.dumps(result))
+        self.assertEqual(repr(copy.ofx), repr(result.ofx))
+        self.assertEqual(
+            ET.tostring(copy.ofx.to_etree()), ET.tostring(result.ofx.to_etree())
+        )
+
+
+class ParseManyTestCase(unittest.TestCase):
+    @property
+    def paths(self):
+        good = os.path.join(DATADIR, "invstmtrs.ofx")
+        bad = os.path.join(DATADIR, "stmtrs.ofx")
+        return [good, bad, good, good, bad, good, good]
+
+    def check(self, results, paths):
+        self.assertEqual([result.path for result in results], paths)
+        for result in results:
+            if result.path.endswith("stmtrs.ofx") and "inv" not in result.path:
+                self.assertIsNone(result.ofx)
+                self.assertIsInstance(result.error, ValueError)
+            else:
+                self.assertIsInstance(result.ofx, OFX)
+                self.assertIsNone(result.error)
+
+    def testParseManySerial(self):
+        self.check(batch.parse_many(self.paths, workers=1), self.paths)
+
+    def testParseMany(self):
+        results = batch.parse_many(self.paths, workers=2, chunksize=2)
+        self.check(results, self.paths)
+
+    def testIparseMany(self):
+        results = batch.iparse_many(iter(self.paths), workers=2, chunksize=1)
+        self.check(list(results), self.paths)
+
+    def testIparseManyUnordered(self):
+        results = list(batch.iparse_many_unordered(self.paths, workers=2, chunksize=3))
+        self.assertEqual(sorted(result.path for result in results), sorted(self.paths))
+        for result in results:
+            self.check([result], [result.path])
+
+    def testParseManyEmpty(self):
+        self.assertEqual(batch.parse_many([], workers=2), [])
+
+
+class FindFilesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.tmpdir, "sub"))
+        for name in ("b.ofx", "a.QFX", "README", os.path.join("sub", "c.ofx")):
+            with open(os.path.join(self.tmpdir, name), "w") as f:
+                f.write("")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testFindFiles(self):
+        stmtrs = os.path.join(DATADIR, "stmtrs.ofx")
+        files = list(batch.find_files([self.tmpdir, stmtrs]))
+        self.assertEqual(
+            files,
+            [
+                os.path.join(self.tmpdir, "a.QFX"),
+                os.path.join(self.tmpdir, "b.ofx"),
+                os.path.join(self.tmpdir, "sub", "c.ofx"),
+                stmtrs,
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
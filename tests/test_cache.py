@@ -0,0 +1,186 @@
+# coding: utf-8
+"""Unit tests for ofxtools.cache"""
+
+# stdlib imports
+import unittest
+from unittest.mock import patch
+import os
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+
+# local imports
+from ofxtools import cache
+from ofxtools.cache import CacheEntry, DiskCache
+from ofxtools.Parser import OFXTree, TreeBuilder
+from ofxtools.models.ofx import OFX
+from ofxtools.Types import CacheInfo
+
+DATADIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+class DiskCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(DATADIR, "invstmtrs.ofx")
+        tree = OFXTree()
+        tree.parse(self.path)
+        self.entry = CacheEntry(tree.header, tree.convert())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _entrysize(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            probe = DiskCache(tmpdir)
+            probe.put("probe", self.entry)
+            return probe.info().currsize
+
+    def testDefaultPath(self):
+        self.assertEqual(DiskCache().path, cache.config.DATADIR / "cache")
+
+    def testBadMaxsize(self):
+        with self.assertRaises(ValueError):
+            DiskCache(self.tmpdir, maxsize=-1)
+
+    def testKey(self):
+        diskcache = DiskCache(self.tmpdir)
+        key = diskcache.key(b"data")
+        self.assertEqual(key, diskcache.key(b"data"))
+        self.assertNotEqual(key, diskcache.key(b"other data"))
+        with patch.object(cache, "__version__", "0.0.0"):
+            self.assertNotEqual(key, diskcache.key(b"data"))
+
+    def testPutGet(self):
+        diskcache = DiskCache(self.tmpdir)
+        self.assertIsNone(diskcache.get("key"))
+        diskcache.put("key", self.entry)
+        header, ofx = diskcache.get("key")
+        self.assertEqual(str(header), str(self.entry.header))
+        self.assertIsInstance(ofx, OFX)
+        self.assertEqual(ofx.statements[0].account.acctid, "999988")
+        self.assertEqual(len(ofx.securities), 3)
+
+        info = diskcache.info()
+        self.assertIsInstance(info, CacheInfo)
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertEqual(info.maxsize, diskcache.maxsize)
+        self.assertEqual(info.currsize, os.path.getsize(diskcache._entrypath("key")))
+
+        # No temporary files left behind
+        self.assertEqual(os.listdir(self.tmpdir), ["key.pickle"])
+
+    def testUnreadable(self):
+        diskcache = DiskCache(self.tmpdir)
+        with open(diskcache._entrypath("key"), "wb") as f:
+            f.write(b"garbage")
+        with self.assertLogs(cache.logger, "WARNING"):
+            self.assertIsNone(diskcache.get("key"))
+        self.assertEqual(diskcache.info().misses, 1)
+        self.assertFalse(os.path.exists(diskcache._entrypath("key")))
+
+    def testEvict(self):
+        size = self._entrysize()
+        diskcache = DiskCache(self.tmpdir, maxsize=size * 2)
+        diskcache.put("a", self.entry)
+        diskcache.put("b", self.entry)
+        # Make "b" the least recently used
+        os.utime(diskcache._entrypath("a"), (1 << 31, 1 << 31))
+        os.utime(diskcache._entrypath("b"), (1 << 30, 1 << 30))
+
+        diskcache.put("c", self.entry)
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ["a.pickle", "c.pickle"])
+        self.assertEqual(diskcache.info().currsize, size * 2)
+
+    def testPutTooBig(self):
+        diskcache = DiskCache(self.tmpdir, maxsize=self._entrysize() - 1)
+        diskcache.put("key", self.entry)
+        self.assertIsNone(diskcache.get("key"))
+        self.assertEqual(diskcache.info().currsize, 0)
+
+    def testClear(self):
+        diskcache = DiskCache(self.tmpdir)
+        diskcache.put("key", self.entry)
+        diskcache.get("key")
+        diskcache.clear()
+        self.assertEqual(diskcache.info(), CacheInfo(0, 0, diskcache.maxsize, 0))
+        self.assertEqual(os.listdir(self.tmpdir), [])
+
+
+class OFXTreeCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.diskcache = DiskCache(self.tmpdir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testMissHit(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        tree = OFXTree()
+        root = tree.parse(path, cache=self.diskcache)
+        self.assertIsInstance(root, ET.Element)
+        ofx = tree.convert()
+        self.assertIs(tree.convert(), ofx)
+
+        tree = OFXTree()
+        with patch.object(OFXTree, "_parse_message") as mock_parse:
+            root = tree.parse(path, cache=self.diskcache)
+        mock_parse.assert_not_called()
+        self.assertEqual(self.diskcache.info().hits, 1)
+        self.assertEqual(tree.header.version, 200)
+        cached = tree.convert()
+        self.assertIs(tree.convert(), cached)
+        self.assertEqual(ET.tostring(cached.to_etree()), ET.tostring(ofx.to_etree()))
+
+        # Element tree is regenerated from the cached models
+        self.assertIs(root, tree.getroot())
+        self.assertEqual(ET.tostring(root), ET.tostring(ofx.to_etree()))
+        self.assertEqual(tree.find(".//BUYSTOCK/INVBUY/INVTRAN/FITID").text, "23321")
+
+    def testHitConvertArgs(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        OFXTree().parse(path, cache=self.diskcache)
+
+        tree = OFXTree()
+        tree.parse(path, cache=self.diskcache)
+        cached = tree.convert()
+        # Non-default args convert the Element tree anew
+        for kwargs in ({"lazy": True}, {"validate": False}):
+            with self.subTest(**kwargs):
+                ofx = tree.convert(**kwargs)
+                self.assertIsNot(ofx, cached)
+                self.assertEqual(
+                    ET.tostring(ofx.to_etree()), ET.tostring(cached.to_etree())
+                )
+
+    def testBadArgs(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        tree = OFXTree()
+        with self.assertRaises(ValueError):
+            tree.parse(path, parser=TreeBuilder(), cache=self.diskcache)
+        with self.assertRaises(ValueError):
+            tree.parse(path, memory_map=True, cache=self.diskcache)
+        self.assertEqual(self.diskcache.info().misses, 0)
+
+    def testParseAgain(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        tree = OFXTree()
+        tree.parse(path, cache=self.diskcache)
+        tree.parse(path)
+        # No longer returning the cached models
+        self.assertIsNot(tree.convert(), tree.convert())
+
+    def testNotCached(self):
+        # LEDGERBAL DTASOF is invalid
+        path = os.path.join(DATADIR, "stmtrs.ofx")
+        tree = OFXTree()
+        root = tree.parse(path, cache=self.diskcache)
+        self.assertIsInstance(root, ET.Element)
+        with self.assertRaises(ValueError):
+            tree.convert()
+        self.assertEqual(self.diskcache.info().currsize, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
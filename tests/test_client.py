@@ -20,7 +20,7 @@ from ofxtools.Client import (
     CcStmtEndRq,
 )
 from ofxtools.models.signon import SIGNONMSGSRQV1
-from ofxtools.utils import UTC, indent, tostring_unclosed_elements
+from ofxtools.utils import UTC, indent, tostring_unclosed_elements, write_elements
 from ofxtools.models.signon import SONRQ
 
 
@@ -876,6 +876,77 @@ class UtilitiesTestCase(unittest.TestCase):
             ("<ROOT>" "<LEVEL1>" "<LEVEL2>level2" "</LEVEL1>" "<LEVEL1>" "</ROOT>"),
         )
 
+    def testTostringUnclosedElementsIndented(self):
+        root = self.root
+        indent(root)
+        result = tostring_unclosed_elements(root).decode()
+        self.assertEqual(
+            result,
+            (
+                "<ROOT>\n"
+                "  <LEVEL1>\n"
+                "    <LEVEL2>level2\n"
+                "  </LEVEL1>\n"
+                "  <LEVEL1>\n"
+                "</ROOT>\n"
+            ),
+        )
+
+    def testWriteElements(self):
+        root = self.root
+        root.text = "text & "
+        root.tail = "tail"
+        root.set("attr", '"value"')
+        root[0].tail = "<tail>"
+        root.append(ET.Comment("comment"))
+        ET.SubElement(root, "LEVEL1").text = "Ünïcode"
+        for encoding in ("utf_8", "us-ascii"):
+            output = BytesIO()
+            write_elements(root, output, encoding=encoding)
+            self.assertEqual(
+                output.getvalue(),
+                ET.tostring(root, encoding=encoding, method="html"),
+            )
+
+        output = BytesIO()
+        write_elements(root, output, close_elements=False)
+        self.assertEqual(
+            output.getvalue().decode(),
+            (
+                '<ROOT attr="&quot;value&quot;">text &amp; '
+                "<LEVEL1><LEVEL2>level2</LEVEL1>&lt;tail&gt;"
+                "<LEVEL1>"
+                "<!--comment-->"
+                "<LEVEL1>Ünïcode"
+                "</ROOT>tail"
+            ),
+        )
+
+    def testWriteElementsDeep(self):
+        # No recursion
+        root = elem = ET.Element("ROOT")
+        for n in range(10000):
+            elem = ET.SubElement(elem, "LEVEL")
+        elem.text = "bottom"
+        output = BytesIO()
+        write_elements(root, output, close_elements=False)
+        self.assertEqual(
+            output.getvalue().decode(),
+            "<ROOT>" + "<LEVEL>" * 10000 + "bottom" + "</LEVEL>" * 9999 + "</ROOT>",
+        )
+
+    def testWriteElementsChunks(self):
+        # Written a chunk at a time, not all at once
+        root = ET.Element("ROOT")
+        for n in range(10000):
+            ET.SubElement(root, "LEVEL1").text = str(n)
+        output = Mock(wraps=BytesIO())
+        write_elements(root, output)
+        self.assertGreater(output.write.call_count, 1)
+        self.assertEqual(
+            output.getvalue(), ET.tostring(root, encoding="utf_8", method="html")
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
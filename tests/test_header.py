@@ -13,6 +13,16 @@ from typing import Optional, Union, Mapping, Any, Type
 import ofxtools
 
 
+class Unseekable:
+    """Minimal file-like object that can only be read, like a network stream"""
+
+    def __init__(self, data: bytes):
+        self._stream = BytesIO(data)
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+
 class OFXHeaderTestMixin(object):
     # Override in subclass
     headerClass: Optional[
@@ -62,6 +72,41 @@ class OFXHeaderTestMixin(object):
                         attr2 = getattr(header_dupe, attrName)
                         self.assertEqual(attr1, attr2)
 
+    def testReadHeader(self):
+        header = str(self.headerClass(self.defaultVersion))
+        source = Unseekable((header + self.body).encode("ascii"))
+        ofxheader, prefix = ofxtools.header.read_header(source)
+        self.assertIsInstance(ofxheader, self.headerClass)
+        self.assertEqual(ofxheader.version, self.defaultVersion)
+        # Whatever was read past the header is returned; the rest is left unread
+        body = (prefix + source.read()).decode("ascii")
+        self.assertEqual(body.strip(), self.body)
+
+    def testReadHeaderLeadingWhitespace(self):
+        header = str(self.headerClass(self.defaultVersion))
+        source = Unseekable(("\r\n  \n" + header + self.body).encode("ascii"))
+        ofxheader, prefix = ofxtools.header.read_header(source)
+        self.assertIsInstance(ofxheader, self.headerClass)
+        body = (prefix + source.read()).decode("ascii")
+        self.assertEqual(body.strip(), self.body)
+
+    def testReadHeaderBounded(self):
+        # Only a bounded prefix of the source is consumed
+        header = str(self.headerClass(self.defaultVersion))
+        body = self.body * 1000
+        source = Unseekable((header + body).encode("ascii"))
+        ofxheader, prefix = ofxtools.header.read_header(source)
+        self.assertLessEqual(len(prefix), ofxtools.header.HEADER_MAXSIZE)
+        self.assertEqual((prefix + source.read()).decode("ascii").strip(), body)
+
+    def testParseHeaderUnseekable(self):
+        header = str(self.headerClass(self.defaultVersion))
+        source = Unseekable((header + self.body).encode("ascii"))
+        ofxheader, body = ofxtools.header.parse_header(source)
+        self.assertIsInstance(ofxheader, self.headerClass)
+        self.assertEqual(ofxheader.version, self.defaultVersion)
+        self.assertEqual(body, self.body)
+
     def testInvalid(self):
         for attr, values in self.invalid.items():
             for value in values:
@@ -72,6 +117,21 @@ class OFXHeaderTestMixin(object):
                 with self.assertRaises(ofxtools.header.OFXHeaderError):
                     self.headerClass(**kw)
 
+    def testValidSets(self):
+        # OneOf header fields validate against hashed sets shared by code list
+        for attr, converter in self.headerClass.__dict__.items():
+            if isinstance(converter, ofxtools.Types.OneOf):
+                with self.subTest(attr=attr):
+                    self.assertEqual(converter.validset, frozenset(converter.valid))
+                    self.assertIs(
+                        converter.validset,
+                        ofxtools.Types.OneOf(*converter.valid).validset,
+                    )
+        self.assertIs(
+            ofxtools.header.OFXHeaderV1.__dict__["security"].validset,
+            ofxtools.header.OFXHeaderV2.__dict__["security"].validset,
+        )
+
 
 class OFXHeaderV1TestCase(unittest.TestCase, OFXHeaderTestMixin):
     headerClass = ofxtools.header.OFXHeaderV1
@@ -2,11 +2,18 @@
 """ Unit tests for models/base.py """
 # stdlib imports
 import unittest
+from unittest.mock import Mock, patch
+import copy
+import pickle
+from io import BytesIO
+import warnings
+import weakref
 import xml.etree.ElementTree as ET
 
 
 # local imports
 from ofxtools import models, Types
+from ofxtools.utils import indent
 from ofxtools.Types import (
     String,
     Bool,
@@ -18,6 +25,7 @@ from ofxtools.Types import (
 from ofxtools.models.base import (
     Aggregate,
     ElementList,
+    AggregateSchema,
     OFXSpecError,
 )
 
@@ -58,20 +66,12 @@ class TESTELEMENTLIST(ElementList):
     tag = ListElement(Bool())
 
 
-class AggregateTestCase(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        # monkey-patch ofxtools.models so Aggregate.from_etree() picks up
-        # our fake OFX aggregates/elements
-        models.TESTSUBAGGREGATE = TESTSUBAGGREGATE
-        models.TESTAGGREGATE = TESTAGGREGATE
-
-    @classmethod
-    def tearDownClass(cls):
-        # Remove monkey patch
-        del models.TESTSUBAGGREGATE
-        del models.TESTAGGREGATE
+def stored(instance, attr):
+    """Value of an ``Aggregate`` attribute, as stored"""
+    return instance._values[instance._schema.positions[attr]]
+
 
+class AggregateTestCase(unittest.TestCase):
     @property
     def instance_no_subagg(self):
         return TESTAGGREGATE(metadata="foo", req00=True, req11=False)
@@ -259,6 +259,17 @@ class AggregateTestCase(unittest.TestCase):
 
         self.assertIn("out of order", exc.exception.args[0].lower())
 
+        # Error message names the misplaced tag and its predecessor
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "REQ11").text = "N"
+        ET.SubElement(root, "FOO.BAR").text = "unknown"
+        ET.SubElement(root, "METADATA").text = "metadata"
+
+        with self.assertRaises(OFXSpecError) as exc:
+            Aggregate.from_etree(root)
+
+        self.assertIn("METADATA should occur before REQ11", exc.exception.args[0])
+
         root = ET.Element("TESTAGGREGATE")
         sub = ET.Element("TESTSUBAGGREGATE")
         ET.SubElement(sub, "DATA").text = "data"
@@ -295,15 +306,265 @@ class AggregateTestCase(unittest.TestCase):
 
         self.assertIn("out of order", exc.exception.args[0].lower())
 
+    def testRegistry(self):
+        # Subclasses are registered by name when defined
+        self.assertIs(Aggregate._registry["TESTAGGREGATE"], TESTAGGREGATE)
+        self.assertIs(Aggregate._registry["STMTTRN"], models.STMTTRN)
+        self.assertEqual(TESTAGGREGATE._tag, "TESTAGGREGATE")
+
+        # ...but don't displace previously registered classes
+        class STMTTRN(models.STMTTRN):
+            pass
+
+        self.assertIs(Aggregate._registry["STMTTRN"], models.STMTTRN)
+
+    def testRegister(self):
+        class INTUXXX(Aggregate):
+            data = String(32)
+
+        class TESTEXTENDED(TESTAGGREGATE2):
+            intuxxx = SubAggregate(INTUXXX)
+
+            tagAliases = {"INTU.XXX": "intuxxx"}
+
+        root = ET.Element("TESTEXTENDED")
+        ET.SubElement(root, "METADATA").text = "foo"
+        ext = ET.SubElement(root, "INTU.XXX")
+        ET.SubElement(ext, "DATA").text = "bar"
+
+        try:
+            self.assertIs(INTUXXX.register("INTU.XXX"), INTUXXX)
+            self.assertIs(Aggregate._registry["INTU.XXX"], INTUXXX)
+            instance = Aggregate.from_etree(root)
+            self.assertIsInstance(instance, TESTEXTENDED)
+            self.assertIsInstance(instance.intuxxx, INTUXXX)
+            self.assertEqual(instance.intuxxx.data, "bar")
+            self.assertEqual(ET.tostring(instance.to_etree()), ET.tostring(root))
+
+            # Explicit registration overrides
+            TESTEXTENDED.register("TESTAGGREGATE2")
+            elem = ET.fromstring(
+                b"<TESTAGGREGATE2><METADATA>foo</METADATA></TESTAGGREGATE2>"
+            )
+            instance = Aggregate.from_etree(elem)
+            self.assertIsInstance(instance, TESTEXTENDED)
+            self.assertEqual(instance.to_etree().tag, "TESTAGGREGATE2")
+        finally:
+            TESTAGGREGATE2.register()
+            del Aggregate._registry["INTU.XXX"]
+            del Aggregate._registry["INTUXXX"]
+            del Aggregate._registry["TESTEXTENDED"]
+
+        self.assertIs(Aggregate._registry["TESTAGGREGATE2"], TESTAGGREGATE2)
+        with self.assertRaises(OFXSpecError):
+            Aggregate.from_etree(ET.Element("INTU.XXX"))
+
+    def testFromEtreeLazy(self):
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "REQ00").text = "Y"
+        ET.SubElement(root, "REQ11").text = "N"
+        sub = ET.SubElement(root, "TESTSUBAGGREGATE")
+        ET.SubElement(sub, "DATA").text = "data"
+
+        instance = Aggregate.from_etree(root, lazy=True)
+        self.assertIsInstance(instance, TESTAGGREGATE)
+        self.assertIs(stored(instance, "req00"), Types.UNSET)
+        # Unsupported attributes are never converted, so there's nothing to defer
+        self.assertIsNone(stored(instance, "dontuse"))
+
+        # Attributes are converted on first access, and cached
+        self.assertEqual(instance.req00, True)
+        self.assertIs(stored(instance, "req00"), True)
+        self.assertIs(stored(instance, "testsubaggregate"), Types.UNSET)
+        subagg = instance.testsubaggregate
+        self.assertIsInstance(subagg, TESTSUBAGGREGATE)
+        self.assertIs(instance.testsubaggregate, subagg)
+        self.assertIsNone(instance.option00)
+        self.assertIsNone(instance.dontuse)
+
+        # Proxy access to attributes of SubAggregates
+        self.assertEqual(instance.data, "data")
+        with self.assertRaises(AttributeError):
+            instance.nonexistent
+
+        self.assertEqual(ET.tostring(instance.to_etree()), ET.tostring(root))
+
+    def testFromEtreeLazyInvalid(self):
+        # Validation is deferred until first access
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "REQ00").text = "garbage"
+        ET.SubElement(root, "REQ11").text = "N"
+        instance = Aggregate.from_etree(root, lazy=True)
+        self.assertEqual(instance.req11, False)
+        with self.assertRaises(ValueError):
+            instance.req00
+        with self.assertRaises(Types.OFXSpecError):
+            instance.metadata
+
+        # Mutexes are checked on first access to any attribute
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "REQ00").text = "Y"
+        instance = Aggregate.from_etree(root, lazy=True)
+        with self.assertRaises(OFXSpecError):
+            instance.metadata
+
+    def testSlots(self):
+        # Subclasses get empty ``__slots__`` too, so instances have no ``__dict__``
+        self.assertEqual(TESTAGGREGATE.__slots__, ())
+        self.assertFalse(hasattr(self.instance_with_subagg, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.instance_with_subagg.foo = "bar"
+
+        # They can still be weakly referenced, though
+        instance = self.instance_with_subagg
+        ref = weakref.ref(instance)
+        self.assertIs(ref(), instance)
+
+        # As do all the models, including those with mixins
+        for name in dir(models):
+            cls = getattr(models, name)
+            if isinstance(cls, type) and issubclass(cls, Aggregate):
+                with self.subTest(cls=name):
+                    self.assertEqual(cls.__dictoffset__, 0)
+                    self.assertNotEqual(cls.__weakrefoffset__, 0)
+
     def testFromEtreeBadArg(self):
         with self.assertRaises(TypeError):
             Aggregate.from_etree(None)
 
+    def testFromTrusted(self):
+        subagg = TESTSUBAGGREGATE._from_trusted(data="bar")
+        # Values are taken as they are, unchecked
+        instance = TESTAGGREGATE._from_trusted(
+            req00=True, req01=True, testsubaggregate=subagg
+        )
+        self.assertIsInstance(instance, TESTAGGREGATE)
+        self.assertIsNone(instance.metadata)
+        self.assertIs(instance.req00, True)
+        self.assertIs(instance.req01, True)
+        self.assertIsNone(instance.req10)
+        self.assertIs(instance.testsubaggregate, subagg)
+        self.assertEqual(instance.data, "bar")
+        self.assertEqual(len(instance), 0)
+
+        instance = self.instance_with_subagg
+        values = {attr: getattr(instance, attr) for attr in TESTAGGREGATE.spec}
+        trusted = TESTAGGREGATE._from_trusted(**values)
+        self.assertEqual(trusted._values, instance._values)
+        self.assertEqual(trusted, instance)
+
+    def testFromEtreeUnvalidated(self):
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "REQ00").text = "Y"
+        ET.SubElement(root, "REQ01").text = "N"
+        sub = ET.SubElement(root, "TESTSUBAGGREGATE")
+        ET.SubElement(sub, "DATA").text = "data"
+        ET.SubElement(root, "DONTUSE").text = "dontuse"
+        # Missing required metadata; both of requiredMutexes req00/req01
+        with self.assertRaises(OFXSpecError):
+            Aggregate.from_etree(root)
+
+        instance = Aggregate.from_etree(root, validate=False)
+        self.assertIsInstance(instance, TESTAGGREGATE)
+        self.assertIsNone(instance.metadata)
+        # Elements are still type-converted
+        self.assertIs(instance.req00, True)
+        self.assertIs(instance.req01, False)
+        self.assertIsInstance(instance.testsubaggregate, TESTSUBAGGREGATE)
+        self.assertEqual(instance.testsubaggregate.data, "data")
+        self.assertIsNone(instance.dontuse)
+
+        # Malformed values are still rejected
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "REQ00").text = "garbage"
+        ET.SubElement(root, "REQ11").text = "N"
+        with self.assertRaises(ValueError) as validated:
+            Aggregate.from_etree(root)
+        with self.assertRaises(ValueError) as unvalidated:
+            Aggregate.from_etree(root, validate=False)
+        # ...with the same error
+        self.assertIs(type(unvalidated.exception), type(validated.exception))
+        self.assertEqual(str(unvalidated.exception), str(validated.exception))
+        self.assertIn("TESTAGGREGATE.req00", str(unvalidated.exception))
+
+    def testFromEtreeUnvalidatedLazy(self):
+        root = ET.Element("TESTSUBAGGREGATE")
+        ET.SubElement(root, "DATA").text = "data"
+        with self.assertRaises(ValueError):
+            Aggregate.from_etree(root, lazy=True, validate=False)
+
     def testGroom(self):
-        pass
+        # Extended tags are skipped without warning; input isn't modified
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "METADATA").text = "foo"
+        ET.SubElement(root, "INTU.XXX").text = "extended"
+        ET.SubElement(root, "REQ00").text = "Y"
+        ET.SubElement(root, "REQ11").text = "N"
+        before = ET.tostring(root)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            instance = Aggregate.from_etree(root)
+        self.assertIsInstance(instance, TESTAGGREGATE)
+        self.assertEqual(ET.tostring(root), before)
 
-    def testUngroom(self):
-        pass
+    def testGroomDeprecated(self):
+        # Overriding ``groom()`` is deprecated, but the override is still called
+        with self.assertWarns(DeprecationWarning):
+
+            class GROOMED(TESTAGGREGATE):
+                @staticmethod
+                def groom(elem):
+                    elem = copy.deepcopy(elem)
+                    elem.remove(elem.find("EXTRA"))
+                    return elem
+
+        root = ET.Element("GROOMED")
+        ET.SubElement(root, "METADATA").text = "foo"
+        ET.SubElement(root, "EXTRA").text = "extra"
+        ET.SubElement(root, "REQ00").text = "Y"
+        ET.SubElement(root, "REQ11").text = "N"
+        before = ET.tostring(root)
+        for kwargs in ({}, {"validate": False}, {"lazy": True}):
+            with self.subTest(**kwargs):
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error")
+                    instance = Aggregate.from_etree(root, **kwargs)
+                self.assertIsInstance(instance, GROOMED)
+                self.assertEqual(instance.metadata, "foo")
+                self.assertEqual(instance.req00, True)
+                self.assertEqual(ET.tostring(root), before)
+
+    def testTagAliases(self):
+        class ALIASED(Aggregate):
+            metadata = String(32)
+            frm = String(32)
+
+            tagAliases = {"FROM": "frm"}
+
+        self.assertEqual(ALIASED._schema.tagnames["frm"], "FROM")
+        self.assertEqual(ALIASED._schema.tags["from"], ("frm", 1, False, False))
+        # Attribute name is accepted as tag as well
+        self.assertEqual(ALIASED._schema.tags["frm"], ("frm", 1, False, False))
+
+        root = ET.Element("ALIASED")
+        ET.SubElement(root, "METADATA").text = "foo"
+        ET.SubElement(root, "FROM").text = "bar"
+        before = ET.tostring(root)
+        instance = ALIASED._convert(root)
+        self.assertEqual(instance.frm, "bar")
+        self.assertEqual(ET.tostring(root), before)
+        self.assertEqual(ET.tostring(instance.to_etree()), before)
+
+        # Aliases must refer to attributes defined in the spec
+        with self.assertRaises(ValueError):
+
+            class BADALIAS(Aggregate):
+                frm = String(32)
+
+                tagAliases = {"FROM": "from_"}
 
     def testFilterAttrs(self):
         """
@@ -332,6 +593,57 @@ class AggregateTestCase(unittest.TestCase):
         # (to which it refers)
         self.assertIsInstance(instance1, SubAggregate)
 
+    def testSchema(self):
+        # Class attribute metadata is precomputed once per class
+        schema = TESTAGGREGATE._schema
+        self.assertIsInstance(schema, AggregateSchema)
+        self.assertIs(TESTAGGREGATE._schema, schema)
+        self.assertEqual(schema.spec, TESTAGGREGATE.spec)
+        self.assertEqual(list(schema.spec), list(TESTAGGREGATE.spec))
+        self.assertEqual(
+            schema.spec_no_listaggregates, TESTAGGREGATE.spec_no_listaggregates
+        )
+        self.assertEqual(schema.elements, TESTAGGREGATE.elements)
+        self.assertEqual(schema.subaggregates, TESTAGGREGATE.subaggregates)
+        self.assertEqual(schema.unsupported, TESTAGGREGATE.unsupported)
+        self.assertEqual(schema.positions["metadata"], 0)
+        self.assertEqual(schema.positions["dontuse"], 10)
+        self.assertEqual(schema.listmembers, frozenset())
+        self.assertEqual(schema.tags["metadata"], ("metadata", 0, False, False))
+        self.assertEqual(
+            schema.tags["testsubaggregate"], ("testsubaggregate", 9, False, False)
+        )
+        self.assertEqual(schema.tags["dontuse"], ("dontuse", 10, False, True))
+        self.assertEqual(list(schema.tags), list(schema.spec))
+        self.assertEqual(schema.tagnames["testsubaggregate"], "TESTSUBAGGREGATE")
+
+        self.assertEqual(
+            TESTLIST._schema.listmembers, {"testaggregate", "testaggregate2"}
+        )
+        self.assertEqual(TESTLIST._schema.listaggregates, TESTLIST.listaggregates)
+        self.assertEqual(
+            TESTLIST._schema.tags["testaggregate2"], ("testaggregate2", 2, True, False)
+        )
+
+        # AggregateSchema is read-only
+        with self.assertRaises(TypeError):
+            schema.spec["foo"] = String()
+
+        # Classproperties hand out copies of the schema
+        spec = TESTAGGREGATE.spec
+        spec.popitem()
+        self.assertIn("dontuse", TESTAGGREGATE._schema.spec)
+
+    def testSchemaSubclass(self):
+        # Subclasses inherit & override their parents' class attributes
+        class SUBAGGREGATE(TESTAGGREGATE2):
+            metadata = Bool()
+            extra = String(32)
+
+        self.assertEqual(list(SUBAGGREGATE._schema.spec), ["metadata", "extra"])
+        self.assertIsInstance(SUBAGGREGATE._schema.spec["metadata"], Bool)
+        self.assertIsInstance(TESTAGGREGATE2._schema.spec["metadata"], String)
+
     def testSpec(self):
         spec = TESTAGGREGATE.spec
         self.assertEqual(len(spec), 11)
@@ -520,23 +832,6 @@ class UnsupportedTestCase(unittest.TestCase):
 
 
 class ListTestCase(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        # monkey-patch ofxtools.models so Aggregate.from_etree() picks up
-        # our fake OFX aggregates/elements
-        models.TESTSUBAGGREGATE = TESTSUBAGGREGATE
-        models.TESTAGGREGATE = TESTAGGREGATE
-        models.TESTAGGREGATE2 = TESTAGGREGATE2
-        models.TESTLIST = TESTLIST
-
-    @classmethod
-    def tearDownClass(cls):
-        # Remove monkey patch
-        del models.TESTSUBAGGREGATE
-        del models.TESTAGGREGATE
-        del models.TESTAGGREGATE2
-        del models.TESTLIST
-
     def assertElement(self, elem, tag, text, len):
         self.assertIsInstance(elem, ET.Element)
         self.assertEqual(elem.tag, tag)
@@ -599,6 +894,49 @@ class ListTestCase(unittest.TestCase):
         with self.assertRaises(OFXSpecError):
             Aggregate.from_etree(root)
 
+    def testFromEtreeUnvalidated(self):
+        instance = Aggregate.from_etree(self.root, validate=False)
+        self.assertIsInstance(instance, TESTLIST)
+        self.assertEqual(instance, Aggregate.from_etree(self.root))
+        self.assertEqual(instance._values, self.instance._values)
+        agg0, agg1, agg2 = instance[:]
+        self.assertEqual(agg0._values, self.instance[0]._values)
+        self.assertEqual(agg1.data, "quuz")
+        self.assertEqual(agg2.metadata, "dumbo")
+
+        # Sequence is still checked, to sort list members from the rest
+        root = ET.Element("TESTLIST")
+        agg = ET.SubElement(root, "TESTAGGREGATE2")
+        ET.SubElement(agg, "METADATA").text = "dumbo"
+        ET.SubElement(root, "METADATA").text = "foo"
+        with self.assertRaises(OFXSpecError):
+            Aggregate.from_etree(root, validate=False)
+
+    def testFromEtreeLazy(self):
+        # List members are available up front, but not yet converted
+        instance = Aggregate.from_etree(self.root, lazy=True)
+        self.assertIsInstance(instance, TESTLIST)
+        self.assertEqual(len(instance), 3)
+        agg0, agg1, agg2 = instance[:]
+        self.assertIsInstance(agg0, TESTAGGREGATE)
+        self.assertIsInstance(agg1, TESTAGGREGATE)
+        self.assertIsInstance(agg2, TESTAGGREGATE2)
+        self.assertIs(stored(agg0, "metadata"), Types.UNSET)
+
+        self.assertEqual(instance.metadata, "foo")
+        self.assertEqual(agg1.data, "quuz")
+        self.assertEqual(agg2.metadata, "dumbo")
+
+    def testFromEtreeLazyWrongOrder(self):
+        root = ET.Element("TESTLIST")
+        agg = ET.SubElement(root, "TESTAGGREGATE2")
+        ET.SubElement(agg, "METADATA").text = "dumbo"
+        ET.SubElement(root, "METADATA").text = "foo"
+
+        # Aggregates containing list members are sorted immediately
+        with self.assertRaises(OFXSpecError):
+            Aggregate.from_etree(root, lazy=True)
+
     def testInitInstancesDistinct(self):
         # Test that separate List class instances contain separate data
         instance0 = self.instance
@@ -665,6 +1003,110 @@ class ListTestCase(unittest.TestCase):
         with self.assertRaises(SyntaxError):
             TESTLIST(agg0, metadata="foo", testaggregate=agg1)
 
+    def testWrite(self):
+        output = BytesIO()
+        self.instance.write(output)
+        self.assertEqual(
+            output.getvalue().decode(),
+            "<TESTLIST><METADATA>foo</METADATA>"
+            "<TESTAGGREGATE><METADATA>foo</METADATA><REQ00>Y</REQ00>"
+            "<REQ11>N</REQ11><TESTSUBAGGREGATE><DATA>quux</DATA></TESTSUBAGGREGATE>"
+            "</TESTAGGREGATE>"
+            "<TESTAGGREGATE><METADATA>bar</METADATA><REQ00>N</REQ00>"
+            "<REQ11>Y</REQ11><TESTSUBAGGREGATE><DATA>quuz</DATA></TESTSUBAGGREGATE>"
+            "</TESTAGGREGATE>"
+            "<TESTAGGREGATE2><METADATA>dumbo</METADATA></TESTAGGREGATE2>"
+            "</TESTLIST>",
+        )
+
+        output = BytesIO()
+        self.instance.write(output, prettyprint=True, close_elements=False)
+        self.assertEqual(
+            output.getvalue().decode(),
+            "<TESTLIST>\n"
+            "  <METADATA>foo\n"
+            "  <TESTAGGREGATE>\n"
+            "    <METADATA>foo\n"
+            "    <REQ00>Y\n"
+            "    <REQ11>N\n"
+            "    <TESTSUBAGGREGATE>\n"
+            "      <DATA>quux\n"
+            "    </TESTSUBAGGREGATE>\n"
+            "  </TESTAGGREGATE>\n"
+            "  <TESTAGGREGATE>\n"
+            "    <METADATA>bar\n"
+            "    <REQ00>N\n"
+            "    <REQ11>Y\n"
+            "    <TESTSUBAGGREGATE>\n"
+            "      <DATA>quuz\n"
+            "    </TESTSUBAGGREGATE>\n"
+            "  </TESTAGGREGATE>\n"
+            "  <TESTAGGREGATE2>\n"
+            "    <METADATA>dumbo\n"
+            "  </TESTAGGREGATE2>\n"
+            "</TESTLIST>\n",
+        )
+
+    def testWriteHeader(self):
+        output = BytesIO()
+        self.instance.write(output, version=102, close_elements=False)
+        data = output.getvalue()
+        self.assertTrue(data.startswith(b"OFXHEADER:100\r\n"))
+        self.assertIn(b"VERSION:102\r\n", data)
+        self.assertIn(b"\r\n\r\n<TESTLIST><METADATA>foo<TESTAGGREGATE>", data)
+
+        with self.assertRaises(ValueError):
+            self.instance.write(BytesIO(), version=203, close_elements=False)
+
+    def testWriteFlush(self):
+        # Output is written a bit at a time
+        instance = TESTLIST(*(TESTAGGREGATE2(metadata=str(i)) for i in range(5000)))
+        output = Mock(wraps=BytesIO())
+        instance.write(output)
+        self.assertGreater(output.write.call_count, 1)
+        self.assertEqual(
+            output.getvalue(),
+            ET.tostring(instance.to_etree(), encoding="utf_8", method="html"),
+        )
+
+    def testWriteLazy(self):
+        instance = Aggregate.from_etree(self.root, lazy=True)
+        output = BytesIO()
+        instance.write(output)
+        self.assertEqual(output.getvalue(), ET.tostring(self.root, method="html"))
+
+    def testWriteEscape(self):
+        instance = TESTAGGREGATE2(metadata="AT&T <Pref> Ünïcode")
+        output = BytesIO()
+        instance.write(output)
+        self.assertEqual(
+            output.getvalue().decode(),
+            "<TESTAGGREGATE2><METADATA>AT&amp;T &lt;Pref&gt; Ünïcode</METADATA>"
+            "</TESTAGGREGATE2>",
+        )
+
+    def testWriteUngroom(self):
+        # Overriding ``ungroom()`` is deprecated, but the override is still
+        # called; ``write()`` falls back to serializing ``to_etree()``
+        with self.assertWarns(DeprecationWarning):
+
+            class UNGROOMED(TESTAGGREGATE2):
+                @staticmethod
+                def ungroom(elem):
+                    elem = copy.deepcopy(elem)
+                    ET.SubElement(elem, "EXTRA").text = "extra"
+                    return elem
+
+        instance = TESTLIST._from_trusted(UNGROOMED(metadata="foo"), metadata="bar")
+        self.assertEqual(instance[0].to_etree()[-1].tag, "EXTRA")
+        for prettyprint in (False, True):
+            root = instance.to_etree()
+            if prettyprint:
+                indent(root)
+            output = BytesIO()
+            instance.write(output, prettyprint=prettyprint)
+            self.assertEqual(output.getvalue(), ET.tostring(root, method="html"))
+
     def testToEtree(self):
         root = self.instance.to_etree()
         self.assertElement(root, tag="TESTLIST", text=None, len=4)
@@ -699,21 +1141,58 @@ class ListTestCase(unittest.TestCase):
         rep = repr(self.instance)
         self.assertEqual(rep, "<TESTLIST(metadata='foo'), len=3>")
 
+    def testGetstate(self):
+        instance = self.instance
+        values, items = instance.__getstate__()
+        # Trailing Nones are trimmed
+        self.assertEqual(values, ("foo",))
+        self.assertEqual(items, tuple(instance))
+
+        values, items = instance[0].__getstate__()
+        index = TESTAGGREGATE._schema.positions["testsubaggregate"]
+        self.assertEqual(len(values), index + 1)
+        self.assertIs(values[-1], instance[0].testsubaggregate)
+        self.assertEqual(items, ())
+
+    def testPickle(self):
+        instance = self.instance
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            with patch.object(TESTAGGREGATE, "validate_args") as mock_validate:
+                restored = pickle.loads(pickle.dumps(instance, protocol=protocol))
+            # Restored without validation
+            mock_validate.assert_not_called()
+            self.assertIsInstance(restored, TESTLIST)
+            self.assertEqual(repr(restored), repr(instance))
+            root = restored.to_etree()
+            self.assertEqual(ET.tostring(root), ET.tostring(self.root))
+            self.assertEqual(restored[1].data, "quuz")
+
+    def testPickleLazy(self):
+        instance = Aggregate.from_etree(self.root, lazy=True)
+        restored = pickle.loads(pickle.dumps(instance))
+        self.assertEqual(ET.tostring(restored.to_etree()), ET.tostring(self.root))
+
+    def testPickleLazyInvalid(self):
+        root = self.root
+        root[2].remove(root[2][0])  # TESTAGGREGATE.METADATA is required
+        instance = Aggregate.from_etree(root, lazy=True)
+        with self.assertRaises(ValueError):
+            pickle.dumps(instance)
+
+    def testCopy(self):
+        instance = self.instance
+        shallow = copy.copy(instance)
+        self.assertEqual(shallow.metadata, "foo")
+        self.assertIs(shallow[0], instance[0])
+
+        deep = copy.deepcopy(instance)
+        self.assertEqual(repr(deep), repr(instance))
+        self.assertIsNot(deep[0], instance[0])
+
 
 class ElementListTestCase(unittest.TestCase):
     __test__ = True
 
-    @classmethod
-    def setUpClass(cls):
-        # monkey-patch ofxtools.models so Aggregate.from_etree() picks up
-        # our fake OFX aggregates/elements
-        models.TESTELEMENTLIST = TESTELEMENTLIST
-
-    @classmethod
-    def tearDownClass(cls):
-        # Remove monkey patch
-        del models.TESTELEMENTLIST
-
     def assertElement(self, elem, tag, text, len):
         self.assertIsInstance(elem, ET.Element)
         self.assertEqual(elem.tag, tag)
@@ -758,6 +1237,14 @@ class ElementListTestCase(unittest.TestCase):
         with self.assertRaises(AssertionError):
             BADELEMENTLIST(True, metadata="something")
 
+    def testSchema(self):
+        # ElementList.listaggregates holds ListElements instead of ListAggregates
+        schema = TESTELEMENTLIST._schema
+        self.assertEqual(list(schema.listaggregates), ["tag"])
+        self.assertEqual(list(schema.listelements), ["tag"])
+        self.assertEqual(schema.listmembers, {"tag"})
+        self.assertEqual(TESTELEMENTLIST.listaggregates, schema.listaggregates)
+
     def testFromEtree(self):
         instance = Aggregate.from_etree(self.root)
         self.assertIsInstance(instance, TESTELEMENTLIST)
@@ -766,6 +1253,11 @@ class ElementListTestCase(unittest.TestCase):
         self.assertEqual(instance[0], False)
         self.assertEqual(instance[1], True)
 
+        instance = Aggregate.from_etree(self.root, validate=False)
+        self.assertIsInstance(instance, TESTELEMENTLIST)
+        self.assertEqual(instance.metadata, "something")
+        self.assertEqual(instance[:], [False, True])
+
         # Out of order - invalid
         root = ET.Element("TESTELEMENTLIST")
         ET.SubElement(root, "TAG").text = "N"
@@ -0,0 +1,138 @@
+# coding: utf-8
+"""Unit tests for ofxtools.models.columns"""
+
+# stdlib imports
+import unittest
+from unittest.mock import patch
+from array import array
+from datetime import datetime
+from decimal import Decimal
+import os
+
+# local imports
+from ofxtools.Parser import OFXTree
+from ofxtools.models.columns import NULL, ColumnBuilder
+from ofxtools.models.wrapperbases import TranList
+from ofxtools.utils import UTC
+
+DATADIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+try:
+    import numpy  # type: ignore
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def micros(*args):
+    """Microseconds since the epoch"""
+    delta = datetime(*args, tzinfo=UTC) - datetime(1970, 1, 1, tzinfo=UTC)
+    return delta.days * 86400000000 + delta.seconds * 1000000 + delta.microseconds
+
+
+@patch("ofxtools.models.columns._import_numpy", return_value=None)
+class ColumnsTestCase(unittest.TestCase):
+    fields = ["dttrade", "fitid", "trntype", "total", "units", "incometype"]
+
+    def setUp(self):
+        self.tree = OFXTree()
+        self.tree.parse(os.path.join(DATADIR, "invstmtrs.ofx"))
+        self.ofx = self.tree.convert()
+        self.tranlist = self.ofx.statements[0].transactions
+
+    def testToColumns(self, mock_numpy):
+        columns = self.tranlist.to_columns(self.fields)
+        self.assertEqual(list(columns), self.fields)
+
+        # DateTime - array of epoch microseconds; INVBANKTRAN has no INVTRAN
+        self.assertEqual(columns["dttrade"], array("q", [micros(2005, 8, 25), NULL]))
+        # Found as BUYSTOCK.invbuy.invtran.fitid & INVBANKTRAN.stmttrn.fitid
+        self.assertEqual(columns["fitid"], ("23321", "12345"))
+        self.assertEqual(columns["trntype"], (None, "CREDIT"))
+        # Decimal - unscaled
+        self.assertEqual(columns["total"], (Decimal("-5025.00"), None))
+        self.assertEqual(columns["units"], (Decimal("100"), None))
+        # Attribute of some other transaction class
+        self.assertEqual(columns["incometype"], (None, None))
+
+    def testToColumnsScale(self, mock_numpy):
+        columns = self.tranlist.to_columns(["total", "units"], scale=2)
+        self.assertEqual(columns["total"], array("q", [-502500, NULL]))
+        self.assertEqual(columns["units"], array("q", [10000, NULL]))
+
+    def testToColumnsInterned(self, mock_numpy):
+        columns = self.tranlist.to_columns(["trntype"])
+        trntype = columns["trntype"][1]
+        self.assertIs(trntype, "CREDIT")
+
+    def testToColumnsDefaultFields(self, mock_numpy):
+        columns = self.tranlist.to_columns()
+        # Elements defined directly on transaction classes, not SubAggregates
+        self.assertIn("units", columns)
+        self.assertIn("subacctfund", columns)
+        self.assertNotIn("dttrade", columns)
+        self.assertNotIn("invbuy", columns)
+        self.assertEqual(columns["subacctfund"], ("CASH", "CASH"))
+
+    def testToColumnsUnknownField(self, mock_numpy):
+        with self.assertRaises(ValueError):
+            self.tranlist.to_columns(["dttrade", "bogus"])
+
+    def testColumnsFromEtree(self, mock_numpy):
+        elem = self.tree.find(".//INVTRANLIST")
+        columns = TranList.columns_from_etree(elem, self.fields)
+        self.assertEqual(columns, self.tranlist.to_columns(self.fields))
+
+        columns = TranList.columns_from_etree(elem, self.fields, scale=2)
+        self.assertEqual(columns, self.tranlist.to_columns(self.fields, scale=2))
+
+    def testColumnsFromEtreeDefaultFields(self, mock_numpy):
+        elem = self.tree.find(".//INVTRANLIST")
+        columns = TranList.columns_from_etree(elem)
+        self.assertEqual(columns, self.tranlist.to_columns())
+
+    def testColumnsFromEtreeInvalid(self, mock_numpy):
+        elem = self.tree.find(".//INVTRANLIST/BUYSTOCK/INVBUY/INVTRAN/DTTRADE")
+        elem.text = "garbage"
+        elem = self.tree.find(".//INVTRANLIST")
+        with self.assertRaises(ValueError):
+            TranList.columns_from_etree(elem, ["dttrade"])
+        # Unselected Elements aren't validated
+        TranList.columns_from_etree(elem, ["fitid"])
+
+    def testOfxToColumns(self, mock_numpy):
+        columns = self.ofx.to_columns(["fitid", "dtposted"])
+        self.assertEqual(columns["fitid"], ("23321", "12345"))
+        self.assertEqual(columns["dtposted"], array("q", [NULL, micros(2005, 8, 25)]))
+
+    def testBuilderConcatenates(self, mock_numpy):
+        builder = ColumnBuilder(["fitid"])
+        builder.add(self.tranlist)
+        builder.add_etree(self.tree.find(".//INVTRANLIST"))
+        self.assertEqual(
+            builder.build(), {"fitid": ("23321", "12345", "23321", "12345")}
+        )
+
+
+@unittest.skipUnless(HAS_NUMPY, "Requires NumPy")
+class NumPyColumnsTestCase(unittest.TestCase):
+    def setUp(self):
+        tree = OFXTree()
+        tree.parse(os.path.join(DATADIR, "invstmtrs.ofx"))
+        self.tranlist = tree.convert().statements[0].transactions
+
+    def testToColumns(self):
+        columns = self.tranlist.to_columns(["dttrade", "total", "fitid"], scale=2)
+        dttrade = columns["dttrade"]
+        self.assertEqual(dttrade.dtype, numpy.dtype("datetime64[us]"))
+        self.assertEqual(dttrade[0], numpy.datetime64("2005-08-25T00:00:00"))
+        self.assertTrue(numpy.isnat(dttrade[1]))
+        self.assertEqual(columns["total"].dtype, numpy.dtype("int64"))
+        self.assertEqual(columns["total"][0], -502500)
+        self.assertEqual(columns["fitid"].dtype, numpy.dtype(object))
+        self.assertEqual(list(columns["fitid"]), ["23321", "12345"])
+
+
+if __name__ == "__main__":
+    unittest.main()
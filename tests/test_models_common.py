@@ -10,7 +10,6 @@ import xml.etree.ElementTree as ET
 
 # local imports
 from ofxtools.Types import DateTime, ListAggregate
-from ofxtools import models
 from ofxtools.models.common import BAL, OFXELEMENT, OFXEXTENSION
 from ofxtools.models.wrapperbases import TranList
 from ofxtools.models.i18n import CURRENCY_CODES
@@ -106,21 +105,6 @@ class OfxextensionTestCase(unittest.TestCase, base.TestAggregate):
 
 
 class TranListTestCase(unittest.TestCase, base.TestAggregate):
-    @classmethod
-    def setUpClass(cls):
-        # monkey-patch ofxtools.models so Aggregate.from_etree() picks up
-        # our fake OFX aggregates/elements
-        models.TESTSUBAGGREGATE = TESTSUBAGGREGATE
-        models.TESTAGGREGATE = TESTAGGREGATE
-        models.TESTTRANLIST = TESTTRANLIST
-
-    @classmethod
-    def tearDownClass(cls):
-        # Remove monkey patch
-        del models.TESTSUBAGGREGATE
-        del models.TESTAGGREGATE
-        del models.TESTTRANLIST
-
     @classproperty
     @classmethod
     def etree(cls):
@@ -0,0 +1,126 @@
+# coding: utf-8
+"""Unit tests for ofxtools.scripts.ofx2records"""
+
+# stdlib imports
+import unittest
+from unittest.mock import patch
+from io import StringIO
+import csv
+import json
+import os
+import shutil
+import tempfile
+
+# local imports
+from ofxtools.scripts import ofx2records
+
+DATADIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+class IterRecordsTestCase(unittest.TestCase):
+    def testInvstmtrs(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        records = list(ofx2records.iter_records(path))
+        self.assertEqual(len(records), 2)
+        buystock, stmttrn = records
+        for record in records:
+            self.assertEqual(tuple(record), ofx2records.FIELDS)
+            self.assertEqual(record["file"], path)
+            self.assertEqual(record["acctid"], "999988")
+            self.assertEqual(record["currency"], "USD")
+
+        self.assertEqual(buystock["type"], "BUYSTOCK")
+        self.assertEqual(buystock["fitid"], "23321")
+        self.assertEqual(buystock["trntype"], "BUY")
+        self.assertEqual(buystock["date"], "2005-08-25T00:00:00+00:00")
+        self.assertEqual(buystock["amount"], "-5025.00")
+        self.assertEqual(buystock["units"], "100")
+        self.assertEqual(buystock["unitprice"], "50.00")
+        self.assertEqual(buystock["uniqueidtype"], "CUSIP")
+        self.assertEqual(buystock["uniqueid"], "123456789")
+        # Resolved from SECLIST, which follows the statement
+        self.assertEqual(buystock["ticker"], "ACME")
+        self.assertEqual(buystock["secname"], "Acme Development, Inc.")
+
+        # INVBANKTRAN
+        self.assertEqual(stmttrn["type"], "STMTTRN")
+        self.assertEqual(stmttrn["fitid"], "12345")
+        self.assertEqual(stmttrn["trntype"], "CREDIT")
+        self.assertEqual(stmttrn["amount"], "1000.00")
+        self.assertEqual(stmttrn["name"], "Customer deposit")
+        self.assertIsNone(stmttrn["ticker"])
+
+    def testStmtrs(self):
+        path = os.path.join(DATADIR, "stmtrs.ofx")
+        with patch.object(ofx2records, "read_securities") as mock_read:
+            records = list(ofx2records.iter_records(path))
+        # No investment transactions - no need to look up securities
+        mock_read.assert_not_called()
+        self.assertEqual([r["fitid"] for r in records], ["00002", "00003"])
+        self.assertEqual([r["checknum"] for r in records], ["1000", None])
+        self.assertEqual([r["amount"] for r in records], ["-200.00", "-300.00"])
+
+    def testReadSecurities(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        securities = ofx2records.read_securities(path)
+        self.assertEqual(len(securities), 3)
+        self.assertEqual(
+            securities[("CUSIP", "123456789")], ("ACME", "Acme Development, Inc.")
+        )
+
+
+class ExportTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        for filename in ("stmtrs.ofx", "invstmtrs.ofx"):
+            shutil.copy(os.path.join(DATADIR, filename), self.tmpdir)
+        with open(os.path.join(self.tmpdir, "bad.ofx"), "wb") as f:
+            f.write(b"garbage")
+        with open(os.path.join(self.tmpdir, "README"), "w") as f:
+            f.write("Not OFX")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _export(self, format, workers):
+        output = StringIO(newline="")
+        with self.assertLogs(ofx2records.logger, "ERROR"):
+            count, failed = ofx2records.export(
+                [self.tmpdir], output, format=format, workers=workers
+            )
+        self.assertEqual(count, 4)
+        self.assertEqual(failed, [os.path.join(self.tmpdir, "bad.ofx")])
+        return output.getvalue()
+
+    def testExportCsv(self):
+        rows = list(csv.reader(StringIO(self._export("csv", 1), newline="")))
+        self.assertEqual(tuple(rows[0]), ofx2records.FIELDS)
+        # Input order
+        fitids = [row[4] for row in rows[1:]]
+        self.assertEqual(fitids, ["23321", "12345", "00002", "00003"])
+
+    def testExportJsonl(self):
+        lines = self._export("jsonl", 1).splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(
+            [r["fitid"] for r in records], ["23321", "12345", "00002", "00003"]
+        )
+        self.assertIsNone(records[0]["name"])
+
+    def testExportWorkers(self):
+        self.assertEqual(self._export("csv", 2), self._export("csv", 1))
+
+    def testExportCleansUp(self):
+        tmpdir = tempfile.gettempdir()
+        before = set(os.listdir(tmpdir))
+        self._export("csv", 1)
+        leftovers = [
+            name
+            for name in set(os.listdir(tmpdir)) - before
+            if name.startswith("ofx2records-")
+        ]
+        self.assertEqual(leftovers, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
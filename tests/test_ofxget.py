@@ -1265,6 +1265,33 @@ class ReadScanResponseTestCase(unittest.TestCase):
                 ),
             )
 
+    def testReadScanResponseUnseekable(self):
+        # Like http.client.HTTPResponse: a readable context manager, no seek()
+        class Response:
+            def __init__(self, data):
+                self.read = BytesIO(data).read
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                pass
+
+        markup = self.client.serialize(self.ofx)
+        with patch("concurrent.futures.Future.result") as mock_result:
+            mock_result.return_value = Response(markup)
+            future = concurrent.futures.Future()
+            valid, signoninfo = ofxget._read_scan_response(future, read_signoninfo=True)
+        self.assertTrue(valid)
+        self.assertEqual(len(signoninfo), 4)
+
+        # Empty response: return False, empty SIGNONINFO parameters
+        with patch("concurrent.futures.Future.result") as mock_result:
+            mock_result.return_value = Response(b"")
+            future = concurrent.futures.Future()
+            result = ofxget._read_scan_response(future, read_signoninfo=True)
+        self.assertEqual(result, (False, {}))
+
 
 class CollateScanResultsTestCase(unittest.TestCase):
     def testCollateScanResults(self):
@@ -5,14 +5,30 @@
 import unittest
 from unittest import TestCase
 from unittest.mock import MagicMock, call, patch, sentinel
-from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import Element, tostring
 from io import BytesIO
+import os
+import re
+import warnings
 from tempfile import NamedTemporaryFile
 from collections import namedtuple
 
 
 # local imports
-from ofxtools.Parser import OFXTree, TreeBuilder, ParseError
+from ofxtools.Parser import OFXTree, TreeBuilder, IterBuilder, ModelBuilder, ParseError
+from ofxtools.models import (
+    STMTTRN,
+    BUYSTOCK,
+    INVBUY,
+    STATUS,
+    SECLIST,
+    SECLISTMSGSRSV1,
+)
+from ofxtools.models.base import OFXSpecError, UnknownTagWarning
+from ofxtools.header import OFXHeaderV1, OFXHeaderV2, OFXHeaderError
+
+
+DATADIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
 
 # Container for results of TreeBuilderRegexTestCase._parsetag()
@@ -156,12 +172,14 @@ class TreeBuilderRegexTestCase(TestCase):
     def test_finditer_sgml(self):
         markup = "<TAG1><TAG2>value"
         self.builder.feed(markup)
+        self.builder.close()
         expected = [call("TAG1", None, None), call("TAG2", "value", None)]
         self.assertEqual(self.builder._feedmatch.mock_calls, expected)
 
     def test_finditer_xml(self):
         markup = "<TAG1><TAG2>value</TAG2></TAG1>"
         self.builder.feed(markup)
+        self.builder.close()
         expected = [
             call("TAG1", None, None),
             call("TAG2", "value", "TAG2"),
@@ -253,11 +271,13 @@ class TreeBuilderUnitTestCase(TestCase):
         data = "</FOO>illegal"
         with self.assertRaises(ParseError):
             self.builder.feed(data)
+            self.builder.close()
 
     def test_open_tail(self):
         data = "<FOO>bar</FOO>illegal"
         with self.assertRaises(ParseError):
             self.builder.feed(data)
+            self.builder.close()
 
 
 class TreeBuilderUnitFunctionalTestCase(TestCase):
@@ -485,6 +505,211 @@ class TreeBuilderUnitFunctionalTestCase(TestCase):
         self._testElement(usehtml, tag="USEHTML", text="Y", length=0)
 
 
+class TreeBuilderIncrementalTestCase(TestCase):
+    """Tests for ofxtools.Parser.Treebuilder.feed() of partial markup"""
+
+    body = (
+        "<MAILTRNRS>"
+        "<TRNUID>54321</TRNUID>"
+        "<MAILRS>"
+        "<MAIL>"
+        "<FROM>Motörhead"
+        "<MSGBODY><![CDATA[<HTML><BODY>I didn’t earn any interest"
+        "</BODY></HTML>]]></MSGBODY>"
+        "<USEHTML>Y"
+        "</MAIL>"
+        "</MAILRS>"
+        "</MAILTRNRS>"
+    )
+
+    def _parse(self, *chunks):
+        builder = TreeBuilder()
+        for chunk in chunks:
+            builder.feed(chunk)
+        return tostring(builder.close())
+
+    def test_split_str(self):
+        expected = self._parse(self.body)
+        for i in range(len(self.body)):
+            with self.subTest(i=i):
+                self.assertEqual(self._parse(self.body[:i], self.body[i:]), expected)
+
+    def test_split_bytes(self):
+        expected = self._parse(self.body)
+        body = self.body.encode("utf_8")
+        for i in range(len(body)):
+            with self.subTest(i=i):
+                self.assertEqual(self._parse(body[:i], body[i:]), expected)
+
+    def test_one_char_at_a_time(self):
+        self.assertEqual(self._parse(*self.body), self._parse(self.body))
+
+    def test_encoding(self):
+        builder = TreeBuilder(encoding="latin_1")
+        builder.feed(b"<FOO>Mot\xf6rhead</FOO>")
+        root = builder.close()
+        self.assertEqual(root.text, "Motörhead")
+
+    def test_holds_back_incomplete(self):
+        builder = TreeBuilder()
+        builder._feedmatch = MagicMock()
+        builder.feed("<TAG1><TAG2>val")
+        self.assertEqual(builder._feedmatch.mock_calls, [call("TAG1", None, None)])
+        builder.feed("ue</TA")
+        self.assertEqual(builder._feedmatch.mock_calls, [call("TAG1", None, None)])
+        builder.feed("G2></TAG1>")
+        builder.close()
+        expected = [
+            call("TAG1", None, None),
+            call("TAG2", "value", "TAG2"),
+            call("/TAG1", None, None),
+        ]
+        self.assertEqual(builder._feedmatch.mock_calls, expected)
+
+    def test_error_position(self):
+        builder = TreeBuilder()
+        builder.feed("<FOO><BAR>bar</BAR>")
+        builder.feed("<BAZ>baz</BAZ>illegal</FOO>")
+        with self.assertRaises(ParseError) as cm:
+            builder.close()
+        self.assertIn("position=[19:40]", cm.exception.args[0])
+
+    def test_feed_buffer(self):
+        expected = self._parse(self.body)
+        body = self.body.encode("utf_8")
+        builder = TreeBuilder()
+        builder.feed_buffer(body)
+        self.assertEqual(tostring(builder.close()), expected)
+
+        # Only buffer[start:end] is tokenized
+        builder = TreeBuilder()
+        builder.feed_buffer(b"junk" + body + b"junk", 4, 4 + len(body))
+        self.assertEqual(tostring(builder.close()), expected)
+
+    def test_feed_buffer_encoding(self):
+        builder = TreeBuilder(encoding="latin_1")
+        builder.feed_buffer(b"<FOO>Mot\xf6rhead</FOO>")
+        root = builder.close()
+        self.assertEqual(root.text, "Motörhead")
+
+    def test_feed_buffer_error_position(self):
+        builder = TreeBuilder()
+        with self.assertRaises(ParseError) as cm:
+            builder.feed_buffer(b"<FOO><BAR>bar</BAR><BAZ>baz</BAZ>illegal</FOO>")
+        self.assertIn("position=[19:40]", cm.exception.args[0])
+
+
+class TreeBuilderSelectionTestCase(TestCase):
+    """Tests for ofxtools.Parser.Treebuilder(include=..., exclude=...)"""
+
+    body = (
+        "<OFX>"
+        "<SIGNONMSGSRSV1><SONRS><DTSERVER>20200101</SONRS></SIGNONMSGSRSV1>"
+        "<BANKMSGSRSV1><STMTTRNRS><TRNUID>1"
+        "<STMTRS><CURDEF>USD"
+        "<BANKTRANLIST><STMTTRN><FITID>1</STMTTRN><STMTTRN><FITID>2</STMTTRN>"
+        "</BANKTRANLIST>"
+        "<LEDGERBAL><BALAMT>1.23<DTASOF>20200101</LEDGERBAL>"
+        "<MKTGINFO></MKTGINFO>"
+        "</STMTRS></STMTTRNRS></BANKMSGSRSV1>"
+        "<SECLISTMSGSRSV1><SECLIST></SECLIST></SECLISTMSGSRSV1>"
+        "</OFX>"
+    )
+
+    def _parse(self, *chunks, **kwargs):
+        builder = TreeBuilder(**kwargs)
+        for chunk in chunks:
+            builder.feed(chunk)
+        return tostring(builder.close()).decode()
+
+    def test_include(self):
+        self.assertEqual(
+            self._parse(self.body, include=["OFX/SIGNONMSGSRSV1"]),
+            "<OFX><SIGNONMSGSRSV1><SONRS><DTSERVER>20200101</DTSERVER></SONRS>"
+            "</SIGNONMSGSRSV1></OFX>",
+        )
+
+    def test_include_nested(self):
+        # Ancestors of included Elements are built, but nothing else in them
+        include = ["ofx/bankmsgsrsv1/stmttrnrs/stmtrs/"]
+        exclude = ["OFX/SIGNONMSGSRSV1", "OFX/*/*/TRNUID", "OFX/SECLISTMSGSRSV1"]
+        self.assertEqual(
+            self._parse(self.body, include=include),
+            self._parse(self.body, exclude=exclude),
+        )
+
+    def test_include_wildcard(self):
+        self.assertEqual(
+            self._parse(self.body, include=["OFX/*/*/*/LEDGERBAL"]),
+            "<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><LEDGERBAL>"
+            "<BALAMT>1.23</BALAMT><DTASOF>20200101</DTASOF>"
+            "</LEDGERBAL></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>",
+        )
+
+    def test_include_nothing(self):
+        self.assertEqual(self._parse(self.body, include=[]), "<OFX />")
+        self.assertEqual(self._parse(self.body, include=["OFX/FOO"]), "<OFX />")
+
+    def test_include_empty(self):
+        self.assertEqual(
+            self._parse(self.body, include=["OFX/SECLISTMSGSRSV1/SECLIST"]),
+            "<OFX><SECLISTMSGSRSV1><SECLIST /></SECLISTMSGSRSV1></OFX>",
+        )
+
+    def test_exclude(self):
+        self.assertEqual(
+            self._parse(
+                self.body,
+                include=["OFX/BANKMSGSRSV1"],
+                exclude=["OFX/*/*/STMTRS/BANKTRANLIST", "OFX/*/*/STMTRS/CURDEF"],
+            ),
+            "<OFX><BANKMSGSRSV1><STMTTRNRS><TRNUID>1</TRNUID><STMTRS>"
+            "<LEDGERBAL><BALAMT>1.23</BALAMT><DTASOF>20200101</DTASOF></LEDGERBAL>"
+            "<MKTGINFO /></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>",
+        )
+
+    def test_skip_scans(self):
+        # Skipped aggregates aren't tokenized
+        builder = TreeBuilder(include=["OFX/SIGNONMSGSRSV1"])
+        with patch.object(builder, "_feedmatch", wraps=builder._feedmatch) as mock:
+            builder.feed(self.body)
+            builder.close()
+        tags = [c.args[0] for c in mock.call_args_list]
+        expected = ["OFX", "SIGNONMSGSRSV1", "SONRS", "DTSERVER", "/SONRS"]
+        expected += ["/SIGNONMSGSRSV1", "/OFX"]
+        self.assertEqual(tags, expected)
+
+    def test_split(self):
+        kwargs = {
+            "include": ["OFX/*/*/STMTRS/LEDGERBAL"],
+            "exclude": ["OFX/*/*/TRNUID"],
+        }
+        expected = self._parse(self.body, **kwargs)
+        for i in range(len(self.body)):
+            with self.subTest(i=i):
+                self.assertEqual(
+                    self._parse(self.body[:i], self.body[i:], **kwargs), expected
+                )
+
+    def test_feed_buffer(self):
+        kwargs = {"include": ["OFX/*/*/STMTRS/LEDGERBAL"]}
+        builder = TreeBuilder(**kwargs)
+        builder.feed_buffer(self.body.encode("ascii"))
+        self.assertEqual(
+            tostring(builder.close()).decode(), self._parse(self.body, **kwargs)
+        )
+
+    def test_missing_end_tag(self):
+        builder = TreeBuilder(include=["OFX/SIGNONMSGSRSV1"])
+        builder.feed("<OFX><BANKMSGSRSV1><STMTTRNRS></OFX>")
+        with self.assertRaises(ParseError):
+            builder.close()
+
+    def test_paths_not_str(self):
+        with self.assertRaises(ValueError):
+            TreeBuilder(include="OFX/SIGNONMSGSRSV1")
+
+
 class OFXTreeTestCase(TestCase):
     def setUp(self):
         self.tree = OFXTree()
@@ -511,6 +736,106 @@ class OFXTreeTestCase(TestCase):
         #  mockTreeBuilderInstance.close.assert_called_once()
         self.assertEqual(self.tree._root, sentinel.root)
 
+    def test_parse_chunksize(self):
+        for filename in ("stmtrs.ofx", "invstmtrs.ofx", "profrs.ofx"):
+            with self.subTest(filename=filename):
+                path = os.path.join(DATADIR, filename)
+                root = OFXTree().parse(path, parser=TreeBuilder())
+                for chunksize in (1, 13, 4096):
+                    tree = OFXTree()
+                    root_ = tree.parse(path, chunksize=chunksize)
+                    self.assertIsInstance(tree.header, OFXHeaderV2)
+                    self.assertEqual(tostring(root_), tostring(root))
+
+    def test_parse_memory_map(self):
+        sgml = re.compile(rb"(?<=[^>\s])</[A-Z0-9.]+>")
+        for filename in ("stmtrs.ofx", "invstmtrs.ofx", "profrs.ofx"):
+            path = os.path.join(DATADIR, filename)
+            with open(path, "rb") as f:
+                v2markup = f.read()
+            body = v2markup[v2markup.index(b"?>", v2markup.index(b"<?OFX")) + 2 :]
+            v1header = str(OFXHeaderV1(102)).encode("ascii")
+
+            for version, markup in (
+                (2, v2markup),
+                (1, v1header + sgml.sub(b"", body)),
+            ):
+                with self.subTest(filename=filename, version=version):
+                    with NamedTemporaryFile() as f:
+                        f.write(markup)
+                        f.flush()
+                        root = OFXTree().parse(BytesIO(markup))
+                        for parser in (None, TreeBuilder()):
+                            tree = OFXTree()
+                            root_ = tree.parse(f.name, parser=parser, memory_map=True)
+                            self.assertEqual(tree.header.version // 100, version)
+                            self.assertEqual(tostring(root_), tostring(root))
+
+                        # File object is parsed from its current position
+                        f.seek(0)
+                        f.write(b"junk")
+                        f.write(markup)
+                        f.flush()
+                        f.seek(4)
+                        root_ = OFXTree().parse(f, memory_map=True)
+                        self.assertEqual(tostring(root_), tostring(root))
+
+    def test_parse_memory_map_unmappable(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        root = OFXTree().parse(path)
+        with open(path, "rb") as f:
+            source = BytesIO(f.read())
+        self.assertEqual(
+            tostring(OFXTree().parse(source, memory_map=True)), tostring(root)
+        )
+
+        with NamedTemporaryFile() as f:
+            with self.assertRaises(OFXHeaderError):
+                OFXTree().parse(f.name, memory_map=True)
+
+    def test_parse_memory_map_chunksize(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        with self.assertRaises(ValueError):
+            self.tree.parse(path, chunksize=4096, memory_map=True)
+
+    def test_parse_include(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        include = ["OFX/SIGNONMSGSRSV1", "OFX/SECLISTMSGSRSV1"]
+        root = self.tree.parse(path, include=include)
+        self.assertEqual(
+            [elem.tag for elem in root], ["SIGNONMSGSRSV1", "SECLISTMSGSRSV1"]
+        )
+        for kwargs in ({"chunksize": 13}, {"memory_map": True}):
+            with self.subTest(**kwargs):
+                root_ = OFXTree().parse(path, include=include, **kwargs)
+                self.assertEqual(tostring(root_), tostring(root))
+
+        ofx = self.tree.convert(validate=False)
+        self.assertEqual(ofx.signonmsgsrsv1.sonrs.org, "NCH")
+        self.assertEqual(len(ofx.securities), 3)
+        self.assertIsNone(ofx.invstmtmsgsrsv1)
+
+    def test_parse_include_repr(self):
+        # Converted without SIGNONMSGSRSV1
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        self.tree.parse(path, include=["OFX/*/*/INVSTMTRS/INVBAL"])
+        ofx = self.tree.convert(validate=False)
+        self.assertIsNone(ofx.signonmsgsrsv1)
+        self.assertEqual(repr(ofx), "<OFX len(statements)=1 len(securities)=0>")
+
+    def test_parse_exclude(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        root = self.tree.parse(path, exclude=["OFX/*/*/INVSTMTRS/INVTRANLIST"])
+        self.assertIsNone(root.find(".//INVTRANLIST"))
+        self.assertIsNotNone(root.find(".//INVPOSLIST"))
+
+    def test_parse_include_bad_args(self):
+        path = os.path.join(DATADIR, "invstmtrs.ofx")
+        with self.assertRaises(ValueError):
+            self.tree.parse(path, parser=TreeBuilder(), include=["OFX"])
+        with self.assertRaises(ValueError):
+            self.tree.parse(path, cache=MagicMock(), exclude=["OFX/SIGNONMSGSRSV1"])
+
     def test_read_filename(self):
         with patch("builtins.open") as fake_open:
             with patch("ofxtools.Parser.parse_header") as fake_parse_header:
@@ -568,6 +893,22 @@ class OFXTreeTestCase(TestCase):
             fake_parse_header.assert_called_once_with(source)
             self.assertEqual(output, (fake_header, fake_body))
 
+    def test_parse_unseekable(self):
+        # Source needn't be seekable, e.g. an HTTP response
+        class Unseekable:
+            def __init__(self, data):
+                self.read = BytesIO(data).read
+
+        for filename in ("stmtrs.ofx", "invstmtrs.ofx", "profrs.ofx"):
+            with self.subTest(filename=filename):
+                path = os.path.join(DATADIR, filename)
+                root = OFXTree().parse(path)
+                with open(path, "rb") as f:
+                    source = Unseekable(f.read())
+                tree = OFXTree()
+                self.assertEqual(tostring(tree.parse(source)), tostring(root))
+                self.assertIsInstance(tree.header, OFXHeaderV2)
+
     def test_read_illegal(self):
         source = "a bunch of text"
         with self.assertRaises(FileNotFoundError):
@@ -580,7 +921,29 @@ class OFXTreeTestCase(TestCase):
         # OFXTree.convert() returns an OFX instance constructed from its root
         with patch("ofxtools.Parser.Aggregate") as MockAggregate:
             ofx = self.tree.convert()
-            MockAggregate.from_etree.assert_called_once_with(self.tree._root)
+            MockAggregate.from_etree.assert_called_once_with(
+                self.tree._root, validate=True
+            )
+            self.assertEqual(ofx, MockAggregate.from_etree())
+
+    def test_convert_lazy(self):
+        self.tree._root = Element("FAKE")
+
+        with patch("ofxtools.Parser.Aggregate") as MockAggregate:
+            ofx = self.tree.convert(lazy=True)
+            MockAggregate.from_etree.assert_called_once_with(
+                self.tree._root, lazy=True, validate=True
+            )
+            self.assertEqual(ofx, MockAggregate.from_etree())
+
+    def test_convert_unvalidated(self):
+        self.tree._root = Element("FAKE")
+
+        with patch("ofxtools.Parser.Aggregate") as MockAggregate:
+            ofx = self.tree.convert(validate=False)
+            MockAggregate.from_etree.assert_called_once_with(
+                self.tree._root, validate=False
+            )
             self.assertEqual(ofx, MockAggregate.from_etree())
 
     def test_convert_unparsed(self):
@@ -590,5 +953,293 @@ class OFXTreeTestCase(TestCase):
             self.tree.convert()
 
 
+class OFXTreeXmlTestCase(TestCase):
+    """Unit tests for the expat fast path for OFXv2"""
+
+    header = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\r\n'
+        '<?OFX OFXHEADER="200" VERSION="200" SECURITY="NONE" '
+        'OLDFILEUID="NONE" NEWFILEUID="NONE"?>\r\n'
+    )
+
+    def _regex_root(self, message):
+        builder = TreeBuilder()
+        builder.feed(message)
+        return builder.close()
+
+    def test_parse_xml_matches_treebuilder(self):
+        for filename in ("stmtrs.ofx", "invstmtrs.ofx", "profrs.ofx"):
+            with self.subTest(filename=filename):
+                header, message = OFXTree._read(os.path.join(DATADIR, filename))
+                self.assertIsInstance(header, OFXHeaderV2)
+                root = OFXTree._parse_xml(message)
+                self.assertIsNotNone(root)
+                self.assertEqual(tostring(root), tostring(self._regex_root(message)))
+
+    def test_parse_xml_sgml(self):
+        # Unclosed elements aren't well-formed XML
+        message = "<OFX><SIGNONMSGSRSV1><SONRS><DTSERVER>20051029101003</SONRS>"
+        self.assertIsNone(OFXTree._parse_xml(message))
+
+    def test_parse_xml_cdata(self):
+        message = "<MAIL><MSGBODY><![CDATA[ <HTML>hi</HTML> ]]></MSGBODY></MAIL>"
+        self.assertIsNone(OFXTree._parse_xml(message))
+
+    def test_parse_xml_entities(self):
+        # Text is left escaped, as by TreeBuilder
+        message = "<FOO><BAR>AT&amp;amp;T &lt;x&gt;</BAR><BAZ>baz</BAZ></FOO>"
+        for msg in (message, message.encode()):
+            root = OFXTree._parse_xml(msg)
+            self.assertEqual(root[0].text, "AT&amp;amp;T &lt;x&gt;")
+            self.assertEqual(root[1].text, "baz")
+
+        # Character references are left to TreeBuilder
+        message = "<FOO><BAR>AT&#38;T</BAR></FOO>"
+        self.assertIsNone(OFXTree._parse_xml(message))
+        self.assertIsNone(OFXTree._parse_xml(message.encode()))
+
+    def test_parse_entities(self):
+        # Expat fast path & TreeBuilder agree on text containing entities
+        with open(os.path.join(DATADIR, "invstmtrs.ofx"), "rb") as f:
+            markup = f.read().replace(
+                b"Option is in the money", b"AT&amp;amp;T &lt;x&gt;"
+            )
+        header, message = OFXTree._read(BytesIO(markup))
+        self.assertIsNotNone(OFXTree._parse_xml(message))
+        expected = tostring(self._regex_root(message))
+        memo = "AT&amp;T <x>"
+
+        tree = OFXTree()
+        self.assertEqual(tostring(tree.parse(BytesIO(markup))), expected)
+        memos = [pos.memo for pos in tree.convert().statements[0].invposlist]
+        self.assertIn(memo, memos)
+        ofx = OFXTree().parse_models(BytesIO(markup))
+        self.assertEqual([pos.memo for pos in ofx.statements[0].invposlist], memos)
+        with NamedTemporaryFile() as f:
+            f.write(markup)
+            f.flush()
+            root = OFXTree().parse(f.name, memory_map=True)
+        self.assertEqual(tostring(root), expected)
+
+    def test_parse_xml_tail(self):
+        self.assertIsNone(OFXTree._parse_xml("<FOO><BAR>bar</BAR>illegal</FOO>"))
+
+    def test_parse_xml_mixed(self):
+        self.assertIsNone(OFXTree._parse_xml("<FOO>illegal<BAR>bar</BAR></FOO>"))
+
+    def test_parse_xml_attrib(self):
+        self.assertIsNone(OFXTree._parse_xml('<FOO BAR="illegal"></FOO>'))
+
+    def test_parse_fallback(self):
+        # OFXv2 header on top of SGML body
+        markup = self.header + "<OFX><FOO><BAR>bar</FOO></OFX>"
+        tree = OFXTree()
+        root = tree.parse(BytesIO(markup.encode()))
+        self.assertEqual(root.tag, "OFX")
+        foo = root[0]
+        self.assertEqual(foo.tag, "FOO")
+        self.assertEqual(foo[0].tag, "BAR")
+        self.assertEqual(foo[0].text, "bar")
+
+    def test_parse_fallback_error(self):
+        # TreeBuilder still reports the errors
+        markup = self.header + "<OFX><FOO>bar</FOO>illegal</OFX>"
+        with self.assertRaises(ParseError):
+            OFXTree().parse(BytesIO(markup.encode()))
+
+
+class IterparseTestCase(TestCase):
+    """Unit tests for OFXTree.iterparse()"""
+
+    path = os.path.join(DATADIR, "invstmtrs.ofx")
+
+    def test_iterparse(self):
+        ofx = OFXTree()
+        ofx.parse(self.path)
+        expected = ofx.convert().statements[0].invtranlist
+
+        tree = OFXTree()
+        results = list(tree.iterparse(self.path, tags=("BUYSTOCK", "STMTTRN")))
+        self.assertIsInstance(tree.header, OFXHeaderV2)
+        self.assertEqual(len(results), 2)
+        buystock, stmttrn = results
+        self.assertIsInstance(buystock, BUYSTOCK)
+        self.assertEqual(repr(buystock), repr(expected[0]))
+        self.assertIsInstance(stmttrn, STMTTRN)
+        self.assertEqual(repr(stmttrn), repr(expected[1].stmttrn))
+
+        # Converted Elements are pruned from the tree
+        self.assertIsNone(tree.find(".//BUYSTOCK"))
+        self.assertIsNone(tree.find(".//STMTTRN"))
+        self.assertIsNotNone(tree.find(".//INVBANKTRAN"))
+        self.assertIsNotNone(tree.find(".//SECLIST"))
+
+    def test_iterparse_nested(self):
+        # Nested tags are pruned along with their containing Element
+        tree = OFXTree()
+        results = list(tree.iterparse(self.path, tags=("INVBUY", "BUYSTOCK")))
+        self.assertEqual(len(results), 2)
+        invbuy, buystock = results
+        self.assertIsInstance(invbuy, INVBUY)
+        self.assertIsInstance(buystock, BUYSTOCK)
+        self.assertEqual(repr(buystock.invbuy), repr(invbuy))
+        self.assertIsNone(tree.find(".//BUYSTOCK"))
+
+    def test_iterparse_unconverted(self):
+        tree = OFXTree()
+        results = list(
+            tree.iterparse(self.path, tags=("CURDEF", "BUYSTOCK"), convert=False)
+        )
+        self.assertEqual([elem.tag for elem in results], ["CURDEF", "BUYSTOCK"])
+        curdef, buystock = results
+        self.assertEqual(curdef.text, "USD")
+        self.assertIsNotNone(buystock.find("./INVBUY/INVTRAN/FITID"))
+        # Elements are pruned from the tree all the same
+        self.assertIsNone(tree.find(".//CURDEF"))
+        self.assertIsNone(tree.find(".//BUYSTOCK"))
+
+    def test_iterparse_chunksize(self):
+        results = OFXTree().iterparse(self.path, tags=("SECID",), chunksize=7)
+        self.assertEqual(len(list(results)), 8)
+
+    def test_iterbuilder_events(self):
+        builder = IterBuilder(["bar"])
+        builder.feed("<FOO><BAR><BAZ>1</BAR><BAR><BAZ>2</BAR>")
+        # Last BAR isn't known to be complete until close()
+        self.assertEqual(len(builder.events), 1)
+        root = builder.close()
+        self.assertEqual([e[0].text for e in builder.events], ["1", "2"])
+        self.assertEqual(len(root), 0)
+
+
+class ModelBuilderTestCase(TestCase):
+    """Unit tests for ModelBuilder & OFXTree.parse_models()"""
+
+    path = os.path.join(DATADIR, "invstmtrs.ofx")
+
+    def build(self, markup):
+        builder = ModelBuilder()
+        builder.feed(markup)
+        return builder.close()
+
+    def test_parse_models(self):
+        tree = OFXTree()
+        tree.parse(self.path)
+        expected = tree.convert()
+
+        tree = OFXTree()
+        ofx = tree.parse_models(self.path)
+        self.assertIsInstance(tree.header, OFXHeaderV2)
+        self.assertEqual(repr(ofx), repr(expected))
+        self.assertEqual(tostring(ofx.to_etree()), tostring(expected.to_etree()))
+
+    def test_parse_models_unvalidated(self):
+        tree = OFXTree()
+        tree.parse(self.path)
+        expected = tree.convert()
+
+        ofx = OFXTree().parse_models(self.path, validate=False)
+        self.assertEqual(tostring(ofx.to_etree()), tostring(expected.to_etree()))
+        ofx = OFXTree().parse_models(self.path, chunksize=64, validate=False)
+        self.assertEqual(tostring(ofx.to_etree()), tostring(expected.to_etree()))
+
+    def test_parse_models_sgml(self):
+        with open(self.path, "rb") as f:
+            markup = f.read().decode()
+        header, body = markup.split("\n\n", 1)
+        # Drop closing tags of data-bearing elements
+        body = re.sub(r"(?<=[^>\s])</[A-Z0-9.]+>", "", body)
+        self.assertNotIn("</DTSERVER>", body)
+        header = OFXHeaderV1(version=102)
+        source = BytesIO((str(header) + body).encode())
+
+        tree = OFXTree()
+        tree.parse(self.path)
+        expected = tree.convert()
+
+        self.assertEqual(repr(OFXTree().parse_models(source)), repr(expected))
+        source.seek(0)
+        self.assertEqual(
+            repr(OFXTree().parse_models(source, chunksize=7)), repr(expected)
+        )
+
+    def test_leaf(self):
+        status = self.build("<STATUS><CODE>0<SEVERITY>INFO</STATUS>")
+        self.assertIsInstance(status, STATUS)
+        self.assertEqual(status.code, 0)
+        self.assertEqual(status.severity, "INFO")
+        self.assertIsNone(status.message)
+
+    def test_empty_aggregate(self):
+        msgs = self.build("<SECLISTMSGSRSV1><SECLIST></SECLIST></SECLISTMSGSRSV1>")
+        self.assertIsInstance(msgs, SECLISTMSGSRSV1)
+        self.assertEqual(len(msgs), 1)
+        self.assertIsInstance(msgs[0], SECLIST)
+        self.assertEqual(len(msgs[0]), 0)
+
+    def test_unclosed(self):
+        # Like ET.TreeBuilder, close() ends any Elements left open
+        status = self.build("<STATUS><CODE>0<SEVERITY>INFO")
+        self.assertIsInstance(status, STATUS)
+        self.assertEqual(status.severity, "INFO")
+
+    def test_unknown_tag(self):
+        markup = "<STATUS><CODE>0<FOO><BAR>1</FOO><SEVERITY>INFO</STATUS>"
+        with self.assertWarns(UnknownTagWarning):
+            status = self.build(markup)
+        self.assertEqual(status.severity, "INFO")
+
+    def test_extended_tag(self):
+        markup = "<STATUS><CODE>0<INTU.FOO><BAR>1</INTU.FOO><SEVERITY>INFO</STATUS>"
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            status = self.build(markup)
+        self.assertEqual(status.severity, "INFO")
+
+    def test_out_of_order(self):
+        with self.assertRaises(OFXSpecError):
+            self.build("<STATUS><SEVERITY>INFO<CODE>0</STATUS>")
+
+    def test_duplicate(self):
+        with self.assertRaises(OFXSpecError):
+            self.build("<STATUS><CODE>0<CODE>0<SEVERITY>INFO</STATUS>")
+
+    def test_unknown_aggregate(self):
+        with self.assertRaises(OFXSpecError):
+            self.build("<NOTAREALOFXTAG><CODE>0</NOTAREALOFXTAG>")
+
+    def test_invalid_element(self):
+        with self.assertRaises(ValueError):
+            self.build("<STATUS><CODE>0<SEVERITY>NOTASEVERITY</STATUS>")
+
+    def test_empty(self):
+        with self.assertRaises(ParseError):
+            self.build("")
+
+    def test_include(self):
+        # Shares TreeBuilder's tokenizer, without being a TreeBuilder
+        self.assertNotIsInstance(ModelBuilder(), TreeBuilder)
+        builder = ModelBuilder(include=["SONRS/DTSERVER"], validate=False)
+        builder.feed("<SONRS><STATUS><CODE>0</STATUS><DTSERVER>20200101</SONRS>")
+        sonrs = builder.close()
+        self.assertIsNone(sonrs.status)
+        self.assertEqual(sonrs.dtserver.year, 2020)
+
+    def test_unvalidated(self):
+        # Missing required SEVERITY & LANGUAGE
+        markup = "<SONRS><STATUS><CODE>0</STATUS><DTSERVER>20200101</SONRS>"
+        with self.assertRaises(ValueError):
+            self.build(markup)
+
+        builder = ModelBuilder(validate=False)
+        builder.feed(markup)
+        sonrs = builder.close()
+        self.assertIsInstance(sonrs.status, STATUS)
+        self.assertEqual(sonrs.status.code, 0)
+        self.assertIsNone(sonrs.status.severity)
+        self.assertEqual(sonrs.dtserver.year, 2020)
+        self.assertIsNone(sonrs.language)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,7 @@ import unittest
 import decimal
 import datetime
 import warnings
-from typing import Optional
+from typing import Optional, Sequence
 
 
 # local imports
@@ -37,6 +37,25 @@ class ElementTestCase(unittest.TestCase):
         rep = repr(instance)
         self.assertEqual(rep, "<Element required=True>")
 
+    def testSet(self):
+        class Test:
+            data = ofxtools.Types.String(3, required=True)
+
+        # str is converted by the function compiled when bound to the class
+        instance = Test()
+        instance.data = "a&amp;b"
+        self.assertEqual(instance.data, "a&b")
+        with self.assertRaises(OFXSpecError):
+            instance.data = "abcd"
+        with self.assertRaises(OFXSpecError):
+            instance.data = ""
+
+        # Other types are dispatched by convert()
+        with self.assertRaises(OFXSpecError):
+            instance.data = None
+        with self.assertRaises(TypeError):
+            instance.data = 123
+
 
 class Base:
     """Common tests for Element subclasses"""
@@ -52,8 +71,32 @@ class Base:
         # If not required, missing value (i.e. None) returns None
         self.assertEqual(t.convert(None), None)
 
+    #  Text (valid or not) for test_compile_str()
+    strings: Sequence[str] = ()
+
+    @property
+    def converters(self):
+        return [self.type_(required=True), self.type_(required=False)]
+
+    def test_compile_str(self):
+        # ``_compile_str()`` agrees with ``convert()``, errors and all
+        for t in self.converters:
+            convert_str = t._compile_str()
+            for value in self.strings:
+                with self.subTest(converter=t, value=value), warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    try:
+                        expected = t.convert(value)
+                    except Exception as exc:
+                        with self.assertRaises(type(exc)) as cm:
+                            convert_str(value)
+                        self.assertEqual(str(cm.exception), str(exc))
+                    else:
+                        self.assertEqual(convert_str(value), expected)
+
 
 class BoolTestCase(unittest.TestCase, Base):
+    strings = ("Y", "N", "", "T", "y")
     type_ = ofxtools.Types.Bool
 
     def test_convert(self):
@@ -113,6 +156,15 @@ class BoolTestCase(unittest.TestCase, Base):
 
 class StringTestCase(unittest.TestCase, Base):
     type_ = ofxtools.Types.String
+    strings = ("", "abc", "abcdefgh", "a&amp;b&nbsp;c", "&lt;abcdef&gt;", "&bogus;")
+
+    @property
+    def converters(self):
+        return [
+            self.type_(required=True),
+            self.type_(5, required=True),
+            self.type_(5, required=False),
+        ]
 
     def test_convert(self):
         t = self.type_()
@@ -240,6 +292,11 @@ class NagstringTestCase(StringTestCase):
 
 class OneOfTestCase(unittest.TestCase, Base):
     type_ = ofxtools.Types.OneOf
+    strings = ("", "A", "B", "C", "a")
+
+    @property
+    def converters(self):
+        return [self.type_("A", "B", required=True), self.type_("A", "B")]
 
     def test_convert(self):
         t = self.type_("1", "2")
@@ -251,6 +308,26 @@ class OneOfTestCase(unittest.TestCase, Base):
         with self.assertRaises(OFXSpecError):
             t.convert(1)
 
+    def test_validset(self):
+        # Membership is tested against a hashed set shared by equal code lists,
+        # while ``valid`` keeps its order for messages & repr
+        t = self.type_("B", "A", "C")
+        self.assertEqual(t.valid, ("B", "A", "C"))
+        self.assertEqual(t.validset, frozenset(("A", "B", "C")))
+        self.assertIs(self.type_("B", "A", "C", required=True).validset, t.validset)
+        self.assertIsNot(self.type_("A", "B", "C").validset, t.validset)
+        self.assertEqual(repr(t), "<OneOf valid=('B', 'A', 'C') required=False>")
+        with self.assertRaises(OFXSpecError) as cm:
+            t.convert("D")
+        self.assertEqual(str(cm.exception), "'D' is not OneOf ('B', 'A', 'C')")
+
+        # Unhashable values are just invalid
+        self.assertFalse(t.is_valid(["A"]))
+        with self.assertRaises(OFXSpecError):
+            t.convert(["A"])
+        with self.assertRaises(OFXSpecError):
+            t.unconvert(["A"])
+
     def test_unconvert(self):
         t = self.type_("1", "2")
         # Pass enum
@@ -283,6 +360,11 @@ class OneOfTestCase(unittest.TestCase, Base):
 
 class IntegerTestCase(unittest.TestCase, Base):
     type_ = ofxtools.Types.Integer
+    strings = ("", "12", "999", "1000", "-5", "1.5", "abc")
+
+    @property
+    def converters(self):
+        return [self.type_(required=True), self.type_(3), self.type_(3, required=True)]
 
     def test_convert(self):
         t = self.type_()
@@ -338,6 +420,11 @@ class IntegerTestCase(unittest.TestCase, Base):
 
 class DecimalTestCase(unittest.TestCase, Base):
     type_ = ofxtools.Types.Decimal
+    strings = ("", "12", "1.234", "1,5", "-0.5", "abc")
+
+    @property
+    def converters(self):
+        return [self.type_(required=True), self.type_(2)]
 
     def test_convert(self):
         t = self.type_()
@@ -434,6 +521,14 @@ NST = TestingTimezone("NST", datetime.timedelta(hours=-3.5))
 
 class DateTimeTestCase(unittest.TestCase, Base):
     type_ = ofxtools.Types.DateTime
+    strings = (
+        "",
+        "20111117",
+        "20111117033045.150[-6:CST]",
+        "20111117033045[-6]",
+        "20111117033045.150[-:GMT]",
+        "garbage",
+    )
 
     def test_convert(self):
         t = self.type_()
@@ -540,9 +635,128 @@ class DateTimeTestCase(unittest.TestCase, Base):
         result = original
         self.assertEqual(t.convert(t.unconvert(original)), result)
 
+    def test_parse_fixed(self):
+        # Fast path decodes the formats given by the spec...
+        t = self.type_()
+        check = datetime.datetime(2011, 11, 17, tzinfo=UTC)
+        self.assertEqual(t._parse_fixed("20111117"), check)
+        check = datetime.datetime(2011, 11, 17, 3, 30, 45, tzinfo=UTC)
+        self.assertEqual(t._parse_fixed("20111117033045"), check)
+        check = datetime.datetime(2011, 11, 17, 3, 30, 45, 150000, tzinfo=UTC)
+        self.assertEqual(t._parse_fixed("20111117033045.150"), check)
+        check = datetime.datetime(2011, 11, 17, 9, 30, 45, 150000, tzinfo=UTC)
+        self.assertEqual(t._parse_fixed("20111117033045.150[-6:CST]"), check)
+        self.assertEqual(t._parse_fixed("20111117033045.150[-6]"), check)
+        check = datetime.datetime(2011, 11, 16, 22, 0, 45, 150000, tzinfo=UTC)
+        self.assertEqual(t._parse_fixed("20111117033045.150[+5.30:IST]"), check)
+
+        # ...and leaves everything else to the regex
+        for text in (
+            "20111117033045[-6]",
+            "20111117033045.150[-:CST]",
+            "20111117033045.150[-6:30]",
+            "201111170330",
+            "20111317",
+            "20111117243045",
+            "2011111A",
+            "20111117033045.15",
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(t._parse_fixed(text))
+
+    def test_convert_cached(self):
+        t = self.type_()
+        cache = self.type_.cache
+        cache.clear()
+        dt = t.convert("20111117033045.150[-6:CST]")
+        self.assertEqual(cache.info(), (0, 1, cache.maxsize, 1))
+        # Same text, same datetime - for any instance
+        t2 = self.type_(required=True)
+        self.assertIs(t2.convert("20111117033045.150[-6:CST]"), dt)
+        self.assertEqual(cache.info(), (1, 1, cache.maxsize, 1))
+
+        # Errors aren't cached
+        for i in range(2):
+            with self.assertRaises(ValueError):
+                t.convert("20111117033045.150[-:GMT]")
+        self.assertEqual(cache.info(), (1, 3, cache.maxsize, 1))
+
+        # Time conversions are cached separately
+        tm = ofxtools.Types.Time().convert("033045")
+        self.assertEqual(tm, datetime.time(3, 30, 45, tzinfo=UTC))
+        self.assertEqual(cache.info(), (1, 4, cache.maxsize, 2))
+        cache.clear()
+
+    def test_convert_uncached(self):
+        t = self.type_()
+        cache = self.type_.cache
+        maxsize = cache.maxsize
+        cache.clear()
+        try:
+            cache.maxsize = 0
+            dt = t.convert("20111117033045.150[-6:CST]")
+            self.assertEqual(t.convert("20111117033045.150[-6:CST]"), dt)
+            self.assertEqual(cache.info(), (0, 2, 0, 0))
+        finally:
+            cache.maxsize = maxsize
+            cache.clear()
+
+
+class ConversionCacheTestCase(unittest.TestCase):
+    def test_lookup(self):
+        cache = ofxtools.Types.ConversionCache(maxsize=2)
+        self.assertEqual(cache.lookup("a", str.upper, "a"), "A")
+        self.assertEqual(cache.lookup("b", str.upper, "b"), "B")
+        # Cached values are returned without calling func
+        self.assertEqual(cache.lookup("a", str.upper, "z"), "A")
+        self.assertEqual(cache.info(), (1, 2, 2, 2))
+
+    def test_evict(self):
+        # Least recently used entry is evicted first
+        cache = ofxtools.Types.ConversionCache(maxsize=2)
+        cache.lookup("a", str.upper, "a")
+        cache.lookup("b", str.upper, "b")
+        cache.lookup("a", str.upper, "a")
+        cache.lookup("c", str.upper, "c")
+        self.assertEqual(cache.lookup("a", str.upper, "z"), "A")
+        self.assertEqual(cache.lookup("b", str.upper, "z"), "Z")
+        self.assertEqual(cache.info(), (2, 4, 2, 2))
+
+    def test_maxsize(self):
+        cache = ofxtools.Types.ConversionCache(maxsize=3)
+        for key in "abc":
+            cache.lookup(key, str.upper, key)
+        cache.maxsize = 1
+        self.assertEqual(cache.info(), (0, 3, 1, 1))
+        self.assertEqual(cache.lookup("c", str.upper, "z"), "C")
+
+        with self.assertRaises(ValueError):
+            cache.maxsize = -1
+
+    def test_clear(self):
+        cache = ofxtools.Types.ConversionCache()
+        cache.lookup("a", str.upper, "a")
+        cache.lookup("a", str.upper, "a")
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 4096, 0))
+
 
 class TimeTestCase(unittest.TestCase, Base):
     type_ = ofxtools.Types.Time
+    strings = ("", "033045", "033045.150[-6:CST]", "garbage")
+
+    def test_parse_fixed(self):
+        t = self.type_()
+        check = datetime.time(3, 30, 45, tzinfo=UTC)
+        self.assertEqual(t._parse_fixed("033045"), check)
+        check = datetime.time(3, 30, 45, 150000, tzinfo=UTC)
+        self.assertEqual(t._parse_fixed("033045.150"), check)
+        check = datetime.time(9, 30, 45, 150000, tzinfo=UTC)
+        self.assertEqual(t._parse_fixed("033045.150[-6:CST]"), check)
+
+        for text in ("033045[-6]", "033045.150[-:CST]", "0330", "243045"):
+            with self.subTest(text=text):
+                self.assertIsNone(t._parse_fixed(text))
 
     def test_convert(self):
         t = self.type_()